@@ -0,0 +1,104 @@
+"""
+Benchmark do batch scoring offline (src/services/batch_scoring.py).
+
+Gera um CSV sintético no formato do Kaggle e mede linhas/s de score_csv com
+1, 2 e 4 workers (pool com fork que compartilha o modelo já carregado).
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_batch_score [--rows 1000000] [--workers 1 2 4] \\
+        [--chunk-size 10000] [--method joblib]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import warnings
+from time import perf_counter
+
+import numpy as np
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from src.services.batch_scoring import DEFAULT_CHUNK_SIZE, score_csv
+from src.services.predict_service import PredictionService
+
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+
+def write_synthetic_csv(path: str, rows: int, seed: int = 42, block: int = 100_000) -> None:
+    """Escreve `rows` passageiros sintéticos (com Age/Fare/Embarked ausentes às vezes)."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["PassengerId", "Pclass", "Name", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]
+        )
+        for start in range(0, rows, block):
+            n = min(block, rows - start)
+            ages = np.round(rng.uniform(0, 80, n), 1).astype(str)
+            ages[rng.random(n) < 0.2] = ""
+            fares = np.round(rng.uniform(0, 250, n), 2).astype(str)
+            fares[rng.random(n) < 0.01] = ""
+            embarked = rng.choice(["S", "C", "Q", ""], n, p=[0.7, 0.19, 0.09, 0.02])
+            writer.writerows(
+                zip(
+                    range(start + 1, start + n + 1),
+                    rng.integers(1, 4, n),
+                    ("Passageiro" for _ in range(n)),
+                    rng.choice(["male", "female"], n),
+                    ages,
+                    rng.integers(0, 6, n),
+                    rng.integers(0, 5, n),
+                    fares,
+                    embarked,
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--method", default="joblib", choices=["joblib", "pickle", "compiled"])
+    args = parser.parse_args()
+
+    service = PredictionService("model", method=args.method)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "entrada.csv")
+        start = perf_counter()
+        write_synthetic_csv(input_path, args.rows)
+        print(
+            f"CSV sintético: {args.rows} linhas, "
+            f"{os.path.getsize(input_path) / 2**20:.1f} MB ({perf_counter() - start:.1f} s)"
+        )
+        print(f"CPUs disponíveis: {len(os.sched_getaffinity(0))}\n")
+
+        print(f"{'workers':>7} | {'linhas':>9} | {'tempo (s)':>9} | {'linhas/s':>10} | {'speedup':>7}")
+        print("-" * 56)
+        baseline = None
+        for workers in args.workers:
+            output_path = os.path.join(tmp, f"saida_{workers}.csv")
+            with open(input_path, newline="") as input_file, open(
+                output_path, "w", newline=""
+            ) as output_file:
+                start = perf_counter()
+                total = score_csv(
+                    input_file,
+                    output_file,
+                    service,
+                    chunk_size=args.chunk_size,
+                    workers=workers,
+                )
+                elapsed = perf_counter() - start
+            rate = total / elapsed
+            baseline = baseline or rate
+            print(
+                f"{workers:>7} | {total:>9} | {elapsed:>9.2f} | {rate:>10,.0f} | "
+                f"{rate / baseline:>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
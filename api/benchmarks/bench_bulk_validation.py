@@ -0,0 +1,102 @@
+"""
+Benchmark da validação de corpos de POST em lote.
+
+Compara o caminho anterior (json.loads + PassengerRequest(**item) por item)
+com parse_passengers (TypeAdapter.validate_json direto do corpo bruto), para
+corpos válidos e para corpos com itens inválidos.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_bulk_validation [--sizes 1000 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+from time import perf_counter
+
+from pydantic import ValidationError
+
+from src.models.passenger_request import PassengerRequest, parse_passengers
+
+
+def make_body(n: int, invalid_every: int = 0, seed: int = 42) -> str:
+    """Gera um corpo JSON com n passageiros (um inválido a cada `invalid_every`)."""
+    rng = random.Random(seed)
+    items = [
+        {
+            "PassengerId": str(i),
+            "Pclass": rng.choice([1, 2, 3]),
+            "Sex": rng.choice(["male", "female"]),
+            "Age": round(rng.uniform(0, 80), 1),
+            "SibSp": rng.randint(0, 5),
+            "Parch": rng.randint(0, 4),
+            "Fare": round(rng.uniform(0, 250), 2),
+            "Embarked": rng.choice(["S", "C", "Q", None]),
+        }
+        for i in range(n)
+    ]
+    if invalid_every:
+        for item in items[::invalid_every]:
+            item["Age"] = -1
+    return json.dumps(items)
+
+
+def per_item_validation(body: str):
+    """Caminho anterior: decodifica o JSON e valida item a item."""
+    return [PassengerRequest(**data) for data in json.loads(body)]
+
+
+def count_errors(fn, body) -> int:
+    """Executa a validação e retorna quantos erros foram reportados."""
+    try:
+        fn(body)
+    except ValidationError as e:
+        return e.error_count()
+    return 0
+
+
+def best_of(fn, repeat: int) -> float:
+    """Retorna o menor tempo (s) entre `repeat` execuções."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        try:
+            fn()
+        except ValidationError:
+            pass
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'itens':>6} | {'corpo':>8} | {'por item (ms)':>13} | "
+        f"{'adapter (ms)':>12} | {'speedup':>7} | {'erros (item/adapter)':>20}"
+    )
+    print("-" * 84)
+    for size in args.sizes:
+        for label, invalid_every in (("válido", 0), ("inválido", 100)):
+            body = make_body(size, invalid_every)
+            raw = body.encode("utf-8")
+
+            old_time = best_of(lambda: per_item_validation(body), args.repeat)
+            new_time = best_of(lambda: parse_passengers(raw), args.repeat)
+            errors = (
+                f"{count_errors(per_item_validation, body)}/"
+                f"{count_errors(parse_passengers, raw)}"
+            )
+
+            print(
+                f"{size:>6} | {label:>8} | {old_time * 1000:>13.2f} | "
+                f"{new_time * 1000:>12.2f} | {old_time / new_time:>6.1f}x | "
+                f"{errors:>20}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark da inclusão de passageiros: save() item a item vs save_many() em lotes.
+
+Para cada tamanho de lote, grava `--items` passageiros numa tabela moto vazia e
+mede a vazão (itens/s) e o número de chamadas ao DynamoDB. Os números absolutos
+do moto não representam a latência real da AWS, mas a redução de round trips é
+a mesma.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_bulk_write [--items 500] [--chunks 1 10 25 50 99]
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("DYNAMODB_TABLE_NAME", "bench-passengers")
+
+import boto3
+from moto import mock_aws
+
+from src.repository.passenger_repository import PassengerRepository
+
+
+def create_table():
+    """Cria a tabela de passageiros vazia."""
+    boto3.resource("dynamodb").create_table(
+        TableName=os.environ["DYNAMODB_TABLE_NAME"],
+        KeySchema=[{"AttributeName": "passenger_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "passenger_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def make_items(n_items: int):
+    return [
+        {"passenger_id": f"p-{i:07d}", "pclass": 3, "sex": "male", "age": 22}
+        for i in range(n_items)
+    ]
+
+
+class CallCounter:
+    """Envolve transact_write_items contando as chamadas."""
+
+    def __init__(self, client):
+        self._call = client.transact_write_items
+        self.calls = 0
+        client.transact_write_items = self
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        return self._call(**kwargs)
+
+
+def run(items, chunk_size=None):
+    """Grava os itens numa tabela nova e retorna (segundos, chamadas)."""
+    with mock_aws():
+        create_table()
+        repository = PassengerRepository()
+        repository.logger.disabled = True
+        counter = CallCounter(repository.dynamodb.meta.client)
+
+        start = perf_counter()
+        if chunk_size is None:
+            for item in items:
+                repository.save(item)
+        else:
+            outcomes = repository.save_many(items, chunk_size=chunk_size)
+            assert all(o["status"] == "created" for o in outcomes)
+        elapsed = perf_counter() - start
+
+        assert repository.count() == len(items)
+        return elapsed, counter.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1, 10, 25, 50, 99])
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+
+    print(f"{args.items} itens")
+    print(f"{'modo':>16} | {'segundos':>9} | {'itens/s':>9} | {'chamadas':>8}")
+    print("-" * 52)
+
+    elapsed, calls = run(items)
+    print(
+        f"{'save()':>16} | {elapsed:>9.3f} | {args.items / elapsed:>9.0f} | {calls:>8}"
+    )
+    for chunk_size in args.chunks:
+        elapsed, calls = run(items, chunk_size)
+        label = f"save_many({chunk_size})"
+        print(
+            f"{label:>16} | {elapsed:>9.3f} | {args.items / elapsed:>9.0f} | {calls:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
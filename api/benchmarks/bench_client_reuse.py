@@ -0,0 +1,111 @@
+"""
+Benchmark do reaproveitamento do cliente DynamoDB entre invocações.
+
+Sobe um servidor moto HTTP local (ThreadedMotoServer) e simula N invocações
+"quentes", cada uma criando um PassengerRepository e fazendo um GetItem:
+
+- novo: um boto3.resource por invocação (comportamento anterior);
+- compartilhado: o resource do provedor src.repository.dynamodb_client.
+
+Reporta a latência média por invocação e quantas conexões TCP foram abertas
+em cada modo (contadas nos pools do urllib3).
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_client_reuse [--invocations 200] [--port 5055]
+"""
+
+import argparse
+import logging
+import os
+from time import perf_counter
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("DYNAMODB_TABLE_NAME", "bench-passengers")
+
+import boto3
+from moto.server import ThreadedMotoServer
+
+from src.repository import dynamodb_client
+from src.repository.passenger_repository import PassengerRepository
+
+
+def count_connections(resource) -> int:
+    return sum(
+        pool.num_connections
+        for pool in dynamodb_client._connection_pools(resource.meta.client)
+    )
+
+
+def run_fresh(invocations: int, endpoint_url: str):
+    """Um resource novo por invocação, como antes do provedor compartilhado."""
+    connections = 0
+    start = perf_counter()
+    for _ in range(invocations):
+        resource = boto3.resource("dynamodb", endpoint_url=endpoint_url)
+        resource.Table(os.environ["DYNAMODB_TABLE_NAME"]).get_item(
+            Key={"passenger_id": "bench"}
+        )
+        connections += count_connections(resource)
+    return perf_counter() - start, connections
+
+
+def run_shared(invocations: int):
+    """Resource do provedor compartilhado, via PassengerRepository."""
+    dynamodb_client.reset_dynamodb_resource()
+    start = perf_counter()
+    for _ in range(invocations):
+        repository = PassengerRepository()
+        repository.logger.disabled = True
+        repository.get_by_id("bench")
+    elapsed = perf_counter() - start
+    return elapsed, dynamodb_client.get_connection_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--invocations", type=int, default=200)
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = ThreadedMotoServer(port=args.port, verbose=False)
+    server.start()
+    endpoint_url = f"http://127.0.0.1:{args.port}"
+    os.environ["DYNAMODB_ENDPOINT_URL"] = endpoint_url
+
+    try:
+        boto3.resource("dynamodb", endpoint_url=endpoint_url).create_table(
+            TableName=os.environ["DYNAMODB_TABLE_NAME"],
+            KeySchema=[{"AttributeName": "passenger_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "passenger_id", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        fresh_s, fresh_connections = run_fresh(args.invocations, endpoint_url)
+        shared_s, stats = run_shared(args.invocations)
+
+        print(f"{args.invocations} invocações (GetItem) contra {endpoint_url}")
+        print(f"{'modo':>14} | {'ms/invocação':>12} | {'conexões':>8} | {'requests':>8}")
+        print("-" * 52)
+        print(
+            f"{'novo':>14} | {fresh_s / args.invocations * 1000:>12.2f} | "
+            f"{fresh_connections:>8} | {args.invocations:>8}"
+        )
+        print(
+            f"{'compartilhado':>14} | {shared_s / args.invocations * 1000:>12.2f} | "
+            f"{stats['connections_opened']:>8} | {stats['requests_sent']:>8}"
+        )
+        print(
+            f"resources criados={stats['resources_created']}, "
+            f"reaproveitados={stats['resource_reuses']}"
+        )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark da compressão de respostas: custo de CPU vs. bytes economizados.
+
+Para páginas de GET /sobreviventes de vários tamanhos, mede o tempo de
+compressão do corpo JSON com gzip (níveis 1, 6 e 9) e brotli (se instalado),
+o tamanho final e o tamanho em base64 (o que a Lambda devolve ao API Gateway).
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_compression [--sizes 1 10 100 1000] [--repeat 20]
+"""
+
+import argparse
+import base64
+import gzip
+from time import perf_counter
+
+from src.adapter import compression
+from src.adapter.http_adapter import HTTPAdapter
+from src.config.app_config import AppConfig
+from src.models.api_response import PaginationInfo, PassengerDetail
+
+
+def make_page_body(n: int) -> bytes:
+    """Corpo JSON de uma página com n passageiros, como gerado pelo handler."""
+    passengers = [
+        PassengerDetail(
+            passenger_id=f"passageiro-{i:06d}",
+            survival_probability=round((i * 37 % 100) / 100, 4),
+            prediction="survived" if i % 3 else "not_survived",
+            confidence_level=("high", "medium", "low")[i % 3],
+            passenger_class=1 + i % 3,
+            sex="female" if i % 2 else "male",
+            age=float(i % 80),
+            siblings_spouses=i % 4,
+            parents_children=i % 3,
+            fare=round(7.25 + i * 1.37 % 250, 2),
+            embarked="SCQ"[i % 3],
+            created_at=f"2025-01-14T10:{i % 60:02d}:00",
+            model_version="model",
+        ).model_dump()
+        for i in range(n)
+    ]
+    pagination = PaginationInfo(
+        page=1,
+        limit=max(min(n, 100), 1),
+        total_items=n,
+        total_pages=1,
+        has_next=False,
+        has_previous=False,
+    ).model_dump()
+    response = HTTPAdapter.build_standard_response(
+        200, {"passengers": passengers, "pagination": pagination}, request_id="bench"
+    )
+    return response["body"].encode("utf-8")
+
+
+def codecs():
+    """Codecs avaliados: (nome, função de compressão)."""
+    entries = [
+        (f"gzip-{level}", lambda data, level=level: gzip.compress(data, level, mtime=0))
+        for level in (1, compression.GZIP_LEVEL, 9)
+    ]
+    if compression.brotli is not None:
+        entries += [
+            (
+                f"br-{quality}",
+                lambda data, q=quality: compression.brotli.compress(data, quality=q),
+            )
+            for quality in (compression.BROTLI_QUALITY, 11)
+        ]
+    return entries
+
+
+def best_of(fn, repeat: int) -> float:
+    """Retorna o menor tempo (s) entre `repeat` execuções."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if compression.brotli is None:
+        print("brotli não instalado: apenas gzip será medido\n")
+    print(
+        f"limiar atual (COMPRESSION_MIN_BYTES): {AppConfig.get_compression_min_bytes()} bytes\n"
+    )
+    print(
+        f"{'itens':>6} | {'codec':>7} | {'original':>9} | {'comprimido':>10} | "
+        f"{'base64':>8} | {'razão':>6} | {'CPU (µs)':>9} | {'µs/KB economizado':>17}"
+    )
+    print("-" * 96)
+    for size in args.sizes:
+        body = make_page_body(size)
+        for name, compress in codecs():
+            compressed = compress(body)
+            elapsed = best_of(lambda: compress(body), args.repeat)
+            wire = len(base64.b64encode(compressed))
+            saved_kb = (len(body) - len(compressed)) / 1024
+            cost = f"{elapsed * 1e6 / saved_kb:.1f}" if saved_kb > 0 else "-"
+            print(
+                f"{size:>6} | {name:>7} | {len(body):>9} | {len(compressed):>10} | "
+                f"{wire:>8} | {len(body) / len(compressed):>5.1f}x | "
+                f"{elapsed * 1e6:>9.1f} | {cost:>17}"
+            )
+
+
+if __name__ == "__main__":
+    main()
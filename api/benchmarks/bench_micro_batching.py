@@ -0,0 +1,170 @@
+"""
+Benchmark do micro-batching de predições sob carga concorrente.
+
+Dois modos, em cada nível de concorrência, sem agrupamento (janela 0) e com
+cada janela de INFERENCE_BATCH_WINDOW_MS:
+
+- inferência (padrão): threads em malha fechada pedem a predição de um
+  passageiro ao modelo real, direto ou pelo InferenceScheduler. Isola o
+  custo do predict_proba, que é o que o agrupamento reduz;
+- --harness: roda o load_harness (um processo por caso, só POSTs de um
+  passageiro) e mede a requisição inteira, incluindo a gravação no moto.
+
+Em ambos são comparados vazão, latências e o tamanho médio dos lotes.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_micro_batching [--concurrency 1 4 16] \\
+        [--windows 0 2] [--requests 600] [--harness [--target lambda|http]]
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import warnings
+from itertools import count
+from time import perf_counter
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from src.models.passenger_request import PassengerRequest  # noqa: E402
+from src.services.batch_scheduler import InferenceScheduler  # noqa: E402
+from src.services.predict_service import PredictionService  # noqa: E402
+
+HEADER = (
+    f"{'concorr.':>8} | {'janela ms':>9} | {'req/s':>8} | {'p50 ms':>8} | "
+    f"{'p95 ms':>8} | {'p99 ms':>8} | {'lote médio':>10}"
+)
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Percentil nearest-rank (mesmo critério do load_harness)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_inference_case(
+    service: PredictionService, concurrency: int, window_ms: float, args
+) -> dict:
+    """Threads em malha fechada, cada uma pedindo um passageiro por vez."""
+    scheduler = (
+        InferenceScheduler(window_ms=window_ms, max_batch_size=args.max_batch_size)
+        if window_ms > 0
+        else None
+    )
+    passenger = PassengerRequest(
+        PassengerId="bench", Pclass=3, Sex="male", Age=22.0,
+        SibSp=1, Parch=0, Fare=7.25, Embarked="S",
+    )
+    issued = count()
+    latencies = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        while next(issued) < args.requests:
+            start = perf_counter()
+            if scheduler is None:
+                service.predict_batch([passenger])
+            else:
+                scheduler.predict_batch(service, [passenger])
+            local.append((perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+    if scheduler is not None:
+        scheduler.close()
+
+    ordered = sorted(latencies)
+    return {
+        "rps": len(ordered) / elapsed,
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "avg_batch_size": scheduler.rows / scheduler.batches if scheduler else None,
+    }
+
+
+def run_harness_case(args: argparse.Namespace, concurrency: int, window_ms: float) -> dict:
+    """Executa o load_harness em um processo novo e retorna o relatório JSON."""
+    env = {
+        **os.environ,
+        "INFERENCE_BATCH_WINDOW_MS": str(window_ms),
+        "INFERENCE_BATCH_MAX_SIZE": str(args.max_batch_size),
+        "LOG_LEVEL": "WARNING",
+    }
+    output = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.load_harness", "--headless",
+            "--target", args.target,
+            "--mix", "post_single=1",
+            "--concurrency", str(concurrency),
+            "--requests", str(args.requests),
+            "--duration", "600",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    report = json.loads(output)
+    batching = report.get("inference_batching")
+    return {
+        **report["total"],
+        "avg_batch_size": batching["avg_batch_size"] if batching else None,
+    }
+
+
+def print_row(concurrency: int, window_ms: float, result: dict) -> None:
+    batch = result["avg_batch_size"]
+    print(
+        f"{concurrency:>8} | {window_ms:>9g} | {result['rps']:>8.1f} | "
+        f"{result['p50_ms']:>8.2f} | {result['p95_ms']:>8.2f} | "
+        f"{result['p99_ms']:>8.2f} | {'-' if batch is None else f'{batch:.2f}':>10}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 2])
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--harness", action="store_true", help="mede via load_harness")
+    parser.add_argument("--target", choices=("http", "lambda"), default="lambda")
+    args = parser.parse_args()
+
+    service = None
+    if not args.harness:
+        warnings.filterwarnings("ignore", category=UserWarning)
+        service = PredictionService(model_name="model", method="joblib")
+        service.logger.disabled = True
+        service.predict_batch([{"Pclass": 3, "Sex": "male"}])  # aquecimento
+
+    print(HEADER)
+    print("-" * len(HEADER))
+    for concurrency in args.concurrency:
+        for window_ms in args.windows:
+            if args.harness:
+                result = run_harness_case(args, concurrency, window_ms)
+            else:
+                result = run_inference_case(service, concurrency, window_ms, args)
+            print_row(concurrency, window_ms, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark do pico de memória (RSS) do POST em lote: array JSON vs. NDJSON.
+
+Cada caso roda em um processo novo: o corpo é montado, o RSS é medido e o
+lambda_handler é chamado enquanto uma thread amostra o RSS a cada 1 ms. O
+relatório mostra o pico acima do RSS anterior à requisição.
+
+A gravação no DynamoDB é substituída por um save_many que só devolve
+'created': o moto guardaria os itens no próprio processo e distorceria a
+medida. Validação, predição, montagem dos itens e serialização são as reais.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_ndjson_memory [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+from time import perf_counter, sleep
+
+os.environ.setdefault("DYNAMODB_TABLE_NAME", "bench-passengers")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def current_rss() -> int:
+    """RSS atual do processo, em bytes."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+def make_body(n: int, ndjson: bool, seed: int = 42) -> str:
+    """Corpo com n passageiros, escrito direto no buffer (sem lista de dicts)."""
+    rng = random.Random(seed)
+    body = io.StringIO()
+    body.write("" if ndjson else "[")
+    for i in range(n):
+        if i and not ndjson:
+            body.write(",")
+        body.write(
+            json.dumps(
+                {
+                    "PassengerId": f"bench-{i}",
+                    "Pclass": rng.choice([1, 2, 3]),
+                    "Sex": rng.choice(["male", "female"]),
+                    "Age": round(rng.uniform(0, 80), 1),
+                    "SibSp": rng.randint(0, 5),
+                    "Parch": rng.randint(0, 4),
+                    "Fare": round(rng.uniform(0, 250), 2),
+                    "Embarked": rng.choice(["S", "C", "Q"]),
+                }
+            )
+        )
+        if ndjson:
+            body.write("\n")
+    body.write("" if ndjson else "]")
+    return body.getvalue()
+
+
+def run_case(mode: str, size: int) -> None:
+    """Processo filho: mede um caso e imprime o resultado em JSON."""
+    from moto import mock_aws
+
+    with mock_aws():
+        import prediction_handler
+        from src.repository.passenger_repository import STATUS_CREATED
+
+        repository = prediction_handler.passenger_controller.passenger_repository
+        repository.save_many = lambda items, **_: [
+            {"passenger_id": item["passenger_id"], "status": STATUS_CREATED}
+            for item in items
+        ]
+
+        ndjson = mode == "ndjson"
+        event = {
+            "httpMethod": "POST",
+            "path": "/sobreviventes",
+            "headers": {
+                "Content-Type": "application/x-ndjson" if ndjson else "application/json"
+            },
+            "body": make_body(size, ndjson),
+        }
+        body_bytes = len(event["body"])
+
+        baseline = current_rss()
+        peak = baseline
+        done = threading.Event()
+
+        def sample():
+            nonlocal peak
+            while not done.is_set():
+                peak = max(peak, current_rss())
+                sleep(0.001)
+
+        sampler = threading.Thread(target=sample)
+        sampler.start()
+        start = perf_counter()
+        response = prediction_handler.lambda_handler(event, None)
+        elapsed = perf_counter() - start
+        done.set()
+        sampler.join()
+        peak = max(peak, current_rss())
+
+    print(
+        json.dumps(
+            {
+                "status": response["statusCode"],
+                "body_bytes": body_bytes,
+                "response_bytes": len(response["body"]),
+                "peak_delta": peak - baseline,
+                "seconds": elapsed,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--child", nargs=2, metavar=("MODO", "ITENS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_case(args.child[0], int(args.child[1]))
+        return
+
+    env = {**os.environ, "METRICS_ENABLED": "false", "LOG_LEVEL": "WARNING"}
+    print(
+        f"{'itens':>6} | {'modo':>6} | {'corpo (MB)':>10} | {'status':>6} | "
+        f"{'pico RSS (MB)':>13} | {'tempo (s)':>9}"
+    )
+    print("-" * 66)
+    for size in args.sizes:
+        for mode in ("json", "ndjson"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_ndjson_memory", "--child", mode, str(size)],
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{size:>6} | {mode:>6} | {result['body_bytes'] / 2**20:>10.2f} | "
+                f"{result['status']:>6} | {result['peak_delta'] / 2**20:>13.1f} | "
+                f"{result['seconds']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark da paginação de GET /sobreviventes: número de página vs cursor.
+
+Popula uma tabela moto com muitos itens e mede, para páginas cada vez mais
+profundas, a latência e o número de itens avaliados pelo DynamoDB (ScannedCount)
+para buscar UMA página em cada modo.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_pagination [--items 5000] [--limit 10]
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("DYNAMODB_TABLE_NAME", "bench-passengers")
+
+import boto3
+from moto import mock_aws
+
+from src.repository.passenger_repository import PassengerRepository
+
+
+def seed_table(n_items: int):
+    """Cria a tabela e insere `n_items` passageiros."""
+    dynamodb = boto3.resource("dynamodb")
+    table = dynamodb.create_table(
+        TableName=os.environ["DYNAMODB_TABLE_NAME"],
+        KeySchema=[{"AttributeName": "passenger_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "passenger_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    with table.batch_writer() as writer:
+        for i in range(n_items):
+            writer.put_item(
+                Item={"passenger_id": f"p-{i:07d}", "pclass": 3, "sex": "male"}
+            )
+
+
+class ScanCounter:
+    """Envolve table.scan somando o ScannedCount de cada chamada."""
+
+    def __init__(self, table):
+        self._scan = table.scan
+        self.scanned = 0
+        table.scan = self
+
+    def __call__(self, **kwargs):
+        response = self._scan(**kwargs)
+        self.scanned += response.get("ScannedCount", 0)
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50, 100, 250])
+    args = parser.parse_args()
+
+    with mock_aws():
+        seed_table(args.items)
+        repository = PassengerRepository()
+        repository.logger.disabled = True
+        counter = ScanCounter(repository.table)
+
+        # Cursor de cada página, obtido percorrendo a tabela uma única vez
+        cursors = {1: None}
+        cursor, page = None, 1
+        while page < max(args.pages):
+            cursor = repository.get_all(limit=args.limit, cursor=cursor)["next_cursor"]
+            if not cursor:
+                break
+            page += 1
+            cursors[page] = cursor
+
+        print(f"{args.items} itens, limit={args.limit}")
+        print(
+            f"{'page':>6} | {'page-mode ms':>12} | {'scanned':>8} | "
+            f"{'cursor ms':>9} | {'scanned':>8}"
+        )
+        print("-" * 56)
+        for page in args.pages:
+            if page not in cursors:
+                continue
+
+            counter.scanned = 0
+            start = perf_counter()
+            repository.get_all(page=page, limit=args.limit)
+            page_ms = (perf_counter() - start) * 1000
+            page_scanned = counter.scanned
+
+            counter.scanned = 0
+            start = perf_counter()
+            repository.get_all(limit=args.limit, cursor=cursors[page])
+            cursor_ms = (perf_counter() - start) * 1000
+            cursor_scanned = counter.scanned
+
+            print(
+                f"{page:>6} | {page_ms:>12.2f} | {page_scanned:>8} | "
+                f"{cursor_ms:>9.2f} | {cursor_scanned:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Benchmark do scan paralelo (PassengerRepository.scan_all) vs número de segmentos.
+
+Popula uma tabela moto (100k itens por padrão) e lê a tabela inteira com 1, 2,
+4, 8 e 16 segmentos, medindo a vazão em itens/s.
+
+O moto não é um bom servidor para medir paralelismo: roda no mesmo processo
+(disputa o GIL com as threads do scan) e cada chamada de scan percorre a tabela
+inteira. Por isso, no modo padrão, os itens são lidos do moto uma única vez e as
+chamadas de scan passam a ser servidas em memória, particionadas por segmento e
+paginadas por Limit, com `--latency` ms por chamada simulando o round trip até o
+DynamoDB real. Assim o que se mede é o motor do scan_all. `--live` faz as
+chamadas diretamente ao moto.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_parallel_scan [--items 100000] [--latency 20] [--live]
+"""
+
+import argparse
+import os
+import time
+import zlib
+from time import perf_counter
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("DYNAMODB_TABLE_NAME", "bench-passengers")
+
+import boto3
+from moto import mock_aws
+
+from src.repository.passenger_repository import PassengerRepository
+
+
+def seed_table(n_items: int):
+    """Cria a tabela e insere `n_items` passageiros."""
+    dynamodb = boto3.resource("dynamodb")
+    table = dynamodb.create_table(
+        TableName=os.environ["DYNAMODB_TABLE_NAME"],
+        KeySchema=[{"AttributeName": "passenger_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "passenger_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    with table.batch_writer() as writer:
+        for i in range(n_items):
+            writer.put_item(
+                Item={
+                    "passenger_id": f"p-{i:07d}",
+                    "pclass": 3,
+                    "sex": "male",
+                    "age": 22,
+                    "fare": "7.25",
+                    "survival_probability": "0.1234",
+                }
+            )
+
+
+class DelayedScan:
+    """Envolve client.scan adicionando uma latência fixa por chamada."""
+
+    def __init__(self, client, latency_s: float):
+        self._scan = client.scan
+        self.latency_s = latency_s
+        self.calls = 0
+        client.scan = self
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency_s)
+        return self._scan(**kwargs)
+
+
+class SimulatedScan(DelayedScan):
+    """
+    Serve client.scan a partir de uma cópia em memória da tabela, respeitando
+    Segment/TotalSegments, Limit, ExclusiveStartKey e ProjectionExpression.
+    """
+
+    def __init__(self, client, latency_s: float, items):
+        super().__init__(client, latency_s)
+        self._items = sorted(items, key=lambda item: item["passenger_id"])
+        self._hashes = [
+            zlib.crc32(item["passenger_id"].encode()) for item in self._items
+        ]
+        self._segments = {}
+
+    def _segment_items(self, segment: int, total_segments: int):
+        key = (segment, total_segments)
+        if key not in self._segments:
+            self._segments[key] = [
+                item
+                for item, h in zip(self._items, self._hashes)
+                if h % total_segments == segment
+            ]
+        return self._segments[key]
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency_s)
+
+        items = self._segment_items(
+            kwargs.get("Segment", 0), kwargs.get("TotalSegments", 1)
+        )
+        start = kwargs.get("ExclusiveStartKey", {}).get("_offset", 0)
+        limit = kwargs.get("Limit") or len(items)
+        page = items[start : start + limit]
+
+        names = kwargs.get("ExpressionAttributeNames")
+        if names:
+            page = [{a: i[a] for a in names.values() if a in i} for i in page]
+
+        response = {"Items": page, "Count": len(page)}
+        if start + limit < len(items):
+            response["LastEvaluatedKey"] = {"_offset": start + limit}
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument(
+        "--latency", type=float, default=20.0, help="ms por chamada de scan"
+    )
+    parser.add_argument(
+        "--projection", nargs="*", default=None, help="atributos a retornar"
+    )
+    parser.add_argument(
+        "--live", action="store_true", help="chamadas de scan direto ao moto"
+    )
+    args = parser.parse_args()
+
+    with mock_aws():
+        start = perf_counter()
+        seed_table(args.items)
+        print(f"{args.items} itens inseridos em {perf_counter() - start:.1f}s")
+
+        repository = PassengerRepository()
+        repository.logger.disabled = True
+        client = repository.dynamodb.meta.client
+        if args.live:
+            scan = DelayedScan(client, args.latency / 1000)
+        else:
+            items = list(repository.scan_all(total_segments=1))
+            scan = SimulatedScan(client, args.latency / 1000, items)
+            del items
+
+        print(
+            f"{'moto direto' if args.live else 'scan simulado sobre dados do moto'}, "
+            f"page_size={args.page_size}, latência simulada={args.latency:.0f} ms, "
+            f"projeção={args.projection or 'todos os atributos'}"
+        )
+        print(f"{'segmentos':>9} | {'segundos':>9} | {'itens/s':>9} | {'chamadas':>8}")
+        print("-" * 46)
+
+        baseline = None
+        for total_segments in args.segments:
+            scan.calls = 0
+            start = perf_counter()
+            count = sum(
+                1
+                for _ in repository.scan_all(
+                    total_segments=total_segments,
+                    projection=args.projection,
+                    page_size=args.page_size,
+                )
+            )
+            elapsed = perf_counter() - start
+            assert count == args.items, count
+
+            baseline = baseline or elapsed
+            print(
+                f"{total_segments:>9} | {elapsed:>9.2f} | {count / elapsed:>9.0f} | "
+                f"{scan.calls:>8}   ({baseline / elapsed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
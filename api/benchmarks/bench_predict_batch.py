@@ -0,0 +1,73 @@
+"""
+Benchmark do custo por passageiro: predict unitário vs predict_batch.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_predict_batch [--sizes 1 10 100 500] [--repeat 5]
+"""
+
+import argparse
+import random
+import warnings
+from time import perf_counter
+
+from src.models.passenger_request import PassengerRequest
+from src.services.predict_service import PredictionService
+
+
+def make_passengers(n: int, seed: int = 42):
+    """Gera passageiros sintéticos válidos."""
+    rng = random.Random(seed)
+    return [
+        PassengerRequest(
+            PassengerId=str(i),
+            Pclass=rng.choice([1, 2, 3]),
+            Sex=rng.choice(["male", "female"]),
+            Age=round(rng.uniform(0, 80), 1),
+            SibSp=rng.randint(0, 5),
+            Parch=rng.randint(0, 4),
+            Fare=round(rng.uniform(0, 250), 2),
+            Embarked=rng.choice(["S", "C", "Q", None]),
+        )
+        for i in range(n)
+    ]
+
+
+def best_of(fn, repeat: int) -> float:
+    """Retorna o menor tempo (s) entre `repeat` execuções."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # O modelo foi treinado com nomes de features; o aviso do sklearn só polui a saída
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    service = PredictionService(model_name="model", method="joblib")
+    service.logger.disabled = True
+
+    print(f"{'batch':>6} | {'loop (ms/pax)':>14} | {'batch (ms/pax)':>15} | {'speedup':>7}")
+    print("-" * 52)
+    for size in args.sizes:
+        passengers = make_passengers(size)
+        rows = [p.to_dict() for p in passengers]
+
+        loop_time = best_of(lambda: [service.predict(r) for r in rows], args.repeat)
+        batch_time = best_of(lambda: service.predict_batch(passengers), args.repeat)
+
+        print(
+            f"{size:>6} | {loop_time / size * 1000:>14.4f} | "
+            f"{batch_time / size * 1000:>15.4f} | {loop_time / batch_time:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark do pré-processamento de um lote: linha a linha vs. colunar (NumPy).
+
+Compara quatro caminhos para montar a mesma matriz de features:
+- linha: um _preprocess por passageiro (caminho do predict unitário);
+- vetores: _feature_vector por linha + np.array e reordenação das colunas
+  (o _preprocess_batch anterior ao pré-processamento colunar);
+- dicts -> colunar: _preprocess_batch (transpõe os dicts e usa o colunar);
+- colunar: _preprocess_columns sobre colunas prontas (ex.: blocos do CSV),
+  com np.where e one-hot vetorizados.
+
+Antes de medir, confere que as matrizes são idênticas.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_preprocess [--rows 10000] [--repeat 7]
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+import numpy as np
+
+from src.services.predict_service import PredictionService
+
+
+def make_rows(n: int, seed: int = 42):
+    """Passageiros sintéticos, com ~10% de Age, Fare e Embarked ausentes."""
+    rng = random.Random(seed)
+
+    def maybe(value):
+        return None if rng.random() < 0.1 else value
+
+    return [
+        {
+            "Pclass": rng.choice([1, 2, 3]),
+            "Sex": rng.choice(["male", "female"]),
+            "Age": maybe(round(rng.uniform(0, 80), 1)),
+            "SibSp": rng.randint(0, 5),
+            "Parch": rng.randint(0, 4),
+            "Fare": maybe(round(rng.uniform(0, 250), 2)),
+            "Embarked": maybe(rng.choice(["S", "C", "Q"])),
+        }
+        for _ in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    service = PredictionService(model_name="model", method="joblib")
+    service.logger.disabled = True
+    rows = make_rows(args.rows)
+    columns = service._batch_columns(rows)
+
+    def per_row():
+        return np.vstack([service._preprocess(row) for row in rows])
+
+    def feature_vectors():
+        matrix = np.array([service._feature_vector(row) for row in rows])
+        if service._column_order is not None:
+            matrix = matrix[:, service._column_order]
+        return matrix
+
+    def batch():
+        return service._preprocess_batch(rows)
+
+    def columnar():
+        return service._preprocess_columns(columns)
+
+    cases = [
+        ("linha (_preprocess)", per_row),
+        ("vetores + np.array", feature_vectors),
+        ("dicts -> colunar", batch),
+        ("colunar (NumPy)", columnar),
+    ]
+
+    reference = per_row()
+    for name, fn in cases[1:]:
+        np.testing.assert_array_equal(fn(), reference, err_msg=name)
+    print(f"Matrizes idênticas em {args.rows} linhas ({reference.shape[1]} features)\n")
+
+    # Alterna os casos a cada rodada para que ruído da máquina afete todos igualmente
+    timings = {name: [] for name, _ in cases}
+    for _ in range(args.repeat):
+        for name, fn in cases:
+            start = perf_counter()
+            fn()
+            timings[name].append(perf_counter() - start)
+
+    baseline = min(timings[cases[0][0]])
+    print(f"{'caminho':>20} | {'melhor (ms)':>11} | {'us/linha':>8} | {'speedup':>7}")
+    print("-" * 57)
+    for name, _ in cases:
+        best = min(timings[name])
+        print(
+            f"{name:>20} | {best * 1000:>11.2f} | "
+            f"{best / args.rows * 1e6:>8.2f} | {baseline / best:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark da serialização das respostas de sucesso (envelope padrão).
+
+Compara o caminho anterior (model_dump do payload, StandardSuccessResponse,
+novo model_dump do envelope e json.dumps) com HTTPAdapter.build_standard_response,
+que converte o payload uma única vez e gera o JSON em um único encode. Também
+confere se os dois caminhos produzem exatamente os mesmos bytes.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_serialization [--sizes 10 100 1000] [--repeat 200]
+"""
+
+import argparse
+import json
+from datetime import datetime
+from time import perf_counter
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from src.adapter.http_adapter import HTTPAdapter
+from src.models.api_response import (
+    APIMetadata,
+    PaginationInfo,
+    PassengerDetail,
+    StandardSuccessResponse,
+)
+
+
+def make_page(n: int) -> dict:
+    """Página de GET /sobreviventes como montada pelo controller e pelo handler."""
+    passengers = [
+        PassengerDetail(
+            passenger_id=f"passageiro-{i}",
+            survival_probability=0.7312,
+            prediction="survived",
+            confidence_level="medium",
+            passenger_class=1 + i % 3,
+            sex="female" if i % 2 else "male",
+            age=38.0,
+            siblings_spouses=1,
+            parents_children=0,
+            fare=71.2833,
+            embarked="C",
+            created_at="2025-01-14T10:30:00",
+            model_version="model",
+        ).model_dump()
+        for i in range(n)
+    ]
+    pagination = PaginationInfo(
+        page=1,
+        limit=max(min(n, 100), 1),
+        total_items=n * 3,
+        total_pages=3,
+        has_next=True,
+        has_previous=False,
+    ).model_dump()
+    return {"passengers": passengers, "pagination": pagination}
+
+
+def legacy_response(body_data, request_id: str, message: str) -> str:
+    """Caminho anterior: dois model_dump e json.dumps."""
+    data = body_data.model_dump() if isinstance(body_data, BaseModel) else body_data
+    response = StandardSuccessResponse(
+        message=message, data=data, metadata=APIMetadata(request_id=request_id)
+    )
+    return json.dumps(response.model_dump(), ensure_ascii=False, default=str)
+
+
+def per_call(fns, repeat: int, rounds: int = 7):
+    """
+    Tempo médio (s) por chamada de cada função, no melhor de `rounds` rodadas.
+    As funções são alternadas a cada rodada para que ruído da máquina afete
+    todas igualmente.
+    """
+    best = [float("inf")] * len(fns)
+    for _ in range(rounds):
+        for index, fn in enumerate(fns):
+            start = perf_counter()
+            for _ in range(repeat):
+                fn()
+            best[index] = min(best[index], (perf_counter() - start) / repeat)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    message = "Lista de passageiros recuperada com sucesso"
+    print(
+        f"{'itens':>6} | {'bytes':>8} | {'anterior (µs)':>13} | "
+        f"{'atual (µs)':>10} | {'speedup':>7} | {'idêntico':>8}"
+    )
+    print("-" * 70)
+    for size in args.sizes:
+        page = make_page(size)
+        repeat = max(args.repeat * 100 // max(size, 100), 5)
+
+        with patch("src.models.api_response.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 1, 14, 10, 30)
+            legacy_body = legacy_response(page, "bench", message)
+            body = HTTPAdapter.build_standard_response(
+                200, page, request_id="bench", message=message
+            )["body"]
+
+        legacy_time, new_time = per_call(
+            [
+                lambda: legacy_response(page, "bench", message),
+                lambda: HTTPAdapter.build_standard_response(
+                    200, page, request_id="bench", message=message
+                ),
+            ],
+            repeat,
+        )
+
+        print(
+            f"{size:>6} | {len(body.encode('utf-8')):>8} | {legacy_time * 1e6:>13.1f} | "
+            f"{new_time * 1e6:>10.1f} | {legacy_time / new_time:>6.1f}x | "
+            f"{'sim' if body == legacy_body else 'NÃO':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
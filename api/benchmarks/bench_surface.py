@@ -0,0 +1,83 @@
+"""
+Benchmark do modo 'surface' contra os modelos exatos (joblib e compiled).
+
+Mede o predict unitário (caminho do POST de um passageiro) e o predict_batch
+em lotes, com o PredictionService de cada método. A superfície precisa ter sido
+gerada antes com scripts/export_surface_model.py.
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_surface [--batch 1000] [--repeat 200]
+"""
+
+import argparse
+import random
+import warnings
+from time import perf_counter
+
+from src.services.predict_service import PredictionService
+
+
+def make_rows(n: int, seed: int = 42):
+    """Passageiros sintéticos válidos."""
+    rng = random.Random(seed)
+    return [
+        {
+            "Pclass": rng.choice([1, 2, 3]),
+            "Sex": rng.choice(["male", "female"]),
+            "Age": round(rng.uniform(0, 80), 1),
+            "SibSp": rng.randint(0, 5),
+            "Parch": rng.randint(0, 4),
+            "Fare": round(rng.uniform(0, 250), 2),
+            "Embarked": rng.choice(["S", "C", "Q"]),
+        }
+        for _ in range(n)
+    ]
+
+
+def best_of(fn, repeat: int) -> float:
+    """Retorna o menor tempo (s) entre `repeat` execuções."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    # O modelo foi treinado com nomes de features; o aviso do sklearn só polui a saída
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    rows = make_rows(args.batch)
+    single = rows[0]
+
+    print(
+        f"{'método':>9} | {'predict (ms)':>12} | {'lote (ms)':>10} | "
+        f"{'us/pax lote':>11} | {'erro máx. lote':>14}"
+    )
+    print("-" * 70)
+    exact = None
+    for method in ("joblib", "compiled", "surface"):
+        service = PredictionService(model_name="model", method=method)
+        service.logger.disabled = True
+
+        single_time = best_of(lambda: service.predict(single), args.repeat)
+        batch_time = best_of(lambda: service.predict_batch(rows), max(3, args.repeat // 20))
+
+        probabilities = service.predict_batch(rows)
+        if exact is None:
+            exact = probabilities
+        error = max(abs(p - e) for p, e in zip(probabilities, exact))
+        print(
+            f"{method:>9} | {single_time * 1000:>12.3f} | {batch_time * 1000:>10.2f} | "
+            f"{batch_time / args.batch * 1e6:>11.2f} | {error:>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark do custo da instrumentação por etapas (src.metrics.timing).
+
+Mede, em nanossegundos por chamada, o custo de `stage()` e `@timed` com e sem
+uma invocação instrumentada ativa, e o custo de montar e escrever a linha EMF.
+Ao final, estima o custo total por invocação de um POST típico (~10 etapas).
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.bench_timing_overhead [--calls 200000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+from src.metrics import timing
+from src.metrics.timing import InvocationMetrics, stage, timed
+
+
+STAGES_PER_INVOCATION = 10
+
+
+def best_of(fn, repeat: int) -> float:
+    """Retorna o menor tempo (s) entre `repeat` execuções."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def plain():
+    return None
+
+
+decorated = timed("bench")(plain)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    calls = range(args.calls)
+
+    def loop_plain():
+        for _ in calls:
+            plain()
+
+    def loop_decorated():
+        for _ in calls:
+            decorated()
+
+    def loop_stage():
+        for _ in calls:
+            with stage("bench"):
+                pass
+
+    def ns(fn):
+        return best_of(fn, args.repeat) / args.calls * 1e9
+
+    baseline = ns(loop_plain)
+    results = {"inativo": {}, "ativo": {}}
+    for label in results:
+        token = (
+            timing._current.set(InvocationMetrics("GET /bench", cold_start=False))
+            if label == "ativo"
+            else None
+        )
+        try:
+            results[label]["@timed"] = ns(loop_decorated) - baseline
+            results[label]["stage()"] = ns(loop_stage)
+        finally:
+            if token is not None:
+                timing._current.reset(token)
+
+    # Emissão: monta o EMF de uma invocação típica e escreve em /dev/null
+    def emit_once():
+        metrics = InvocationMetrics("POST /sobreviventes", cold_start=False)
+        for i in range(STAGES_PER_INVOCATION):
+            metrics.add_duration(f"stage_{i}", 1.0)
+        metrics.add_count("items", 1)
+        timing.emit(metrics)
+
+    stdout = sys.stdout
+    with open(os.devnull, "w") as sink:
+        sys.stdout = sink
+        try:
+            emit_us = best_of(lambda: [emit_once() for _ in range(1000)], args.repeat)
+        finally:
+            sys.stdout = stdout
+    emit_us = emit_us / 1000 * 1e6
+
+    print(f"chamada vazia (referência): {baseline:.0f} ns")
+    print(f"{'':>10} | {'@timed (ns)':>12} | {'stage() (ns)':>12}")
+    print("-" * 40)
+    for label, values in results.items():
+        print(f"{label:>10} | {values['@timed']:>12.0f} | {values['stage()']:>12.0f}")
+    print(f"emissão EMF ({STAGES_PER_INVOCATION} etapas): {emit_us:.1f} µs")
+
+    per_invocation = (
+        STAGES_PER_INVOCATION * max(results["ativo"].values()) / 1000 + emit_us
+    )
+    print(f"custo estimado por invocação: {per_invocation:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
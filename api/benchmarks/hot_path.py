@@ -0,0 +1,291 @@
+"""
+Suíte de micro-benchmarks do caminho quente de uma requisição.
+
+Casos cobertos:
+- HTTPAdapter.body (decodificação do JSON, 1 e 100 passageiros)
+- validação de PassengerRequest (1, 100 e 1000 itens)
+- map_request_to_dynamodb_item
+- PredictionService._preprocess e predict (modelos joblib e compiled)
+- PredictionResult.from_probability
+- HTTPAdapter.build_standard_response (1 e 100 itens)
+
+Cada caso é repetido até ocupar ~`--min-time` segundos por rodada; o resultado
+é o tempo por operação (mínimo e mediana entre as rodadas), em microssegundos.
+
+Uso (a partir da pasta api/):
+    # mede e salva uma nova baseline
+    python -m benchmarks.hot_path run --save benchmarks/baselines/hot_path.json
+
+    # compara com a baseline; sai com código 1 se algum caso regredir > 20%
+    python -m benchmarks.hot_path compare benchmarks/baselines/hot_path.json \\
+        [--threshold 0.2] [--filter predict]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import warnings
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from src.adapter.http_adapter import HTTPAdapter
+from src.logging.custom_logging import get_logger
+from src.mapper.mapper import map_request_to_dynamodb_item
+from src.models.api_response import PredictionResult
+from src.models.passenger_request import PassengerRequest
+from src.services.predict_service import PredictionService
+
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "baselines", "hot_path.json"
+)
+
+
+def make_payloads(n: int, seed: int = 42) -> List[Dict]:
+    """Gera corpos de requisição sintéticos e válidos."""
+    rng = random.Random(seed)
+    return [
+        {
+            "PassengerId": str(i),
+            "Pclass": rng.choice([1, 2, 3]),
+            "Sex": rng.choice(["male", "female"]),
+            "Age": round(rng.uniform(0, 80), 1),
+            "SibSp": rng.randint(0, 5),
+            "Parch": rng.randint(0, 4),
+            "Fare": round(rng.uniform(0, 250), 2),
+            "Embarked": rng.choice(["S", "C", "Q", None]),
+        }
+        for i in range(n)
+    ]
+
+
+def build_cases() -> List[Tuple[str, Callable[[], object]]]:
+    """Monta a lista (nome, função sem argumentos) de casos do benchmark."""
+    payloads = make_payloads(1000)
+    requests = [PassengerRequest(**p) for p in payloads]
+    cases: List[Tuple[str, Callable[[], object]]] = []
+
+    for size in (1, 100):
+        event = {"httpMethod": "POST", "body": json.dumps(payloads[:size])}
+        cases.append(
+            (f"http_adapter.body[{size}]", lambda e=event: HTTPAdapter(e).body)
+        )
+
+    for size in (1, 100, 1000):
+        items = payloads[:size]
+        cases.append(
+            (
+                f"passenger_request.validate[{size}]",
+                lambda items=items: [PassengerRequest(**p) for p in items],
+            )
+        )
+
+    cases.append(
+        (
+            "mapper.map_request_to_dynamodb_item",
+            lambda: map_request_to_dynamodb_item(requests[0]),
+        )
+    )
+
+    for method in ("joblib", "compiled"):
+        service = PredictionService(model_name="model", method=method)
+        row = requests[0].to_dict()
+        cases.append(
+            (
+                f"predict_service._preprocess[{method}]",
+                lambda s=service: s._preprocess(row),
+            )
+        )
+        cases.append(
+            (f"predict_service.predict[{method}]", lambda s=service: s.predict(row))
+        )
+
+    cases.append(
+        (
+            "prediction_result.from_probability",
+            lambda: PredictionResult.from_probability(
+                "1", 0.7312, model_version="model"
+            ),
+        )
+    )
+
+    single = PredictionResult.from_probability("1", 0.7312).model_dump()
+    page = [dict(p, survival_probability=0.5) for p in payloads[:100]]
+    cases.append(
+        (
+            "http_adapter.build_standard_response[1]",
+            lambda: HTTPAdapter.build_standard_response(
+                201, single, request_id="bench"
+            ),
+        )
+    )
+    cases.append(
+        (
+            "http_adapter.build_standard_response[100]",
+            lambda: HTTPAdapter.build_standard_response(
+                200, {"passengers": page}, request_id="bench"
+            ),
+        )
+    )
+    return cases
+
+
+def measure(
+    fn: Callable[[], object], min_time: float, rounds: int
+) -> Dict[str, float]:
+    """Mede `fn` e retorna o tempo por operação (µs): mínimo e mediana."""
+    # Calibra o número de chamadas por rodada (como o timeit.autorange)
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    samples = []
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((perf_counter() - start) / loops * 1e6)
+
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "loops": loops,
+    }
+
+
+def run_suite(min_time: float, rounds: int, name_filter: str = "") -> Dict:
+    """Executa os casos e retorna o documento de resultados."""
+    # O modelo joblib foi treinado com nomes de features; o aviso só polui a saída
+    warnings.filterwarnings("ignore", category=UserWarning)
+    get_logger().disabled = True
+
+    results = {}
+    for name, fn in build_cases():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(fn, min_time, rounds)
+        print(f"{name:<45} {results[name]['min_us']:>12.2f} µs", file=sys.stderr)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def confirm_regressions(
+    baseline: Dict,
+    current: Dict,
+    threshold: float,
+    min_time: float,
+    rounds: int,
+    retries: int,
+) -> None:
+    """
+    Mede de novo os casos acima do limite, mantendo o melhor tempo. Evita falsos
+    positivos causados por ruído pontual da máquina (outros processos, CPU).
+    """
+    cases = dict(build_cases())
+    for _ in range(retries):
+        suspects = [
+            name
+            for name, result in current["results"].items()
+            if name in baseline["results"]
+            and result["min_us"]
+            > baseline["results"][name]["min_us"] * (1 + threshold)
+        ]
+        for name in suspects:
+            retry = measure(cases[name], min_time, rounds)
+            if retry["min_us"] < current["results"][name]["min_us"]:
+                current["results"][name] = retry
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """
+    Imprime a comparação caso a caso e retorna os casos que regrediram, isto é,
+    cujo tempo mínimo passou de baseline * (1 + threshold).
+    """
+    regressions = []
+    print(f"{'caso':<45} | {'baseline µs':>12} | {'atual µs':>12} | {'variação':>9}")
+    print("-" * 88)
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<45} | {'-':>12} | {result['min_us']:>12.2f} | {'novo':>9}")
+            continue
+
+        change = result["min_us"] / base["min_us"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSÃO"
+            regressions.append(name)
+        print(
+            f"{name:<45} | {base['min_us']:>12.2f} | {result['min_us']:>12.2f} | "
+            f"{change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="executa a suíte")
+    run_parser.add_argument("--save", metavar="PATH", help="salva os resultados em JSON")
+
+    compare_parser = subparsers.add_parser("compare", help="compara com uma baseline")
+    compare_parser.add_argument("baseline", nargs="?", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.add_argument(
+        "--retries", type=int, default=3, help="novas medições dos casos suspeitos"
+    )
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--min-time", type=float, default=0.1)
+        sub.add_argument("--rounds", type=int, default=5)
+        sub.add_argument("--filter", default="", help="executa só casos com este trecho")
+
+    args = parser.parse_args()
+    current = run_suite(args.min_time, args.rounds, args.filter)
+
+    if args.command == "run":
+        output = json.dumps(current, indent=2, ensure_ascii=False)
+        if args.save:
+            os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+            with open(args.save, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+            print(f"Resultados salvos em {args.save}")
+        else:
+            print(output)
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    confirm_regressions(
+        baseline, current, args.threshold, args.min_time, args.rounds, args.retries
+    )
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} caso(s) acima do limite de {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nNenhuma regressão acima de {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
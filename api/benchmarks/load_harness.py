@@ -0,0 +1,596 @@
+"""
+Teste de carga ponta a ponta contra a stack local (moto + Flask do api_mock.py).
+
+Os eventos são montados com os builders de mock_api/mock_event.py e enviados por
+um dos alvos:
+
+- http: sobe o ThreadedMotoServer e a aplicação Flask do api_mock.py neste
+  processo (ou usa um servidor já em execução via --url) e envia cada evento
+  como requisição HTTP;
+- lambda: chama o lambda_handler diretamente com o evento, sem Flask/HTTP
+  (isola o custo da aplicação do custo do servidor de desenvolvimento).
+
+A carga é em malha fechada: --concurrency workers enviam requisições uma após a
+outra durante --duration segundos (ou até --requests requisições), sorteando a
+rota conforme --mix. Ao final são reportados, por rota e no total: vazão (req/s),
+latência p50/p95/p99 (ms) e taxa de erro (status 5xx, status inesperado ou
+falha de conexão).
+
+Uso (a partir da pasta api/):
+    python -m benchmarks.load_harness [--concurrency 8] [--duration 30] \\
+        [--mix post_single=30,post_batch=5,get_list=15,get_by_id=35,delete=5,health=10] \\
+        [--target http|lambda] [--url http://127.0.0.1:9091]
+
+    # CI: sem progresso no terminal, relatório JSON e código 1 se violar os SLOs
+    python -m benchmarks.load_harness --headless --concurrency 4 --duration 20 \\
+        --slo-file benchmarks/baselines/load_harness_slo.json [--output report.json]
+
+Com INFERENCE_BATCH_WINDOW_MS > 0 no ambiente, os POSTs concorrentes passam
+pelo micro-batching de predições e o relatório traz os lotes executados e o
+tamanho médio do lote (ver benchmarks/bench_micro_batching.py).
+
+SLOs podem ser passados também com --slo (repetível): 'p95_ms=250' vale para
+o total; 'get_by_id.p99_ms=150' vale só para a rota. Chaves aceitas: p50_ms,
+p95_ms, p99_ms, error_rate (máximo) e rps (mínimo).
+"""
+
+import argparse
+import contextlib
+import http.client
+import json
+import logging
+import math
+import os
+import random
+import sys
+import threading
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import count
+from time import perf_counter, sleep
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# O EMF por invocação e os logs da aplicação só poluiriam a saída do teste
+os.environ.setdefault("METRICS_ENABLED", "false")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from api_mock import Config, MockServerManager, create_flask_app, initialize_database
+from mock_api.mock_event import (
+    mock_delete_passenger_event,
+    mock_get_all_passengers_event,
+    mock_get_passenger_by_id_event,
+    mock_health_check_event,
+    mock_post_passenger_event,
+)
+from src.logging.custom_logging import get_logger
+
+
+DEFAULT_MIX = {
+    "post_single": 30,
+    "post_batch": 5,
+    "get_list": 15,
+    "get_by_id": 35,
+    "delete": 5,
+    "health": 10,
+}
+
+# Status considerados sucesso em cada rota; 404 é resposta válida para leituras
+# e exclusões de ids que outro worker já removeu
+EXPECTED_STATUS = {
+    "post_single": {201},
+    "post_batch": {201},
+    "get_list": {200, 404},
+    "get_by_id": {200, 404},
+    "delete": {200, 404},
+    "health": {200},
+}
+
+SLO_KEYS = ("p50_ms", "p95_ms", "p99_ms", "error_rate", "rps")
+
+
+class PassengerPool:
+    """Ids criados durante o teste, compartilhados entre os workers."""
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._lock = threading.Lock()
+        self._next_id = count(1)
+        # Prefixo único por pool: o aquecimento e a medição não colidem
+        self._run = uuid.uuid4().hex[:8]
+
+    def new_id(self) -> str:
+        return f"load-{self._run}-{next(self._next_id)}"
+
+    def add(self, passenger_ids: List[str]) -> None:
+        with self._lock:
+            self._ids.extend(passenger_ids)
+
+    def pick(self, rng: random.Random) -> str:
+        with self._lock:
+            if self._ids:
+                return rng.choice(self._ids)
+        return "load-inexistente"
+
+    def take(self, rng: random.Random) -> str:
+        with self._lock:
+            if self._ids:
+                return self._ids.pop(rng.randrange(len(self._ids)))
+        return "load-inexistente"
+
+
+def make_passenger(passenger_id: str, rng: random.Random) -> Dict:
+    """Corpo sintético e válido de um passageiro."""
+    return {
+        "PassengerId": passenger_id,
+        "Pclass": rng.choice([1, 2, 3]),
+        "Sex": rng.choice(["male", "female"]),
+        "Age": round(rng.uniform(1, 80), 1),
+        "SibSp": rng.randint(0, 5),
+        "Parch": rng.randint(0, 4),
+        "Fare": round(rng.uniform(5, 250), 2),
+        "Embarked": rng.choice(["S", "C", "Q"]),
+    }
+
+
+def build_event(
+    route: str, pool: PassengerPool, rng: random.Random, batch_size: int
+) -> Tuple[Dict, List[str]]:
+    """
+    Monta o evento da rota com os builders do mock_api.
+
+    Returns:
+        Tuple com o evento e os ids que ele cria (para o pool, em caso de sucesso).
+    """
+    if route == "post_single":
+        passenger_id = pool.new_id()
+        body = make_passenger(passenger_id, rng)
+        return mock_post_passenger_event(body=body), [passenger_id]
+    if route == "post_batch":
+        ids = [pool.new_id() for _ in range(batch_size)]
+        body = [make_passenger(passenger_id, rng) for passenger_id in ids]
+        return mock_post_passenger_event(body=body), ids
+    if route == "get_list":
+        return mock_get_all_passengers_event(), []
+    if route == "get_by_id":
+        return mock_get_passenger_by_id_event(pool.pick(rng)), []
+    if route == "delete":
+        return mock_delete_passenger_event(pool.take(rng)), []
+    if route == "health":
+        return mock_health_check_event(), []
+    raise ValueError(f"Rota desconhecida: {route}")
+
+
+class HttpTarget:
+    """Envia o evento como requisição HTTP; uma conexão keep-alive por thread."""
+
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+            self._local.connection = connection
+        return connection
+
+    def __call__(self, event: Dict) -> int:
+        connection = self._connection()
+        headers = {"Accept": "application/json"}
+        if event.get("body"):
+            headers["Content-Type"] = "application/json"
+        try:
+            connection.request(
+                event["httpMethod"], event["path"], body=event.get("body"), headers=headers
+            )
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        except (http.client.HTTPException, OSError):
+            # Descarta a conexão com problema; a próxima requisição abre outra
+            connection.close()
+            self._local.connection = None
+            raise
+
+
+class LambdaTarget:
+    """Chama o lambda_handler diretamente com o evento."""
+
+    def __init__(self):
+        from prediction_handler import lambda_handler
+
+        self.handler = lambda_handler
+
+    def __call__(self, event: Dict) -> int:
+        return self.handler(event, None).get("statusCode", 500)
+
+
+def serialize_moto_transactions() -> None:
+    """
+    Serializa o TransactWriteItems do moto. O backend copia todas as tabelas
+    (deepcopy) a cada transação e falha com 500 se outra thread alterar uma
+    tabela no meio da cópia; o DynamoDB real isola as transações. Sem isso, os
+    erros e a latência de retry do mock apareceriam como erros da API.
+    """
+    from moto.dynamodb.models import DynamoDBBackend
+
+    original = DynamoDBBackend.transact_write_items
+    if getattr(original, "_serialized", False):
+        return
+    lock = threading.Lock()
+
+    def transact_write_items(self, *args, **kwargs):
+        with lock:
+            return original(self, *args, **kwargs)
+
+    transact_write_items._serialized = True
+    DynamoDBBackend.transact_write_items = transact_write_items
+
+
+def start_dynamodb() -> Callable[[], None]:
+    """
+    Sobe o servidor moto do api_mock.py e cria a tabela.
+
+    Returns:
+        Função que derruba o servidor (uma única vez, sem repetir no atexit).
+    """
+    serialize_moto_transactions()
+    mock_manager = MockServerManager()
+    if not mock_manager.start():
+        raise RuntimeError("Falha ao iniciar servidor Mock DynamoDB")
+    initialize_database()
+
+    def stop() -> None:
+        mock_manager.stop()
+        mock_manager.server = None
+
+    return stop
+
+
+def start_local_stack(port: int) -> Tuple[Callable[[], None], str]:
+    """
+    Sobe o moto e a aplicação Flask do api_mock.py em threads deste processo.
+
+    Returns:
+        Tuple com a função que derruba a stack e a URL base da API.
+    """
+    from werkzeug.serving import make_server
+
+    stop_dynamodb = start_dynamodb()
+    server = make_server("127.0.0.1", port, create_flask_app(), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def stop() -> None:
+        server.shutdown()
+        stop_dynamodb()
+
+    return stop, f"http://127.0.0.1:{port}"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por posição mais próxima (nearest-rank) de uma lista ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict:
+    """Vazão, percentis de latência e taxa de erro de um conjunto de amostras."""
+    ordered = sorted(latencies)
+    total = len(ordered)
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p95_ms": round(percentile(ordered, 95), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def run_load(
+    target: Callable[[Dict], int],
+    mix: Dict[str, int],
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int],
+    batch_size: int,
+    seed: int,
+    progress: bool,
+) -> Dict:
+    """
+    Executa a carga e retorna o relatório por rota e total.
+
+    Cada worker mantém as próprias amostras (sem lock no caminho da medição);
+    elas são agregadas ao final.
+    """
+    pool = PassengerPool()
+    routes = list(mix)
+    weights = [mix[route] for route in routes]
+    stop = threading.Event()
+    issued = count()
+    samples: List[Dict[str, Tuple[List[float], List[int]]]] = []
+    status_counts: Dict[str, Dict[int, int]] = {route: {} for route in routes}
+    status_lock = threading.Lock()
+
+    def worker(worker_id: int) -> None:
+        rng = random.Random(seed + worker_id)
+        local: Dict[str, Tuple[List[float], List[int]]] = {
+            route: ([], []) for route in routes
+        }
+        samples.append(local)
+        while not stop.is_set():
+            if max_requests is not None and next(issued) >= max_requests:
+                break
+            route = rng.choices(routes, weights)[0]
+            event, created = build_event(route, pool, rng, batch_size)
+
+            start = perf_counter()
+            try:
+                status = target(event)
+            except Exception:
+                status = 0
+            latency_ms = (perf_counter() - start) * 1000
+
+            failed = status not in EXPECTED_STATUS[route]
+            local[route][0].append(latency_ms)
+            if failed:
+                local[route][1].append(status)
+            elif created:
+                pool.add(created)
+            with status_lock:
+                counts = status_counts[route]
+                counts[status] = counts.get(status, 0) + 1
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(worker, i) for i in range(concurrency)]
+        deadline = start + duration
+        while not all(f.done() for f in futures):
+            if perf_counter() >= deadline:
+                stop.set()
+                break
+            sleep(0.1)
+            if progress:
+                done = sum(len(lat) for s in samples for lat, _ in s.values())
+                print(
+                    f"\r{perf_counter() - start:6.1f}s  {done} requisições",
+                    end="",
+                    file=sys.stderr,
+                )
+        for future in futures:
+            future.result()
+    elapsed = perf_counter() - start
+    if progress:
+        print(file=sys.stderr)
+
+    report_routes = {}
+    all_latencies: List[float] = []
+    all_errors = 0
+    for route in routes:
+        latencies = [ms for s in samples for ms in s[route][0]]
+        errors = sum(len(s[route][1]) for s in samples)
+        if not latencies:
+            continue
+        report_routes[route] = summarize(latencies, errors, elapsed)
+        report_routes[route]["status"] = {
+            str(code): n for code, n in sorted(status_counts[route].items())
+        }
+        all_latencies.extend(latencies)
+        all_errors += errors
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "mix": mix,
+        "routes": report_routes,
+        "total": summarize(all_latencies, all_errors, elapsed),
+    }
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Converte 'post_single=30,get_by_id=70' em pesos por rota."""
+    mix = {}
+    for part in value.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in EXPECTED_STATUS:
+            raise argparse.ArgumentTypeError(
+                f"Rota desconhecida '{route}'. Use: {', '.join(EXPECTED_STATUS)}"
+            )
+        mix[route] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("O mix precisa de ao menos um peso positivo")
+    return {route: weight for route, weight in mix.items() if weight > 0}
+
+
+def parse_slos(items: List[str]) -> Dict[str, Dict[str, float]]:
+    """Converte ['p95_ms=250', 'health.error_rate=0'] em {escopo: {chave: limite}}."""
+    slos: Dict[str, Dict[str, float]] = {}
+    for item in items:
+        name, _, limit = item.partition("=")
+        scope, _, key = name.rpartition(".")
+        if key not in SLO_KEYS:
+            raise ValueError(f"SLO desconhecido '{key}'. Use: {', '.join(SLO_KEYS)}")
+        slos.setdefault(scope or "total", {})[key] = float(limit)
+    return slos
+
+
+def check_slos(report: Dict, slos: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Retorna as violações de SLO do relatório. 'rps' é um mínimo; as demais
+    chaves são máximos. SLOs de rotas fora do mix são ignorados.
+    """
+    violations = []
+    for scope, limits in slos.items():
+        result = report["total"] if scope == "total" else report["routes"].get(scope)
+        if result is None:
+            continue
+        for key, limit in limits.items():
+            value = result[key]
+            if (key == "rps" and value < limit) or (key != "rps" and value > limit):
+                violations.append(f"{scope}.{key}: {value} (limite {limit})")
+    return violations
+
+
+def print_report(report: Dict) -> None:
+    """Imprime a tabela por rota."""
+    header = (
+        f"{'rota':<12} | {'req':>7} | {'req/s':>8} | {'p50 ms':>8} | "
+        f"{'p95 ms':>8} | {'p99 ms':>8} | {'erros':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    rows = list(report["routes"].items()) + [("total", report["total"])]
+    for route, r in rows:
+        print(
+            f"{route:<12} | {r['requests']:>7} | {r['rps']:>8.1f} | "
+            f"{r['p50_ms']:>8.2f} | {r['p95_ms']:>8.2f} | {r['p99_ms']:>8.2f} | "
+            f"{r['error_rate']:>7.2%}"
+        )
+
+
+def inference_batching_stats() -> Optional[Dict]:
+    """
+    Lotes e passageiros do micro-batching de predições do handler deste
+    processo (INFERENCE_BATCH_WINDOW_MS > 0), ou None se desativado.
+    """
+    from prediction_handler import inference_scheduler
+
+    if inference_scheduler is None:
+        return None
+    return {
+        "window_ms": inference_scheduler.window * 1000,
+        "max_batch_size": inference_scheduler.max_batch_size,
+        "batches": inference_scheduler.batches,
+        "rows": inference_scheduler.rows,
+    }
+
+
+def run_with_stack(args: argparse.Namespace) -> Dict:
+    """Sobe a stack (se necessário) e executa o aquecimento e a carga medida."""
+    stop_stack = None
+    if args.target == "lambda":
+        # Sem Flask: o moto ainda é necessário para o DynamoDB do handler
+        stop_stack = start_dynamodb()
+        target = LambdaTarget()
+    else:
+        url = args.url
+        if url is None:
+            stop_stack, url = start_local_stack(args.port)
+        target = HttpTarget(url, args.timeout)
+    get_logger().disabled = True
+
+    try:
+        if args.warmup:
+            run_load(
+                target, args.mix, args.concurrency, args.duration, args.warmup,
+                args.batch_size, args.seed, progress=False,
+            )
+        before = inference_batching_stats()
+        report = run_load(
+            target,
+            args.mix,
+            args.concurrency,
+            args.duration,
+            args.requests,
+            args.batch_size,
+            args.seed,
+            progress=not args.headless,
+        )
+        # Só é possível medir os lotes quando o handler roda neste processo
+        after = inference_batching_stats() if args.url is None else None
+        if after is not None:
+            after["batches"] -= before["batches"]
+            after["rows"] -= before["rows"]
+            after["avg_batch_size"] = (
+                round(after["rows"] / after["batches"], 2) if after["batches"] else 0.0
+            )
+        report["inference_batching"] = after
+        return report
+    finally:
+        if stop_stack is not None:
+            stop_stack()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--target", choices=("http", "lambda"), default="http")
+    parser.add_argument(
+        "--url", help="API já em execução (ex.: python api_mock.py); senão sobe local"
+    )
+    parser.add_argument("--port", type=int, default=Config.FLASK_PORT)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0, help="segundos")
+    parser.add_argument("--requests", type=int, help="encerra após N requisições")
+    parser.add_argument("--warmup", type=int, default=20, help="requisições descartadas")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="pesos por rota: " + ",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+    )
+    parser.add_argument("--batch-size", type=int, default=10, help="itens do post_batch")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--headless", action="store_true", help="modo CI")
+    parser.add_argument("--slo", action="append", default=[], metavar="[ROTA.]CHAVE=LIMITE")
+    parser.add_argument("--slo-file", help="JSON {escopo: {chave: limite}}")
+    parser.add_argument("--output", metavar="PATH", help="salva o relatório em JSON")
+    args = parser.parse_args()
+
+    slos: Dict[str, Dict[str, float]] = {}
+    if args.slo_file:
+        with open(args.slo_file, encoding="utf-8") as f:
+            slos = json.load(f)
+    for scope, limits in parse_slos(args.slo).items():
+        slos.setdefault(scope, {}).update(limits)
+
+    warnings.filterwarnings("ignore", category=UserWarning)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    # As mensagens da stack (moto, api_mock) vão para o stderr: no modo headless
+    # o stdout traz apenas o relatório JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_with_stack(args)
+
+    report["target"] = args.target
+    report["slos"] = slos
+    report["violations"] = check_slos(report, slos)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+
+    if args.headless:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report)
+
+    if report["violations"]:
+        print(f"\nSLOs violados ({len(report['violations'])}):", file=sys.stderr)
+        for violation in report["violations"]:
+            print(f"  {violation}", file=sys.stderr)
+        sys.exit(1)
+    if slos:
+        print("\nTodos os SLOs atendidos", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,62 @@
-from src.models.passenger_request import PassengerRequest
-from src.models.error_response import StandardErrorResponse
-from src.services.predict_service import PredictionService
-from src.models.api_response import HealthResponse
-from src.controllers.passenger_controller import PassengerController
-from src.middleware.health_check import HealthCheck
-from src.logging.custom_logging import get_logger
-from src.adapter.http_adapter import HTTPAdapter
-from pydantic import ValidationError
+from src.metrics import cold_start
 
+# Dependências pesadas importadas primeiro, com o tempo de cada uma medido
+for _module_name in ("pydantic", "numpy", "boto3"):
+    cold_start.time_import(_module_name)
 
-prediction_service = PredictionService(model_name="model", method="joblib")
-passenger_controller = PassengerController(prediction_service=prediction_service)
+with cold_start.phase("import_app"):
+    from src.models.passenger_request import iter_ndjson_lines, parse_passengers
+    from src.models.error_response import StandardErrorResponse
+    from src.services.model_registry import ModelRegistry
+    from src.services.batch_scheduler import InferenceScheduler
+    from src.models.api_response import HealthResponse
+    from src.controllers.passenger_controller import PassengerController
+    from src.middleware.health_check import HealthCheck
+    from src.logging.custom_logging import flush_logs, get_logger
+    from src.adapter.http_adapter import HTTPAdapter
+    from src.config.app_config import AppConfig
+    from src.metrics.timing import add_count, instrumented, set_property, stage
+    from src.repository.dynamodb_client import get_dynamodb_resource
+    from pydantic import ValidationError
 
 
+model_registry = ModelRegistry(
+    default_model="model",
+    method=AppConfig.get_model_method(),
+    memory_budget_mb=AppConfig.get_model_memory_budget_mb(),
+    cache_size=AppConfig.get_prediction_cache_size(),
+    cache_ttl=AppConfig.get_prediction_cache_ttl(),
+)
+with cold_start.phase("model_load"):
+    prediction_service = model_registry.get()
+with cold_start.phase("dynamodb_client"):
+    get_dynamodb_resource()
+with cold_start.phase("controller"):
+    # Só faz sentido em hosts com várias threads (ex.: Flask do api_mock.py);
+    # na Lambda cada instância atende uma requisição por vez
+    inference_scheduler = (
+        InferenceScheduler(
+            window_ms=AppConfig.get_inference_batch_window_ms(),
+            max_batch_size=AppConfig.get_inference_batch_max_size(),
+        )
+        if AppConfig.get_inference_batch_window_ms() > 0
+        else None
+    )
+    passenger_controller = PassengerController(
+        prediction_service=prediction_service,
+        model_registry=model_registry,
+        inference_scheduler=inference_scheduler,
+    )
+# Reaproveita o modelo e o repositório já criados; o resultado fica em cache
+health_check = HealthCheck(
+    prediction_service=prediction_service,
+    repository=passenger_controller.passenger_repository,
+)
+cold_start.finish()
+cold_start.log_once(get_logger())
+
+
+@instrumented
 def lambda_handler(event, _):
     """Função Lambda para lidar com requisições HTTP."""
     logger = get_logger()
@@ -20,6 +64,16 @@ def lambda_handler(event, _):
     try:
         http_adapter = HTTPAdapter(event)
         http_method = http_adapter.method
+        set_property("request_id", http_adapter.request_id)
+
+        # Modelo solicitado via ?model=v2 ou cabeçalho X-Model-Version
+        requested_model = http_adapter.query_parameters.get(
+            "model"
+        ) or http_adapter.get_header("X-Model-Version")
+        # Lido antes de remover os cabeçalhos do evento; define a compressão
+        accept_encoding = http_adapter.get_header("Accept-Encoding", "")
+        if_none_match = http_adapter.get_header("If-None-Match")
+        content_type = http_adapter.get_header("Content-Type", "")
 
         event.pop("headers")
 
@@ -29,14 +83,29 @@ def lambda_handler(event, _):
 
         match http_method:
             case "POST":
-                request_data = http_adapter.body
+                with stage("parse_body"):
+                    raw_body = http_adapter.raw_body
 
-                if isinstance(request_data, list):
-                    passengers = [PassengerRequest(**data) for data in request_data]
-                else:
-                    passengers = [PassengerRequest(**request_data)]
+                if content_type.split(";")[0].strip().lower() == "application/x-ndjson":
+                    # Um passageiro por linha, processado em blocos: cada linha
+                    # gera uma linha de resultado (inclusive as inválidas)
+                    results = passenger_controller.stream_passengers(
+                        iter_ndjson_lines(raw_body), model_name=requested_model
+                    )
+                    return http_adapter.build_ndjson_response(
+                        200,
+                        results,
+                        request_id=http_adapter.request_id,
+                        accept_encoding=accept_encoding,
+                    )
 
-                predictions = passenger_controller.save_passenger(passengers)
+                # O JSON é lido e validado em uma única passada pelo pydantic
+                with stage("validate"):
+                    passengers = parse_passengers(raw_body)
+
+                predictions = passenger_controller.save_passenger(
+                    passengers, model_name=requested_model
+                )
 
                 if len(predictions) == 1:
                     result = predictions[0].model_dump()
@@ -45,25 +114,39 @@ def lambda_handler(event, _):
                         result,
                         request_id=http_adapter.request_id,
                         message="Predição de sobrevivência realizada com sucesso",
+                        accept_encoding=accept_encoding,
                     )
                 else:
                     results = [p.model_dump() for p in predictions]
+                    # 207: parte dos itens não foi gravada (já existentes ou erro);
+                    # o status de cada um vem em data[i].status
+                    if all(p.status == "created" for p in predictions):
+                        status_code = 201
+                        message = "Predições de sobrevivência realizadas com sucesso"
+                    else:
+                        status_code = 207
+                        message = "Predições realizadas; alguns passageiros não foram salvos"
                     return http_adapter.build_standard_response(
-                        201,
+                        status_code,
                         results,
                         request_id=http_adapter.request_id,
-                        message="Predições de sobrevivência realizadas com sucesso",
+                        message=message,
+                        accept_encoding=accept_encoding,
                     )
 
             case "GET":
                 if http_adapter.path == "/health":
-                    health_check = HealthCheck()
-                    health_status = health_check.get_overall_health()
+                    deep = (
+                        http_adapter.query_parameters.get("deep", "").lower()
+                        == "true"
+                    )
+                    health_status = health_check.get_overall_health(deep=deep)
 
                     health_response = HealthResponse(
                         overall_status=health_status.get("overall_status", "unhealthy"),
                         components=health_status.get("components", {}),
                         uptime=health_status.get("uptime"),
+                        cold_start=cold_start.report(),
                     )
 
                     status_code = (
@@ -80,17 +163,24 @@ def lambda_handler(event, _):
                     )
 
                 elif http_adapter.path == "/sobreviventes":
+                    cursor = None
                     if http_adapter.query_parameters:
                         query_params = http_adapter.query_parameters
                         page = int(query_params.get("page", 1))
                         limit = int(query_params.get("limit", 10))
+                        cursor = query_params.get("cursor")
                     else:
                         page, limit = 1, 10
 
                     result = passenger_controller.get_all_passengers(
-                        page=page, limit=limit
+                        page=page, limit=limit, cursor=cursor, if_none_match=if_none_match
                     )
+                    add_count("items", len(result.get("items") or []))
 
+                    if result.get("not_modified"):
+                        return http_adapter.build_not_modified(
+                            result["etag"], request_id=http_adapter.request_id
+                        )
                     if result.get("items"):
                         response_data = {
                             "passengers": result["items"],
@@ -101,6 +191,8 @@ def lambda_handler(event, _):
                             response_data,
                             request_id=http_adapter.request_id,
                             message="Lista de passageiros recuperada com sucesso",
+                            accept_encoding=accept_encoding,
+                            etag=result.get("etag"),
                         )
                     else:
                         error_response = StandardErrorResponse.business_error(
@@ -123,8 +215,10 @@ def lambda_handler(event, _):
                             400, error_response, request_id=http_adapter.request_id
                         )
 
-                    passenger = passenger_controller.get_passenger_by_id(passenger_id)
-                    if not passenger:
+                    result = passenger_controller.get_passenger_if_modified(
+                        passenger_id, if_none_match=if_none_match
+                    )
+                    if not result:
                         error_response = StandardErrorResponse.business_error(
                             "Passageiro não encontrado", 404
                         )
@@ -132,11 +226,18 @@ def lambda_handler(event, _):
                             404, error_response, request_id=http_adapter.request_id
                         )
 
+                    if result["not_modified"]:
+                        return http_adapter.build_not_modified(
+                            result["etag"], request_id=http_adapter.request_id
+                        )
+
                     return http_adapter.build_standard_response(
                         200,
-                        passenger,
+                        result["passenger"],
                         request_id=http_adapter.request_id,
                         message="Dados do passageiro recuperados com sucesso",
+                        accept_encoding=accept_encoding,
+                        etag=result["etag"],
                     )
                 else:
                     error_response = StandardErrorResponse.business_error(
@@ -202,3 +303,6 @@ def lambda_handler(event, _):
             error_response,
             request_id=http_adapter.request_id,
         )
+    finally:
+        # A Lambda pode ser congelada logo após o retorno: garante a escrita dos logs
+        flush_logs()
@@ -0,0 +1,76 @@
+import gzip
+from typing import List, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele, apenas gzip é oferecido
+    brotli = None
+
+
+# Níveis escolhidos pelo custo de CPU: ganhos acima deles são marginais para JSON
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def supported_encodings() -> List[str]:
+    """Codificações disponíveis, da preferida para a menos preferida."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Escolhe a codificação da resposta a partir do cabeçalho Accept-Encoding.
+
+    Considera os pesos `q` (q=0 recusa a codificação) e o curinga `*`; em caso
+    de empate, vale a ordem de supported_encodings().
+
+    Args:
+        accept_encoding (Optional[str]): Valor do cabeçalho (ex.: "gzip, br;q=0.8").
+
+    Returns:
+        Optional[str]: 'br', 'gzip' ou None se nenhuma for aceita.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in supported_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Comprime o corpo com a codificação negociada.
+
+    Args:
+        data (bytes): Corpo original.
+        encoding (str): 'br' ou 'gzip'.
+
+    Returns:
+        bytes: Corpo comprimido.
+    """
+    if encoding == "gzip":
+        # mtime fixo: a mesma resposta gera sempre os mesmos bytes
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    raise ValueError(f"Codificação não suportada: '{encoding}'")
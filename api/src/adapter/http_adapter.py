@@ -1,10 +1,21 @@
+import base64
+import binascii
+import io
 import json
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 from pydantic import BaseModel
 from src.models.api_response import StandardSuccessResponse, APIMetadata, HealthResponse
 from src.models.error_response import StandardErrorResponse
+from src.adapter.compression import compress, negotiate_encoding
+from src.mapper.etag import encoded_etag
+from src.config.app_config import AppConfig
+from src.metrics.timing import stage, timed
+
+# Equivale a json.dumps(..., ensure_ascii=False, default=str), mas sem criar um
+# JSONEncoder novo a cada resposta
+_json_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
 
 
 class HTTPAdapter:
@@ -50,6 +61,14 @@ class HTTPAdapter:
         """Retorna os cabeçalhos da requisição."""
         return self._event.get("headers") or {}
 
+    def get_header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Retorna o valor de um cabeçalho, ignorando maiúsculas/minúsculas."""
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return default
+
     @property
     def query_parameters(self) -> Dict[str, str]:
         """Retorna os parâmetros de consulta (query) como um dicionário."""
@@ -65,8 +84,6 @@ class HTTPAdapter:
             raw_body = self._event.get("body")
             if raw_body:
                 if self._event.get("isBase64Encoded", False):
-                    import base64
-
                     try:
                         raw_body = base64.b64decode(raw_body).decode("utf-8")
                     except Exception:
@@ -82,6 +99,21 @@ class HTTPAdapter:
                 self._body = {}
         return self._body
 
+    @property
+    def raw_body(self) -> Any:
+        """
+        Retorna o corpo sem decodificar o JSON, para validação direta (ver
+        parse_passengers). Corpos em base64 são devolvidos como bytes; corpo
+        vazio ou base64 inválido retorna None.
+        """
+        raw_body = self._event.get("body")
+        if raw_body and self._event.get("isBase64Encoded", False):
+            try:
+                return base64.b64decode(raw_body)
+            except (binascii.Error, ValueError):
+                return None
+        return raw_body or None
+
     @property
     def stage(self) -> Optional[str]:
         """Retorna o stage da API."""
@@ -105,22 +137,38 @@ class HTTPAdapter:
                 "Access-Control-Allow-Origin": "*",
             },
             "body": (
-                json.dumps(body_content, ensure_ascii=False, default=str)
+                _json_encoder.encode(body_content)
                 if body_content is not None
                 else None
             ),
         }
 
     @staticmethod
+    @timed("serialize")
     def build_standard_response(
         status_code: int,
         body_data: Any,
         request_id: Optional[str] = None,
         message: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+        etag: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Método estático para construir a resposta HTTP padronizada para API Gateway.
-        Converte modelos Pydantic para dicionários automaticamente.
+        Converte modelos Pydantic (ou listas deles) para dicionários automaticamente.
+
+        O payload é convertido uma única vez e encaixado no envelope já
+        serializado, sem passar de novo por StandardSuccessResponse.model_dump;
+        o JSON final é gerado por um único encode.
+
+        Com accept_encoding (o cabeçalho Accept-Encoding da requisição, "" se
+        ausente), a resposta varia conforme a codificação aceita: corpos a partir
+        de AppConfig.get_compression_min_bytes() são comprimidos (gzip ou br) e
+        devolvidos em base64 (isBase64Encoded).
+
+        Com etag, o ETag do recurso é enviado no cabeçalho ETag (ver
+        build_not_modified). Se o corpo for comprimido, a variante recebe um
+        ETag próprio (ver encoded_etag).
         """
         body_content = {}
         if isinstance(body_data, (StandardErrorResponse, HealthResponse)):
@@ -140,21 +188,124 @@ class HTTPAdapter:
                 }
                 message = message_map.get(status_code, "Operação concluída")
 
-            data = body_data.model_dump() if isinstance(body_data, BaseModel) else body_data
+            # Envelope pequeno (sem dados) montado pelo próprio modelo: mantém a
+            # ordem e os valores padrão dos campos
+            body_content = StandardSuccessResponse.model_construct(
+                message=message, metadata=metadata
+            ).model_dump()
+            body_content["data"] = HTTPAdapter._dump_data(body_data)
 
-            success_response = StandardSuccessResponse(
-                message=message, data=data, metadata=metadata
-            )
-            body_content = success_response.model_dump()
+        response = {
+            "statusCode": status_code,
+            "headers": HTTPAdapter._standard_headers(request_id),
+            "body": _json_encoder.encode(body_content),
+        }
+        if etag is not None:
+            response["headers"]["ETag"] = etag
+            response["headers"]["Access-Control-Expose-Headers"] = "ETag"
+        if accept_encoding is not None:
+            HTTPAdapter._compress(response, accept_encoding)
+            encoding = response["headers"].get("Content-Encoding")
+            if etag is not None and encoding is not None:
+                response["headers"]["ETag"] = encoded_etag(etag, encoding)
+        return response
+
+    @staticmethod
+    def build_ndjson_response(
+        status_code: int,
+        results: Iterable[BaseModel],
+        request_id: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Constrói uma resposta application/x-ndjson, com um JSON por linha.
+
+        Os resultados são consumidos um a um (podem vir de um gerador) e
+        escritos direto no corpo, sem lista intermediária. A integração proxy
+        do API Gateway não faz streaming, então o corpo é entregue de uma vez.
+
+        Args:
+            status_code (int): Código HTTP.
+            results (Iterable[BaseModel]): Resultados, na ordem das linhas.
+            request_id (Optional[str]): ID da requisição.
+            accept_encoding (Optional[str]): Cabeçalho Accept-Encoding (ver
+                build_standard_response).
+
+        Returns:
+            Dict[str, Any]: Resposta para o API Gateway.
+        """
+        body = io.StringIO()
+        for result in results:
+            body.write(result.model_dump_json())
+            body.write("\n")
 
+        headers = HTTPAdapter._standard_headers(request_id)
+        headers["Content-Type"] = "application/x-ndjson"
+        response = {"statusCode": status_code, "headers": headers, "body": body.getvalue()}
+        if accept_encoding is not None:
+            HTTPAdapter._compress(response, accept_encoding)
+        return response
+
+    @staticmethod
+    def build_not_modified(
+        etag: str, request_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Constrói a resposta 304 (sem corpo) para um If-None-Match atendido.
+
+        Args:
+            etag (str): ETag atual do recurso, repetido no cabeçalho.
+            request_id (Optional[str]): ID da requisição.
+
+        Returns:
+            Dict[str, Any]: Resposta para o API Gateway.
+        """
+        headers = HTTPAdapter._standard_headers(request_id)
+        del headers["Content-Type"]
+        headers["ETag"] = etag
+        headers["Access-Control-Expose-Headers"] = "ETag"
+        return {"statusCode": 304, "headers": headers, "body": ""}
+
+    @staticmethod
+    def _standard_headers(request_id: Optional[str]) -> Dict[str, str]:
+        """Cabeçalhos comuns às respostas padronizadas (JSON e CORS)."""
         return {
-            "statusCode": status_code,
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-                "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-                "X-Request-ID": request_id or str(uuid.uuid4()),
-            },
-            "body": json.dumps(body_content, ensure_ascii=False, default=str),
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match",
+            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+            "X-Request-ID": request_id or str(uuid.uuid4()),
         }
+
+    @staticmethod
+    def _compress(response: Dict[str, Any], accept_encoding: str) -> None:
+        """Comprime o corpo da resposta, se a codificação e o tamanho permitirem."""
+        response["headers"]["Vary"] = "Accept-Encoding"
+
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            return
+        body = response["body"].encode("utf-8")
+        if len(body) < AppConfig.get_compression_min_bytes():
+            return
+
+        with stage("compress"):
+            compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return
+
+        response["body"] = base64.b64encode(compressed).decode("ascii")
+        response["isBase64Encoded"] = True
+        response["headers"]["Content-Encoding"] = encoding
+
+    @staticmethod
+    def _dump_data(body_data: Any) -> Any:
+        """Converte o payload (modelo, lista de modelos ou dados simples) uma única vez."""
+        if isinstance(body_data, BaseModel):
+            return body_data.model_dump()
+        if isinstance(body_data, list):
+            return [
+                item.model_dump() if isinstance(item, BaseModel) else item
+                for item in body_data
+            ]
+        return body_data
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache em memória com tamanho máximo, descarte LRU e TTL opcional.
+    Seguro para uso concorrente (ex.: servidor Flask com threads).
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        Args:
+            max_size (int): Número máximo de entradas mantidas.
+            ttl (Optional[float]): Tempo de vida das entradas em segundos (None = sem expiração).
+            clock: Função de relógio (injetável para testes).
+        """
+        if max_size < 1:
+            raise ValueError("O tamanho máximo do cache deve ser maior que zero.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """Retorna o valor associado à chave, ou `default` se ausente ou expirado."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+
+                del self._data[key]
+                self.expirations += 1
+
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Armazena um valor, descartando a entrada menos usada se necessário.
+        `ttl` sobrescreve o TTL padrão apenas para esta entrada.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = (value, expires_at)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove e retorna a entrada associada à chave."""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        """Remove todas as entradas (os contadores são preservados)."""
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Proporção de acertos sobre o total de consultas."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna os contadores do cache para logs e métricas."""
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
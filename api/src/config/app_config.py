@@ -40,6 +40,110 @@ class AppConfig:
         """Retorna o método de carregamento do modelo."""
         return os.getenv("MODEL_METHOD", "joblib")
 
+    @classmethod
+    def get_model_memory_budget_mb(cls) -> float:
+        """Retorna o orçamento de memória (MB) para os modelos carregados."""
+        return float(os.getenv("MODEL_MEMORY_BUDGET_MB", "48"))
+
+    @classmethod
+    def get_prediction_cache_size(cls) -> int:
+        """Retorna o tamanho máximo do cache de predições (0 desativa)."""
+        return int(os.getenv("PREDICTION_CACHE_SIZE", "0"))
+
+    @classmethod
+    def get_prediction_cache_ttl(cls) -> Optional[float]:
+        """Retorna o TTL do cache de predições em segundos (None = sem expiração)."""
+        ttl = os.getenv("PREDICTION_CACHE_TTL")
+        return float(ttl) if ttl else None
+
+    @classmethod
+    def get_metrics_enabled(cls) -> bool:
+        """Indica se a linha de métricas EMF deve ser emitida a cada invocação."""
+        return os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    @classmethod
+    def get_passenger_cache_size(cls) -> int:
+        """Retorna o máximo de passageiros mantidos no cache de leitura (0 desativa)."""
+        return int(os.getenv("PASSENGER_CACHE_SIZE", "1024"))
+
+    @classmethod
+    def get_passenger_cache_ttl(cls) -> float:
+        """Retorna o TTL (s) dos passageiros no cache de leitura."""
+        return float(os.getenv("PASSENGER_CACHE_TTL", "300"))
+
+    @classmethod
+    def get_passenger_negative_cache_ttl(cls) -> float:
+        """Retorna o TTL (s) das buscas sem resultado no cache de leitura."""
+        return float(os.getenv("PASSENGER_NEGATIVE_CACHE_TTL", "5"))
+
+    @classmethod
+    def get_compression_min_bytes(cls) -> int:
+        """Retorna o tamanho mínimo (bytes) do corpo para comprimir a resposta."""
+        return int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+    @classmethod
+    def get_ndjson_chunk_size(cls) -> int:
+        """Retorna quantas linhas NDJSON são validadas, preditas e gravadas por vez."""
+        return int(os.getenv("NDJSON_CHUNK_SIZE", "500"))
+
+    @classmethod
+    def get_inference_batch_window_ms(cls) -> float:
+        """
+        Retorna a janela (ms) do micro-batching de predições entre requisições
+        concorrentes. 0 desativa o agrupamento.
+        """
+        return float(os.getenv("INFERENCE_BATCH_WINDOW_MS", "0"))
+
+    @classmethod
+    def get_inference_batch_max_size(cls) -> int:
+        """Retorna o máximo de passageiros por lote do micro-batching."""
+        return int(os.getenv("INFERENCE_BATCH_MAX_SIZE", "64"))
+
+    @classmethod
+    def get_health_cache_ttl(cls) -> float:
+        """Retorna por quanto tempo (s) o resultado do health check é reaproveitado."""
+        return float(os.getenv("HEALTH_CACHE_TTL", "10"))
+
+    @classmethod
+    def get_health_check_timeout(cls) -> float:
+        """Retorna o tempo máximo (s) de espera pelas verificações do health check."""
+        return float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+
+    @classmethod
+    def get_dynamodb_endpoint_url(cls) -> Optional[str]:
+        """Retorna um endpoint alternativo do DynamoDB (ex.: local), se definido."""
+        return os.getenv("DYNAMODB_ENDPOINT_URL") or None
+
+    @classmethod
+    def get_dynamodb_max_pool_connections(cls) -> int:
+        """Retorna o máximo de conexões HTTP mantidas no pool do cliente DynamoDB."""
+        return int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "10"))
+
+    @classmethod
+    def get_dynamodb_connect_timeout(cls) -> float:
+        """Retorna o timeout de conexão com o DynamoDB, em segundos."""
+        return float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "2"))
+
+    @classmethod
+    def get_dynamodb_read_timeout(cls) -> float:
+        """Retorna o timeout de leitura do DynamoDB, em segundos."""
+        return float(os.getenv("DYNAMODB_READ_TIMEOUT", "5"))
+
+    @classmethod
+    def get_dynamodb_max_attempts(cls) -> int:
+        """Retorna o total de tentativas por chamada ao DynamoDB."""
+        return int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "3"))
+
+    @classmethod
+    def get_dynamodb_retry_mode(cls) -> str:
+        """Retorna o modo de retry do botocore ('legacy', 'standard' ou 'adaptive')."""
+        return os.getenv("DYNAMODB_RETRY_MODE", "adaptive")
+
+    @classmethod
+    def get_dynamodb_tcp_keepalive(cls) -> bool:
+        """Indica se o TCP keepalive deve ser ativado nas conexões com o DynamoDB."""
+        return os.getenv("DYNAMODB_TCP_KEEPALIVE", "true").lower() in ("1", "true", "yes")
+
     @classmethod
     def is_production(cls) -> bool:
         """Verifica se está em ambiente de produção."""
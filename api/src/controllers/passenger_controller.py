@@ -1,45 +1,108 @@
-from typing import List, Dict, Any
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from src.services.predict_service import PredictionService
+from src.services.model_registry import ModelRegistry
+from src.services.batch_scheduler import InferenceScheduler
 from src.models.passenger_request import PassengerRequest
 from src.models.api_response import (
+    BulkPredictionResult,
+    InvalidLineResult,
     PredictionResult,
     PassengerDetail,
     DeleteResponse,
     PaginationInfo,
 )
-from src.repository.passenger_repository import PassengerRepository
+from src.repository.passenger_repository import (
+    PassengerRepository,
+    STATUS_CREATED,
+)
 from src.mapper.mapper import map_request_to_dynamodb_item
+from src.mapper.etag import (
+    ETAG_FIELD,
+    combine_etags,
+    compute_etag,
+    item_etag,
+    matched_etag,
+)
 from src.logging.custom_logging import get_logger
+from src.config.app_config import AppConfig
+from src.metrics.timing import add_count, stage
 from decimal import Decimal
+from pydantic import ValidationError
 import math
 
 
 class PassengerController:
-    def __init__(self, prediction_service: PredictionService):
+    def __init__(
+        self,
+        prediction_service: PredictionService,
+        model_registry: Optional[ModelRegistry] = None,
+        inference_scheduler: Optional[InferenceScheduler] = None,
+    ):
         self.prediction_service = prediction_service
+        self.model_registry = model_registry
+        # Agrupa as predições de requisições concorrentes (None = chamada direta)
+        self.inference_scheduler = inference_scheduler
         self.passenger_repository = PassengerRepository()
         self.logger = get_logger()
 
+    def _get_prediction_service(
+        self, model_name: Optional[str] = None
+    ) -> PredictionService:
+        """Retorna o serviço do modelo solicitado ou o serviço padrão."""
+        if not model_name or model_name == self.prediction_service.model_name:
+            return self.prediction_service
+        if self.model_registry is None:
+            raise ValueError(f"Modelo '{model_name}' não encontrado")
+        return self.model_registry.get(model_name)
+
     def save_passenger(
-        self, passengers_data: List[PassengerRequest]
+        self,
+        passengers_data: List[PassengerRequest],
+        model_name: Optional[str] = None,
     ) -> List[PredictionResult]:
-        """Salva os dados do passageiro e retorna a predição de sobrevivência estruturada."""
+        """
+        Salva os dados do passageiro e retorna a predição de sobrevivência estruturada.
+
+        Com um único passageiro, um ID já existente gera ValueError. Em lotes, os
+        itens são gravados de forma independente e o retorno traz um
+        BulkPredictionResult por item, com o status da gravação ('created',
+        'exists' ou 'error'); itens já gravados não são desfeitos.
+        """
         try:
             result = []
 
             self.logger.info("Iniciando o salvamento dos passageiros.")
 
-            for passenger_request in passengers_data:
-                passenger = map_request_to_dynamodb_item(passenger_request)
-                survival_prob = self.prediction_service.predict(passenger)
+            prediction_service = self._get_prediction_service(model_name)
+            model_version = prediction_service.model_name
 
-                passenger["survival_probability"] = Decimal(str(survival_prob))
+            # Uma única chamada ao modelo para todo o lote
+            with stage("predict"):
+                survival_probs = self._predict_batch(
+                    prediction_service, passengers_data
+                )
+            add_count("items", len(passengers_data))
 
-                self.passenger_repository.save(passenger)
+            passengers = [
+                self._to_item(passenger_request, survival_prob, model_version)
+                for passenger_request, survival_prob in zip(
+                    passengers_data, survival_probs
+                )
+            ]
 
+            with stage("persist"):
+                if len(passengers) == 1:
+                    self.passenger_repository.save(passengers[0])
+                else:
+                    outcomes = self.passenger_repository.save_many(passengers)
+                    return self._bulk_results(outcomes, survival_probs, model_version)
+
+            for passenger, survival_prob in zip(passengers, survival_probs):
                 prediction_result = PredictionResult.from_probability(
                     passenger_id=passenger.get("passenger_id", "unknown"),
                     probability=float(survival_prob),
+                    model_version=model_version,
                 )
 
                 result.append(prediction_result)
@@ -55,10 +118,168 @@ class PassengerController:
             self.logger.error(f"Erro inesperado: {str(e)}")
             raise Exception(f"Erro inesperado: {str(e)}")
 
-    def get_all_passengers(self, page: int = 1, limit: int = 10) -> Dict[str, Any]:
-        """Recupera todos os passageiros do repositório com paginação estruturada."""
+    def _predict_batch(
+        self, prediction_service: PredictionService, passengers: List[Any]
+    ) -> List[float]:
+        """Prediz o lote, pelo micro-batching quando configurado."""
+        if self.inference_scheduler is None:
+            return prediction_service.predict_batch(passengers)
+        return self.inference_scheduler.predict_batch(prediction_service, passengers)
+
+    @staticmethod
+    def _to_item(
+        passenger_request: PassengerRequest, survival_prob: float, model_version: str
+    ) -> Dict[str, Any]:
+        """Monta o item do DynamoDB com a predição e o ETag do conteúdo."""
+        passenger = map_request_to_dynamodb_item(passenger_request)
+
+        passenger["survival_probability"] = Decimal(str(survival_prob))
+        passenger["model_version"] = model_version
+        # Gravado com o item: leituras não precisam recalcular o hash
+        passenger[ETAG_FIELD] = compute_etag(passenger)
+        return passenger
+
+    @staticmethod
+    def _bulk_result(
+        outcome: Dict[str, Any], survival_prob: float, model_version: str
+    ) -> BulkPredictionResult:
+        """Combina a predição de um item com o seu resultado em save_many."""
+        prediction = PredictionResult.from_probability(
+            passenger_id=outcome["passenger_id"],
+            probability=float(survival_prob),
+            model_version=model_version,
+        )
+        return BulkPredictionResult(
+            **prediction.model_dump(),
+            status=outcome["status"],
+            error=outcome.get("error"),
+        )
+
+    def _bulk_results(
+        self,
+        outcomes: List[Dict[str, Any]],
+        survival_probs: List[float],
+        model_version: str,
+    ) -> List[BulkPredictionResult]:
+        """Combina as predições com o resultado por item de save_many."""
+        results = [
+            self._bulk_result(outcome, survival_prob, model_version)
+            for outcome, survival_prob in zip(outcomes, survival_probs)
+        ]
+
+        created = sum(1 for o in outcomes if o["status"] == STATUS_CREATED)
+        if created < len(outcomes):
+            self.logger.warning(
+                f"Inclusão em lote parcial: {created}/{len(outcomes)} passageiros salvos"
+            )
+        else:
+            self.logger.info("Todos os passageiros foram salvos com sucesso.")
+        return results
+
+    def stream_passengers(
+        self,
+        lines: Iterable[Tuple[int, Any]],
+        model_name: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Union[BulkPredictionResult, InvalidLineResult]]:
+        """
+        Valida, prediz e grava passageiros NDJSON em blocos de tamanho fixo.
+
+        É um gerador: cada bloco de `chunk_size` linhas é validado, predito com
+        uma única chamada ao modelo e gravado com save_many antes de a próxima
+        linha ser lida, então a memória usada não cresce com o tamanho do corpo.
+        Cada linha gera um resultado, na ordem de entrada: BulkPredictionResult
+        para linhas válidas e InvalidLineResult para as inválidas, que não
+        interrompem o processamento.
+
+        Args:
+            lines: Pares (número da linha, JSON da linha), ex.: iter_ndjson_lines.
+            model_name: Modelo solicitado (padrão: o modelo carregado).
+            chunk_size: Linhas por bloco. Padrão: AppConfig.get_ndjson_chunk_size().
+
+        Yields:
+            Union[BulkPredictionResult, InvalidLineResult]: Resultado de cada linha.
+        """
+        prediction_service = self._get_prediction_service(model_name)
+        chunk_size = max(1, chunk_size or AppConfig.get_ndjson_chunk_size())
+
+        lines = iter(lines)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield from self._score_chunk(chunk, prediction_service)
+
+    def _score_chunk(
+        self, chunk: List[Tuple[int, Any]], prediction_service: PredictionService
+    ) -> Iterator[Union[BulkPredictionResult, InvalidLineResult]]:
+        """Processa um bloco de linhas NDJSON (ver stream_passengers)."""
+        model_version = prediction_service.model_name
+
+        with stage("validate"):
+            parsed = []
+            for line_number, line in chunk:
+                try:
+                    parsed.append(PassengerRequest.model_validate_json(line))
+                except ValidationError as e:
+                    parsed.append(
+                        InvalidLineResult(
+                            line=line_number, error=self._describe_errors(e)
+                        )
+                    )
+        valid = [p for p in parsed if isinstance(p, PassengerRequest)]
+        add_count("items", len(chunk))
+
+        with stage("predict"):
+            survival_probs = prediction_service.predict_batch(valid)
+        items = [
+            self._to_item(passenger_request, survival_prob, model_version)
+            for passenger_request, survival_prob in zip(valid, survival_probs)
+        ]
+        with stage("persist"):
+            outcomes = self.passenger_repository.save_many(items) if items else []
+
+        results = iter(zip(outcomes, survival_probs))
+        for entry in parsed:
+            if isinstance(entry, InvalidLineResult):
+                yield entry
+            else:
+                outcome, survival_prob = next(results)
+                yield self._bulk_result(outcome, survival_prob, model_version)
+
+    @staticmethod
+    def _describe_errors(error: ValidationError) -> str:
+        """Resume os erros de validação em uma linha ('campo: mensagem; ...')."""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+            if item["loc"]
+            else item["msg"]
+            for item in error.errors()
+        )
+
+    def get_all_passengers(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Recupera todos os passageiros do repositório com paginação estruturada.
+        Aceita tanto o número da página quanto o token de continuação `cursor`.
+
+        Com `cursor`, o número da página não é conhecido: a paginação volta com
+        'page' None e a navegação é só para frente ('has_previous' False).
+
+        O retorno traz o ETag da página em 'etag'. Se ele estiver em
+        `if_none_match`, os itens não são convertidos e o retorno vem com
+        'not_modified' True e sem itens.
+        """
         try:
-            result = self.passenger_repository.get_all(page=page, limit=limit)
+            result = self.passenger_repository.get_all(
+                page=page, limit=limit, cursor=cursor
+            )
+            current_page = None if cursor else page
 
             # Compatibilidade com repositórios que retornam apenas lista
             if isinstance(result, list):
@@ -68,7 +289,7 @@ class PassengerController:
                 return {
                     "items": [],
                     "pagination": PaginationInfo(
-                        page=page,
+                        page=current_page,
                         limit=limit,
                         total_items=0,
                         total_pages=0,
@@ -79,79 +300,87 @@ class PassengerController:
             else:
                 items = result["items"]
                 total_items = result.get("total_count", len(items))
+            next_cursor = result.get("next_cursor") if isinstance(result, dict) else None
+
+            # ETag da página: muda se qualquer item, o total ou o cursor mudar
+            etag = combine_etags(
+                (item_etag(item) for item in items),
+                page,
+                limit,
+                cursor,
+                total_items,
+                next_cursor,
+            )
+            matched = matched_etag(if_none_match, etag)
+            if matched is not None:
+                # O cliente já tem esta página: nada a converter nem serializar.
+                # O 304 repete o validador da variante que o cliente tem
+                return {"items": [], "pagination": None, "etag": matched, "not_modified": True}
 
             # Converter itens para PassengerDetail
-            passenger_details = []
-            for item in items:
-                detail = PassengerDetail(
-                    passenger_id=item.get("passenger_id", ""),
-                    survival_probability=float(item.get("survival_probability", 0)),
-                    prediction=(
-                        "survived"
-                        if float(item.get("survival_probability", 0)) >= 0.5
-                        else "not_survived"
-                    ),
-                    confidence_level=self._get_confidence_level(
-                        float(item.get("survival_probability", 0))
-                    ),
-                    passenger_class=int(item.get("pclass", 0)),
-                    sex=item.get("sex", ""),
-                    age=float(item["age"]) if item.get("age") is not None else None,
-                    siblings_spouses=int(item.get("sibsp", 0)),
-                    parents_children=int(item.get("parch", 0)),
-                    fare=float(item["fare"]) if item.get("fare") is not None else None,
-                    embarked=item.get("embarked"),
-                    created_at=item.get("created_at"),
-                )
-                passenger_details.append(detail.model_dump())
+            passenger_details = [self._to_detail(item) for item in items]
 
             total_pages = math.ceil(total_items / limit) if total_items > 0 else 0
 
             pagination = PaginationInfo(
-                page=page,
+                page=current_page,
                 limit=limit,
                 total_items=total_items,
                 total_pages=total_pages,
-                has_next=page < total_pages,
-                has_previous=page > 1,
+                has_next=bool(next_cursor) if cursor else page < total_pages,
+                has_previous=not cursor and page > 1,
+                next_cursor=next_cursor,
             )
 
-            return {"items": passenger_details, "pagination": pagination.model_dump()}
+            return {
+                "items": passenger_details,
+                "pagination": pagination.model_dump(),
+                "etag": etag,
+            }
 
+        except ValueError as ve:
+            self.logger.error(f"Erro de validação: {str(ve)}")
+            raise ValueError(f"Erro de validação: {str(ve)}")
         except Exception as e:
             self.logger.error(f"Erro ao recuperar passageiros: {str(e)}")
             raise Exception(f"Erro ao recuperar passageiros: {str(e)}")
 
     def get_passenger_by_id(self, passenger_id: str) -> Dict[str, Any]:
         """Recupera um passageiro pelo ID com formato estruturado."""
+        result = self.get_passenger_if_modified(passenger_id)
+        return result["passenger"] if result else None
+
+    def get_passenger_if_modified(
+        self, passenger_id: str, if_none_match: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Recupera um passageiro pelo ID junto com seu ETag (gravado com o item).
+
+        Args:
+            passenger_id (str): ID do passageiro.
+            if_none_match (Optional[str]): Cabeçalho If-None-Match da requisição.
+
+        Returns:
+            Optional[Dict[str, Any]]: None se o passageiro não existir; senão
+            dict com 'etag', 'not_modified' e 'passenger' (None quando o ETag
+            está em `if_none_match`, sem converter o item).
+        """
         try:
             item = self.passenger_repository.get_by_id(passenger_id)
 
             if not item:
                 return None
 
-            detail = PassengerDetail(
-                passenger_id=item.get("passenger_id", ""),
-                survival_probability=float(item.get("survival_probability", 0)),
-                prediction=(
-                    "survived"
-                    if float(item.get("survival_probability", 0)) >= 0.5
-                    else "not_survived"
-                ),
-                confidence_level=self._get_confidence_level(
-                    float(item.get("survival_probability", 0))
-                ),
-                passenger_class=int(item.get("pclass", 0)),
-                sex=item.get("sex", ""),
-                age=float(item["age"]) if item.get("age") is not None else None,
-                siblings_spouses=int(item.get("sibsp", 0)),
-                parents_children=int(item.get("parch", 0)),
-                fare=float(item["fare"]) if item.get("fare") is not None else None,
-                embarked=item.get("embarked"),
-                created_at=item.get("created_at"),
-            )
+            etag = item_etag(item)
+            matched = matched_etag(if_none_match, etag)
+            if matched is not None:
+                return {"etag": matched, "not_modified": True, "passenger": None}
 
-            return detail.model_dump()
+            return {
+                "etag": etag,
+                "not_modified": False,
+                "passenger": self._to_detail(item),
+            }
 
         except Exception as e:
             self.logger.error(
@@ -161,6 +390,25 @@ class PassengerController:
                 f"Erro ao recuperar passageiro com ID {passenger_id}: {str(e)}"
             )
 
+    def _to_detail(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Converte um item do DynamoDB no dict de PassengerDetail."""
+        survival_probability = float(item.get("survival_probability", 0))
+        return PassengerDetail(
+            passenger_id=item.get("passenger_id", ""),
+            survival_probability=survival_probability,
+            prediction="survived" if survival_probability >= 0.5 else "not_survived",
+            confidence_level=self._get_confidence_level(survival_probability),
+            passenger_class=int(item.get("pclass", 0)),
+            sex=item.get("sex", ""),
+            age=float(item["age"]) if item.get("age") is not None else None,
+            siblings_spouses=int(item.get("sibsp", 0)),
+            parents_children=int(item.get("parch", 0)),
+            fare=float(item["fare"]) if item.get("fare") is not None else None,
+            embarked=item.get("embarked"),
+            created_at=item.get("created_at"),
+            model_version=item.get("model_version"),
+        ).model_dump()
+
     def delete_passenger(self, passenger_id: str) -> DeleteResponse:
         """Exclui um passageiro pelo ID com resposta estruturada."""
         try:
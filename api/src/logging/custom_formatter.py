@@ -23,7 +23,8 @@ class CustomFormatter(Formatter):
             "function": record.funcName,
             "line": record.lineno,
             "module": record.module,
-            "message": str(record.msg),
+            # Mensagens em dicionário são mantidas estruturadas no JSON
+            "message": record.msg if isinstance(record.msg, dict) else str(record.msg),
         }
 
         if record.exc_info:
@@ -36,4 +37,4 @@ class CustomFormatter(Formatter):
                 ),
             }
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return json.dumps(log_data, ensure_ascii=False, default=str)
@@ -1,57 +1,167 @@
-from logging import FileHandler, Logger, StreamHandler, getLogger
-from logging import INFO
+import atexit
+import os
+from logging import FileHandler, Handler, Logger, StreamHandler, getLogger
+from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 from src.logging.custom_formatter import CustomFormatter
-from uuid import uuid4
+from src.config.app_config import AppConfig
 from os import path, makedirs
 from datetime import datetime
+from threading import Lock
+from time import monotonic
+from typing import Dict, Optional, Tuple
 
 
-def get_logger(type_logger="console", level=INFO) -> Logger:
-    """
-    Cria um logger configurado com um manipulador de arquivo e um formatador customizado.
-    O logger é configurado para registrar mensagens de nível INFO e superior.
-    Se o tipo de logger for 'console', o logger será configurado para registrar mensagens
-    no console. Caso contrário, o logger será configurado para registrar mensagens em um
-    arquivo chamado 'app.log' na pasta 'logs'.
-    Se a pasta 'logs' não existir, ela será criada automaticamente.
-    O logger é identificado por um UUID único gerado a cada chamada da função.
-    O logger é configurado para sempre incluir informações de exceção (exc_info=True) nas mensagens de erro,
-    exceção e críticas.
+LOGGER_NAME = "titanic-survival-api"
 
-    Args:
-        type_logger (str): Tipo de logger ('console' ou 'file'). Se None ou não especificado,
-            o logger será configurado apenas para arquivo.
-        level (int): Nível de log. O padrão é INFO.
-            Outros níveis disponíveis incluem DEBUG, WARNING, ERROR e CRITICAL.
+# Loggers já configurados, por tipo ('console' ou 'file'), com a fila e o
+# listener de cada um. Criados uma única vez por processo.
+_loggers: Dict[str, Logger] = {}
+_listeners: Dict[str, Tuple[Queue, QueueListener]] = {}
+_lock = Lock()
 
-    Returns:
-        logging.Logger: Instância do logger configurado.
+
+class _DeferredQueueHandler(QueueHandler):
     """
-    formatter = CustomFormatter()
-    logger = getLogger(str(uuid4()))
+    QueueHandler que só interpola a mensagem na thread da requisição.
 
-    logger.propagate = False
+    O QueueHandler padrão formata o registro antes de enfileirá-lo e descarta
+    exc_info; aqui a formatação JSON (inclusive do traceback) fica toda com o
+    listener, fora do caminho da requisição.
+    """
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    def prepare(self, record: LogRecord) -> LogRecord:
+        # Dicionários são escritos como JSON estruturado. Vai para a fila uma
+        # cópia rasa: o chamador pode alterar o original antes do listener
+        # escrevê-lo
+        if isinstance(record.msg, dict) and not record.args:
+            record.msg = dict(record.msg)
+            return record
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-    logger.propagate = False
 
+def _build_handler(type_logger: str, level) -> Handler:
+    """Cria o handler de saída (console ou arquivo) usado pelo listener."""
     if type_logger == "console":
         handler = StreamHandler()
-        handler.setLevel(level)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
     else:
         if not path.exists("./logs"):
             makedirs("./logs")
 
         filename = f"./logs/app_{datetime.now().strftime('%Y-%m-%d')}.log"
-
         handler = FileHandler(filename=filename, encoding="utf-8")
-        handler.setLevel(level)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
 
-    return logger
+    handler.setLevel(level)
+    handler.setFormatter(CustomFormatter())
+    return handler
+
+
+def get_logger(type_logger: Optional[str] = None, level=None) -> Logger:
+    """
+    Retorna o logger da aplicação, criado uma única vez por processo.
+
+    As mensagens são apenas enfileiradas na thread que as registra (QueueHandler);
+    um QueueListener em segundo plano aplica o CustomFormatter (JSON) e faz a
+    escrita no console ou no arquivo 'logs/app_<data>.log'. Chamadas repetidas
+    retornam o mesmo logger, sem criar novos loggers ou handlers.
+
+    Args:
+        type_logger (str): Tipo de logger ('console' ou 'file').
+            Padrão: AppConfig.get_log_type().
+        level (int | str): Nível de log. Padrão: AppConfig.get_log_level().
+
+    Returns:
+        logging.Logger: Instância compartilhada do logger.
+    """
+    type_logger = type_logger or AppConfig.get_log_type()
+    if type_logger != "console":
+        type_logger = "file"
+
+    logger = _loggers.get(type_logger)
+    if logger is not None:
+        return logger
+
+    with _lock:
+        logger = _loggers.get(type_logger)
+        if logger is not None:
+            return logger
+
+        level = level or AppConfig.get_log_level()
+        name = LOGGER_NAME if type_logger == "console" else f"{LOGGER_NAME}.file"
+        logger = getLogger(name)
+        logger.propagate = False
+        logger.setLevel(level)
+
+        if logger.hasHandlers():
+            logger.handlers.clear()
+
+        log_queue: Queue = Queue()
+        listener = QueueListener(
+            log_queue, _build_handler(type_logger, level), respect_handler_level=True
+        )
+        listener.start()
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+
+        _listeners[type_logger] = (log_queue, listener)
+        _loggers[type_logger] = logger
+        return logger
+
+
+def flush_logs(timeout: float = 1.0) -> bool:
+    """
+    Aguarda o listener escrever as mensagens já enfileiradas.
+
+    Usado ao fim de cada invocação da Lambda, que pode ser congelada logo após
+    retornar. Como o listener trabalha em paralelo à requisição, a fila
+    costuma estar vazia ou quase vazia neste ponto.
+
+    Returns:
+        bool: False se o tempo limite acabou antes de a fila esvaziar.
+    """
+    deadline = monotonic() + timeout
+    for log_queue, _ in list(_listeners.values()):
+        with log_queue.all_tasks_done:
+            while log_queue.unfinished_tasks:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                log_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Escreve as mensagens pendentes e encerra os listeners no fim do processo."""
+    for _, listener in list(_listeners.values()):
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+def _restart_after_fork() -> None:
+    """
+    Recria filas e listeners no processo filho após um fork (ex.: pool de
+    workers do batch scoring): a thread do listener não é copiada e a fila
+    herdada pode estar com o lock travado, então as mensagens do filho ficariam
+    presas na fila para sempre.
+    """
+    global _lock
+    _lock = Lock()
+    for type_logger, (_, listener) in list(_listeners.items()):
+        log_queue: Queue = Queue()
+        new_listener = QueueListener(
+            log_queue, *listener.handlers, respect_handler_level=True
+        )
+        new_listener.start()
+        for handler in _loggers[type_logger].handlers:
+            if isinstance(handler, QueueHandler):
+                handler.queue = log_queue
+        _listeners[type_logger] = (log_queue, new_listener)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
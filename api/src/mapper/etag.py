@@ -0,0 +1,103 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional
+
+# Atributo do item no DynamoDB que guarda o ETag calculado na gravação
+ETAG_FIELD = "etag"
+
+# Codificações cujas variantes recebem ETag próprio (ver encoded_etag)
+_ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def _digest(payload: str) -> str:
+    """ETag forte (entre aspas) a partir do conteúdo serializado."""
+    return '"' + hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def compute_etag(item: Dict[str, Any]) -> str:
+    """
+    Calcula o ETag de um item: hash do conteúdo gravado, com as chaves ordenadas.
+
+    Args:
+        item (Dict[str, Any]): Item do DynamoDB (o próprio atributo etag é ignorado).
+
+    Returns:
+        str: ETag forte, ex.: '"3f2a..."'.
+    """
+    content = {key: value for key, value in item.items() if key != ETAG_FIELD}
+    return _digest(
+        json.dumps(content, sort_keys=True, default=str, separators=(",", ":"))
+    )
+
+
+def item_etag(item: Dict[str, Any]) -> str:
+    """
+    Retorna o ETag persistido com o item. Itens gravados antes do atributo
+    existir têm o hash calculado na leitura (estável, pois o item não muda).
+    """
+    return item.get(ETAG_FIELD) or compute_etag(item)
+
+
+def combine_etags(etags: Iterable[str], *parts: Any) -> str:
+    """
+    ETag de uma coleção: combina os ETags dos itens, na ordem, com os dados
+    que também definem a representação (ex.: página, limite e total).
+    """
+    return _digest(json.dumps([list(etags), parts], default=str, separators=(",", ":")))
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    ETag da variante comprimida: os bytes diferem da representação sem
+    codificação, então o validador forte também precisa ser outro (RFC 9110).
+
+    Ex.: '"3f2a..."' com 'gzip' -> '"3f2a...-gzip"'.
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_encoding(etag: str) -> str:
+    """Remove o sufixo de codificação adicionado por encoded_etag."""
+    for suffix in _ENCODING_SUFFIXES:
+        if etag.endswith(f'{suffix}"'):
+            return f'{etag[: -len(suffix) - 1]}"'
+    return etag
+
+
+def matched_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    Procura o ETag atual no cabeçalho If-None-Match.
+
+    Segue a comparação fraca do RFC 9110 (o prefixo W/ é ignorado), aceita
+    o curinga `*` e reconhece as variantes comprimidas (encoded_etag).
+
+    Args:
+        if_none_match (Optional[str]): Valor do cabeçalho (ex.: '"a", W/"b-gzip"').
+        etag (str): ETag atual do recurso.
+
+    Returns:
+        Optional[str]: O validador do cliente que corresponde ao atual (com o
+        sufixo da variante, a ser repetido no 304), ou None.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if _strip_encoding(candidate) == etag:
+            return candidate
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica se o ETag atual (ou uma variante comprimida dele) está no
+    cabeçalho If-None-Match (ver matched_etag).
+
+    Returns:
+        bool: True se o cliente já tem a representação atual.
+    """
+    return matched_etag(if_none_match, etag) is not None
@@ -0,0 +1,67 @@
+import importlib
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterator, Optional
+
+# Marco zero do INIT: este módulo é o primeiro importado pelo handler
+_init_start = perf_counter()
+_init_end: Optional[float] = None
+_modules_at_start = len(sys.modules)
+
+_imports: Dict[str, float] = {}
+_phases: Dict[str, float] = {}
+_logged = False
+
+
+def time_import(module_name: str) -> Any:
+    """
+    Importa um módulo medindo o tempo de importação (inclui as dependências
+    ainda não carregadas). Se o módulo já estava carregado, o custo é ~0.
+    """
+    start = perf_counter()
+    module = importlib.import_module(module_name)
+    _imports[module_name] = (perf_counter() - start) * 1000
+    return module
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Mede uma etapa do INIT (ex.: carga do modelo, criação do repositório)."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _phases[name] = (perf_counter() - start) * 1000
+
+
+def finish() -> None:
+    """Marca o fim do INIT (chamado ao final da importação do handler)."""
+    global _init_end
+    if _init_end is None:
+        _init_end = perf_counter()
+
+
+def report() -> Dict[str, Any]:
+    """
+    Relatório do cold start do container: tempo de importação por módulo, tempo
+    de cada etapa da inicialização e a duração total do INIT medida pelo handler.
+    """
+    end = _init_end if _init_end is not None else perf_counter()
+    return {
+        "init_total_ms": round((end - _init_start) * 1000, 3),
+        "imports_ms": {name: round(ms, 3) for name, ms in _imports.items()},
+        "phases_ms": {name: round(ms, 3) for name, ms in _phases.items()},
+        "modules_loaded": len(sys.modules) - _modules_at_start,
+        "python_version": sys.version.split()[0],
+    }
+
+
+def log_once(logger) -> bool:
+    """Registra o relatório como JSON estruturado, uma única vez por container."""
+    global _logged
+    if _logged:
+        return False
+    _logged = True
+    logger.info({"event": "cold_start_report", **report()})
+    return True
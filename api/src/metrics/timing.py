@@ -0,0 +1,176 @@
+import json
+import sys
+import time
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+from src.config.app_config import AppConfig
+
+
+NAMESPACE = "TitanicSurvivalApi"
+
+# Primeira invocação do container (cold start)
+_cold_start = True
+
+_current: ContextVar[Optional["InvocationMetrics"]] = ContextVar(
+    "invocation_metrics", default=None
+)
+
+
+class InvocationMetrics:
+    """
+    Métricas de uma invocação: duração acumulada por etapa (ms), contagens e
+    propriedades. Serializada como uma linha no CloudWatch Embedded Metric Format.
+    """
+
+    __slots__ = ("route", "cold_start", "stages", "counts", "properties", "_start")
+
+    def __init__(self, route: str, cold_start: bool):
+        self.route = route
+        self.cold_start = cold_start
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.properties: Dict[str, Any] = {}
+        self._start = perf_counter()
+
+    def add_duration(self, name: str, elapsed_ms: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed_ms
+
+    def add_count(self, name: str, value: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def to_emf(self) -> Dict[str, Any]:
+        """Monta o documento EMF com as etapas, contagens e a duração total."""
+        self.stages["total"] = (perf_counter() - self._start) * 1000
+
+        metrics = [
+            {"Name": f"{name}_ms", "Unit": "Milliseconds"} for name in self.stages
+        ]
+        metrics.extend({"Name": name, "Unit": "Count"} for name in self.counts)
+
+        document: Dict[str, Any] = {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": NAMESPACE,
+                        "Dimensions": [["route", "cold_start"]],
+                        "Metrics": metrics,
+                    }
+                ],
+            },
+            "route": self.route,
+            "cold_start": "true" if self.cold_start else "false",
+        }
+        document.update(self.properties)
+        document.update(
+            {f"{name}_ms": round(value, 3) for name, value in self.stages.items()}
+        )
+        document.update(self.counts)
+        return document
+
+
+def current_metrics() -> Optional[InvocationMetrics]:
+    """Métricas da invocação em andamento, ou None fora de uma invocação."""
+    return _current.get()
+
+
+class stage:
+    """
+    Context manager que mede a duração de um bloco e a soma à etapa `name` da
+    invocação atual. Fora de uma invocação instrumentada não mede nada.
+
+    Implementado como classe (e não com @contextmanager) para manter o custo
+    por bloco na casa das centenas de nanossegundos.
+    """
+
+    __slots__ = ("name", "_metrics", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self._metrics = _current.get()
+        if self._metrics is not None:
+            self._start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        if self._metrics is not None:
+            self._metrics.add_duration(
+                self.name, (perf_counter() - self._start) * 1000
+            )
+
+
+def timed(name: str) -> Callable:
+    """Decorator equivalente a `with stage(name)` em volta da função."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _current.get()
+            if metrics is None:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.add_duration(name, (perf_counter() - start) * 1000)
+
+        return wrapper
+
+    return decorator
+
+
+def add_count(name: str, value: int = 1) -> None:
+    """Soma `value` à contagem `name` da invocação atual."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.add_count(name, value)
+
+
+def set_property(name: str, value: Any) -> None:
+    """Adiciona um campo (não métrico) à linha EMF da invocação atual."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.properties[name] = value
+
+
+def emit(metrics: InvocationMetrics) -> None:
+    """Escreve a linha EMF no stdout, onde o CloudWatch Logs a converte em métricas."""
+    sys.stdout.write(
+        json.dumps(metrics.to_emf(), ensure_ascii=False, default=str) + "\n"
+    )
+    sys.stdout.flush()
+
+
+def instrumented(handler: Callable) -> Callable:
+    """
+    Decorator do lambda_handler: abre as métricas da invocação, registra o status
+    da resposta e emite uma linha EMF ao final. Desativado com METRICS_ENABLED=false.
+    """
+
+    @wraps(handler)
+    def wrapper(event, context):
+        global _cold_start
+
+        if not AppConfig.get_metrics_enabled():
+            return handler(event, context)
+
+        event = event or {}
+        route = f"{event.get('httpMethod')} {event.get('resource') or event.get('path')}"
+        metrics = InvocationMetrics(route=route, cold_start=_cold_start)
+        _cold_start = False
+        token = _current.set(metrics)
+        try:
+            response = handler(event, context)
+            if isinstance(response, dict):
+                metrics.properties["status_code"] = response.get("statusCode")
+            return response
+        finally:
+            _current.reset(token)
+            emit(metrics)
+
+    return wrapper
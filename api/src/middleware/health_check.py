@@ -1,83 +1,188 @@
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+from src.cache.lru_cache import LRUCache
 from src.services.predict_service import PredictionService
 from src.repository.passenger_repository import PassengerRepository
+from src.repository.dynamodb_client import get_connection_stats
 from src.logging.custom_logging import get_logger
 from src.config.app_config import AppConfig
 from datetime import datetime
 from time import time
 
+# Threads compartilhadas pelas verificações: uma verificação que estoure o
+# timeout continua rodando em segundo plano sem bloquear as próximas
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health")
 
-class HealthCheck:
-    """Classe para verificar a saúde dos componentes do sistema."""
+# Passageiro usado na verificação completa do modelo
+HEALTH_TEST_DATA = {
+    "Pclass": 3,
+    "Sex": "male",
+    "Age": 30.0,
+    "SibSp": 0,
+    "Parch": 0,
+    "Fare": 10.0,
+    "Embarked": "S",
+}
 
-    def __init__(self):
-        self.logger = get_logger()
 
-    def check_model_health(self) -> Dict[str, Any]:
-        """Verifica se o modelo está carregado e funcionando."""
+class HealthCheck:
+    """
+    Classe para verificar a saúde dos componentes do sistema.
+
+    A verificação padrão é barata: confere o modelo já carregado pelo handler
+    (sem recarregá-lo do disco) e faz um GetItem em uma chave sentinela. Com
+    deep=True, o modelo executa uma predição de teste e a tabela é descrita
+    (DescribeTable). Os componentes são verificados em paralelo, com timeout,
+    e o resultado fica em cache por alguns segundos.
+    """
+
+    def __init__(
+        self,
+        prediction_service: Optional[PredictionService] = None,
+        repository: Optional[PassengerRepository] = None,
+        cache_ttl: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            prediction_service: Serviço em uso pelo handler (o modelo não é recarregado).
+            repository: Repositório de passageiros (criado no primeiro uso se omitido).
+            cache_ttl: Tempo (s) em que o resultado é reaproveitado (0 desativa).
+                Padrão: AppConfig.get_health_cache_ttl().
+            timeout: Tempo máximo (s) de espera pelas verificações.
+                Padrão: AppConfig.get_health_check_timeout().
+        """
+        self.logger = get_logger()
+        self.prediction_service = prediction_service
+        self._repository = repository
+        self.timeout = (
+            AppConfig.get_health_check_timeout() if timeout is None else timeout
+        )
+        if cache_ttl is None:
+            cache_ttl = AppConfig.get_health_cache_ttl()
+        self._cache = LRUCache(max_size=2, ttl=cache_ttl) if cache_ttl > 0 else None
+
+    @property
+    def repository(self) -> PassengerRepository:
+        """Repositório usado nas verificações do DynamoDB."""
+        if self._repository is None:
+            self._repository = PassengerRepository()
+        return self._repository
+
+    def check_model_health(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Verifica se o modelo está carregado e funcionando.
+
+        Args:
+            deep (bool): Executa também uma predição de teste.
+        """
         try:
             start_time = time()
-            self.logger.info("Iniciando verificação de saúde do modelo...")
 
-            prediction_service = PredictionService(
-                model_name="model", method=AppConfig.get_model_method()
-            )
+            service = self.prediction_service
+            if service is None or service.model is None:
+                raise RuntimeError("Modelo não carregado")
+            if not hasattr(service.model, "predict_proba"):
+                raise RuntimeError("O modelo não possui o método predict_proba")
 
-            test_data = {
-                "Pclass": 3,
-                "Sex": "male",
-                "Age": 30.0,
-                "SibSp": 0,
-                "Parch": 0,
-                "Fare": 10.0,
-                "Embarked": "S",
+            result = {
+                "status": "healthy",
+                "message": "Modelo carregado",
+                "model_name": service.model_name,
+                "method": service.method,
             }
 
-            probability = prediction_service.predict(test_data)
+            if deep:
+                result["probability"] = service.predict(HEALTH_TEST_DATA)
+                result["test_data"] = HEALTH_TEST_DATA
+                result["message"] = "Modelo funcionando corretamente"
 
-            elapsed_time = time() - start_time
-            self.logger.info(
-                f"Verificação de saúde do modelo concluída em {elapsed_time:.2f} segundos."
-            )
-
-            return {
-                "status": "healthy",
-                "message": "Modelo funcionando corretamente",
-                "elapsed_time": elapsed_time,
-                "test_data": test_data,
-                "probability": probability,
-            }
+            result["elapsed_time"] = time() - start_time
+            return result
 
         except Exception as e:
             return {"status": "unhealthy", "message": f"Erro no modelo: {str(e)}"}
 
-    def check_database_health(self) -> Dict[str, Any]:
-        """Verifica se a conexão com o DynamoDB está funcionando."""
+    def check_database_health(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Verifica se a conexão com o DynamoDB está funcionando.
+
+        Args:
+            deep (bool): Descreve também a tabela (status e contagem aproximada).
+        """
         try:
-            repository = PassengerRepository()
+            start_time = time()
 
-            repository.get_all()
+            self.repository.ping()
+            result = {
+                "status": "healthy",
+                "message": "Conexão com DynamoDB funcionando",
+                "connections": get_connection_stats(),
+            }
 
-            return {"status": "healthy", "message": "Conexão com DynamoDB funcionando"}
+            if deep:
+                table = self.repository.describe_table()
+                result["table"] = table
+                if table["table_status"] != "ACTIVE":
+                    result["status"] = "unhealthy"
+                    result["message"] = (
+                        f"Tabela DynamoDB com status {table['table_status']}"
+                    )
+
+            result["elapsed_time"] = time() - start_time
+            return result
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "message": f"Erro na conexão com DynamoDB: {str(e)}",
             }
 
-    def get_overall_health(self) -> Dict[str, Any]:
-        """Retorna o status geral de saúde do sistema."""
-        model_health = self.check_model_health()
-        db_health = self.check_database_health()
+    def get_overall_health(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Retorna o status geral de saúde do sistema.
+
+        Args:
+            deep (bool): Executa a verificação completa de cada componente.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(deep)
+            if cached is not None:
+                return cached
+
+        checks: Dict[str, Callable[[bool], Dict[str, Any]]] = {
+            "model": self.check_model_health,
+            "database": self.check_database_health,
+        }
+        deadline = time() + self.timeout
+        futures = {name: _executor.submit(check, deep) for name, check in checks.items()}
+        components = {
+            name: self._wait(name, future, deadline) for name, future in futures.items()
+        }
 
-        all_healthy = model_health["status"] == "healthy" and db_health["status"] in [
-            "healthy",
-            "skipped",
-        ]
+        all_healthy = components["model"]["status"] == "healthy" and components[
+            "database"
+        ]["status"] in ["healthy", "skipped"]
 
-        return {
+        health = {
             "overall_status": "healthy" if all_healthy else "unhealthy",
-            "components": {"model": model_health, "database": db_health},
+            "components": components,
             "environment": AppConfig.get_environment(),
             "uptime": datetime.now().isoformat(),
         }
+        if self._cache is not None:
+            self._cache.set(deep, health)
+        return health
+
+    def _wait(self, name: str, future, deadline: float) -> Dict[str, Any]:
+        """Aguarda uma verificação até o prazo comum de todas elas."""
+        try:
+            return future.result(timeout=max(deadline - time(), 0))
+        except FutureTimeoutError:
+            future.cancel()
+            self.logger.warning(
+                f"Verificação de saúde '{name}' excedeu {self.timeout:.1f}s"
+            )
+            return {
+                "status": "unhealthy",
+                "message": f"Tempo limite de {self.timeout:.1f}s excedido",
+            }
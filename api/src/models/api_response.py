@@ -19,12 +19,20 @@ class APIMetadata(BaseModel):
 class PaginationInfo(BaseModel):
     """Informações de paginação."""
 
-    page: int = Field(..., ge=1, description="Página atual")
+    page: Optional[int] = Field(
+        ..., ge=1, description="Página atual (None na paginação por cursor)"
+    )
     limit: int = Field(..., ge=1, le=100, description="Itens por página")
     total_items: int = Field(..., ge=0, description="Total de itens")
     total_pages: int = Field(..., ge=0, description="Total de páginas")
     has_next: bool = Field(..., description="Indica se há próxima página")
-    has_previous: bool = Field(..., description="Indica se há página anterior")
+    has_previous: bool = Field(
+        ...,
+        description="Indica se há página anterior (False por cursor, que só avança)",
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Token de continuação para a próxima página (?cursor=...)"
+    )
 
 
 class StandardSuccessResponse(BaseModel):
@@ -50,10 +58,16 @@ class PredictionResult(BaseModel):
         ..., description="Predição categórica (survived/not_survived)"
     )
     confidence_level: str = Field(..., description="Nível de confiança da predição")
+    model_version: Optional[str] = Field(
+        None, description="Versão do modelo usada na predição"
+    )
 
     @classmethod
     def from_probability(
-        cls, passenger_id: str, probability: float
+        cls,
+        passenger_id: str,
+        probability: float,
+        model_version: Optional[str] = None,
     ) -> "PredictionResult":
         """Cria um resultado de predição a partir da probabilidade."""
         prediction = "survived" if probability >= 0.5 else "not_survived"
@@ -71,9 +85,27 @@ class PredictionResult(BaseModel):
             survival_probability=round(probability, 4),
             prediction=prediction,
             confidence_level=confidence,
+            model_version=model_version,
         )
 
 
+class BulkPredictionResult(PredictionResult):
+    """Resultado de um item de uma inclusão em lote, com o status da gravação."""
+
+    status: str = Field(
+        ..., description="Resultado da gravação (created/exists/error)"
+    )
+    error: Optional[str] = Field(None, description="Motivo da falha, se houver")
+
+
+class InvalidLineResult(BaseModel):
+    """Linha de uma inclusão NDJSON que não passou na validação."""
+
+    line: int = Field(..., description="Número da linha no corpo (a partir de 1)")
+    status: str = Field("invalid", description="Sempre 'invalid'")
+    error: str = Field(..., description="Erros de validação da linha")
+
+
 class PassengerDetail(BaseModel):
     """Detalhes completos de um passageiro."""
 
@@ -91,6 +123,9 @@ class PassengerDetail(BaseModel):
     fare: Optional[float] = Field(None, description="Tarifa paga")
     embarked: Optional[str] = Field(None, description="Porto de embarque")
     created_at: Optional[str] = Field(None, description="Data de criação do registro")
+    model_version: Optional[str] = Field(
+        None, description="Versão do modelo usada na predição"
+    )
 
 
 class HealthStatus(BaseModel):
@@ -109,6 +144,9 @@ class HealthResponse(BaseModel):
         ..., description="Status dos componentes"
     )
     uptime: Optional[str] = Field(None, description="Tempo de atividade do serviço")
+    cold_start: Optional[Dict[str, Any]] = Field(
+        None, description="Relatório do cold start do container (imports e INIT)"
+    )
     metadata: APIMetadata = Field(default_factory=APIMetadata)
 
 
@@ -1,5 +1,5 @@
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, model_serializer
 
 
 class ErrorDetail(BaseModel):
@@ -8,6 +8,15 @@ class ErrorDetail(BaseModel):
     field: str
     message: str
     type: str
+    index: Optional[int] = None
+
+    @model_serializer(mode="wrap")
+    def _omit_empty_index(self, handler):
+        """Só inclui `index` em erros de itens de um lote."""
+        data = handler(self)
+        if data.get("index") is None:
+            data.pop("index", None)
+        return data
 
 
 class StandardErrorResponse(BaseModel):
@@ -20,18 +29,20 @@ class StandardErrorResponse(BaseModel):
 
     @classmethod
     def validation_error(cls, errors: List[Dict[str, Any]]) -> "StandardErrorResponse":
-        """Cria uma resposta de erro para erros de validação."""
+        """
+        Cria uma resposta de erro para erros de validação.
+        Em lotes, o `loc` começa pelo índice do item, que vai para `index`.
+        """
         error_details = []
         for error in errors:
+            loc = list(error.get("loc") or [])
+            index = loc.pop(0) if loc and isinstance(loc[0], int) else None
             error_details.append(
                 ErrorDetail(
-                    field=(
-                        error.get("loc", ["unknown"])[0]
-                        if error.get("loc")
-                        else "unknown"
-                    ),
+                    field=str(loc[0]) if loc else "unknown",
                     message=error.get("msg", "Erro de validação"),
                     type=error.get("type", "unknown"),
+                    index=index,
                 )
             )
 
@@ -1,5 +1,10 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import Any, Iterator, List, Literal, Optional, Tuple
+
+
+# Prefixo das chaves internas da tabela (itens do contador de passageiros, ver
+# PassengerRepository); não pode ser usado como PassengerId
+RESERVED_ID_PREFIX = "__passenger_count__"
 
 
 class PassengerRequest(BaseModel):
@@ -52,6 +57,16 @@ class PassengerRequest(BaseModel):
         json_schema_extra={"example": "S"},
     )
 
+    @field_validator("PassengerId")
+    @classmethod
+    def validate_passenger_id(cls, v):
+        if v.startswith(RESERVED_ID_PREFIX):
+            raise ValueError(
+                f"PassengerId não pode começar com o prefixo reservado "
+                f"'{RESERVED_ID_PREFIX}'."
+            )
+        return v
+
     @field_validator("Pclass")
     def pclass_must_be_in_range(cls, v):
         if v not in [1, 2, 3]:
@@ -102,3 +117,59 @@ class PassengerRequest(BaseModel):
             "Fare": self.Fare,
             "Embarked": self.Embarked,
         }
+
+
+# Validador de lotes criado uma única vez: montar o schema do TypeAdapter é caro
+_passenger_list_adapter = TypeAdapter(List[PassengerRequest])
+
+
+def parse_passengers(body: Any) -> List[PassengerRequest]:
+    """
+    Valida o corpo de uma requisição POST (um passageiro ou uma lista).
+
+    Texto/bytes JSON são validados diretamente, sem json.loads intermediário;
+    em listas, todos os itens são validados e o ValidationError traz o índice
+    de cada item inválido no início do `loc`.
+
+    Args:
+        body: Corpo bruto (str ou bytes JSON), já decodificado (dict ou list)
+            ou None (corpo vazio).
+
+    Returns:
+        List[PassengerRequest]: Passageiros validados, na ordem do corpo.
+    """
+    if isinstance(body, (str, bytes)):
+        if body.lstrip()[:1] in ("[", b"["):
+            return _passenger_list_adapter.validate_json(body)
+        return [PassengerRequest.model_validate_json(body)]
+
+    if isinstance(body, list):
+        return _passenger_list_adapter.validate_python(body)
+    return [PassengerRequest.model_validate(body or {})]
+
+
+def iter_ndjson_lines(body: Any) -> Iterator[Tuple[int, Any]]:
+    """
+    Percorre um corpo NDJSON (um passageiro JSON por linha) sob demanda, sem
+    montar a lista de linhas nem decodificar o corpo inteiro.
+
+    Args:
+        body: Corpo bruto (str ou bytes) ou None (corpo vazio).
+
+    Yields:
+        Tuple[int, Any]: Número da linha (a partir de 1) e seu conteúdo, sem o
+        terminador. Linhas em branco são ignoradas.
+    """
+    if not body:
+        return
+    newline = b"\n" if isinstance(body, bytes) else "\n"
+    start, line_number = 0, 0
+    while start < len(body):
+        end = body.find(newline, start)
+        if end == -1:
+            end = len(body)
+        line_number += 1
+        line = body[start:end].strip()
+        if line:
+            yield line_number, line
+        start = end + 1
@@ -0,0 +1,108 @@
+from threading import Lock
+from typing import Any, Dict
+
+import boto3
+from botocore.config import Config
+
+from src.config.app_config import AppConfig
+from src.logging.custom_logging import get_logger
+
+
+# Resource compartilhado por todos os repositórios e health checks do container.
+# Criado no primeiro uso e reaproveitado nas invocações "quentes" da Lambda,
+# evitando nova sessão, resolução de endpoint e handshake TLS a cada chamada.
+_resource = None
+_lock = Lock()
+_stats = {"created": 0, "reused": 0}
+
+
+def build_client_config() -> Config:
+    """Monta a configuração do botocore a partir das variáveis de ambiente."""
+    return Config(
+        max_pool_connections=AppConfig.get_dynamodb_max_pool_connections(),
+        connect_timeout=AppConfig.get_dynamodb_connect_timeout(),
+        read_timeout=AppConfig.get_dynamodb_read_timeout(),
+        retries={
+            "mode": AppConfig.get_dynamodb_retry_mode(),
+            "total_max_attempts": AppConfig.get_dynamodb_max_attempts(),
+        },
+        tcp_keepalive=AppConfig.get_dynamodb_tcp_keepalive(),
+    )
+
+
+def get_dynamodb_resource():
+    """
+    Retorna o resource DynamoDB compartilhado, criando-o na primeira chamada.
+
+    A criação é protegida por lock; o cliente do resource (resource.meta.client)
+    é thread-safe e mantém o pool de conexões HTTP.
+    """
+    global _resource
+
+    with _lock:
+        if _resource is not None:
+            _stats["reused"] += 1
+            return _resource
+
+        config = build_client_config()
+        _resource = boto3.resource(
+            "dynamodb",
+            region_name=AppConfig.get_aws_region(),
+            endpoint_url=AppConfig.get_dynamodb_endpoint_url(),
+            config=config,
+        )
+        _stats["created"] += 1
+
+    get_logger().info(
+        "Cliente DynamoDB criado "
+        f"(max_pool_connections={config.max_pool_connections}, "
+        f"retries={config.retries['mode']})"
+    )
+    return _resource
+
+
+def get_dynamodb_client():
+    """Retorna o cliente de baixo nível do resource compartilhado."""
+    return get_dynamodb_resource().meta.client
+
+
+def reset_dynamodb_resource() -> None:
+    """Descarta o resource compartilhado (ex.: testes ou troca de credenciais)."""
+    global _resource
+
+    with _lock:
+        _resource = None
+        _stats["created"] = 0
+        _stats["reused"] = 0
+
+
+def _connection_pools(client) -> list:
+    """Pools do urllib3 usados pelo cliente (atributos internos do botocore)."""
+    try:
+        manager = client._endpoint.http_session._manager
+        return list(manager.pools._container.values())
+    except AttributeError:
+        return []
+
+
+def get_connection_stats() -> Dict[str, Any]:
+    """
+    Estatísticas de reaproveitamento do cliente e das conexões HTTP.
+
+    Returns:
+        Dict com 'resources_created', 'resource_reuses' e, se o cliente já existir,
+        'connections_opened' e 'requests_sent' somados nos pools do urllib3.
+        Com keep-alive funcionando, requests_sent cresce bem mais que
+        connections_opened.
+    """
+    stats: Dict[str, int] = {
+        "resources_created": _stats["created"],
+        "resource_reuses": _stats["reused"],
+        "connections_opened": 0,
+        "requests_sent": 0,
+    }
+    if _resource is not None:
+        for pool in _connection_pools(_resource.meta.client):
+            stats["connections_opened"] += getattr(pool, "num_connections", 0)
+            stats["requests_sent"] += getattr(pool, "num_requests", 0)
+    return stats
@@ -1,7 +1,94 @@
+import base64
+import binascii
+import json
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
 from os import getenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence
+from src.cache.lru_cache import LRUCache
+from src.config.app_config import AppConfig
+from src.repository.dynamodb_client import get_dynamodb_resource
+from src.metrics.timing import timed
 from src.logging.custom_logging import get_logger
+from src.models.passenger_request import RESERVED_ID_PREFIX
+
+# Total de passageiros mantido em COUNTER_SHARDS itens sentinela na mesma
+# tabela ("__passenger_count__#0" ...). Cada inclusão/exclusão soma ±1 em um
+# shard sorteado, na mesma transação da escrita; o total é a soma dos shards.
+# Dividir o contador espalha a carga e os conflitos de transação entre chaves
+# (um único item limitaria as escritas da tabela à vazão de uma partição).
+# Alterar COUNTER_SHARDS exige recriar o contador.
+# O prefixo é rejeitado na validação do PassengerId (RESERVED_ID_PREFIX).
+COUNTER_KEY = RESERVED_ID_PREFIX
+COUNTER_SHARDS = 8
+COUNTER_SHARD_KEYS = [f"{COUNTER_KEY}#{shard}" for shard in range(COUNTER_SHARDS)]
+
+# Limite de 100 ações por TransactWriteItems: 99 inclusões + o contador
+MAX_TRANSACTION_PUTS = 99
+
+# Motivos de cancelamento/erros transitórios que justificam nova tentativa
+RETRYABLE_CODES = {
+    "TransactionConflict",
+    "ThrottlingError",
+    "ThrottlingException",
+    "ProvisionedThroughputExceeded",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "TransactionInProgressException",
+    "InternalServerError",
+}
+
+# Limite do DynamoDB para TotalSegments em scans paralelos
+MAX_SCAN_SEGMENTS = 1_000_000
+
+# Teto do cache de leitura por ID: itens de ~1-2 KB mantêm o cache em poucos MB,
+# seguro para uma Lambda de 128 MB mesmo com configuração exagerada
+MAX_ITEM_CACHE_SIZE = 10_000
+
+# Marca buscas sem resultado no cache (None indica ausência de entrada)
+_NOT_FOUND = object()
+
+# Resultados por item de save_many
+STATUS_CREATED = "created"
+STATUS_EXISTS = "exists"
+STATUS_ERROR = "error"
+
+
+def _is_counter_key(passenger_id: Optional[str]) -> bool:
+    """Indica se a chave pertence a um dos itens do contador."""
+    return isinstance(passenger_id, str) and passenger_id.startswith(COUNTER_KEY)
+
+
+def _exclude_counter():
+    """Filtro de scan que oculta os itens do contador."""
+    return ~Attr("passenger_id").begins_with(COUNTER_KEY)
+
+
+def encode_cursor(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Converte o LastEvaluatedKey do DynamoDB em um token opaco (base64 url-safe)."""
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Converte um token de continuação de volta para ExclusiveStartKey."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Cursor de paginação inválido")
+
+    if not isinstance(key, dict) or not isinstance(key.get("passenger_id"), str):
+        raise ValueError("Cursor de paginação inválido")
+    return key
 
 
 class PassengerRepository:
@@ -10,24 +97,182 @@ class PassengerRepository:
     de passageiros no DynamoDB.
     """
 
-    def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb")
+    def __init__(
+        self,
+        count_cache_ttl: float = 5.0,
+        item_cache_size: Optional[int] = None,
+        item_cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            count_cache_ttl: TTL (s) do total de passageiros em cache.
+            item_cache_size: Passageiros no cache de get_by_id (0 desativa).
+                Padrão: AppConfig.get_passenger_cache_size().
+            item_cache_ttl: TTL (s) dos passageiros em cache.
+            negative_cache_ttl: TTL (s) das buscas sem resultado em cache.
+        """
+        # Resource compartilhado: reaproveita sessão e conexões entre instâncias
+        self.dynamodb = get_dynamodb_resource()
         self.logger = get_logger()
         table_name = getenv("DYNAMODB_TABLE_NAME")
         if not table_name:
             raise ValueError(
                 "Variável de ambiente DYNAMODB_TABLE_NAME não está definida."
             )
+        self.table_name = table_name
         self.table = self.dynamodb.Table(table_name)
+        self._count_cache = LRUCache(max_size=1, ttl=count_cache_ttl)
+
+        if item_cache_size is None:
+            item_cache_size = AppConfig.get_passenger_cache_size()
+        if item_cache_size > MAX_ITEM_CACHE_SIZE:
+            self.logger.warning(
+                f"Cache de passageiros limitado a {MAX_ITEM_CACHE_SIZE} itens "
+                f"(solicitado: {item_cache_size})"
+            )
+            item_cache_size = MAX_ITEM_CACHE_SIZE
+        self.negative_cache_ttl = (
+            AppConfig.get_passenger_negative_cache_ttl()
+            if negative_cache_ttl is None
+            else negative_cache_ttl
+        )
+        # Passageiros são imutáveis após a criação (save não sobrescreve), então
+        # o cache só precisa ser invalidado pelas escritas deste container
+        self._item_cache = (
+            LRUCache(
+                max_size=item_cache_size,
+                ttl=(
+                    AppConfig.get_passenger_cache_ttl()
+                    if item_cache_ttl is None
+                    else item_cache_ttl
+                ),
+            )
+            if item_cache_size > 0
+            else None
+        )
+
+    @property
+    def item_cache(self) -> Optional[LRUCache]:
+        """Cache de leitura de get_by_id (None se desativado)."""
+        return self._item_cache
+
+    def _invalidate_item(self, passenger_id: Optional[str]) -> None:
+        """Remove um passageiro do cache de leitura (ex.: após inclusão ou exclusão)."""
+        if self._item_cache is not None:
+            self._item_cache.pop(passenger_id)
+
+    # O cliente do resource (self.dynamodb.meta.client) serializa os valores
+    # Python automaticamente, inclusive nas operações transacionais.
+    def _counter_update(self, delta: int) -> Dict[str, Any]:
+        """
+        Operação transacional que soma `delta` a um shard sorteado do contador.
+
+        A condição attribute_exists impede que o ADD crie o shard implicitamente
+        (com zero) antes de o contador ser inicializado por rebuild_count().
+        """
+        return {
+            "Update": {
+                "TableName": self.table_name,
+                "Key": {"passenger_id": random.choice(COUNTER_SHARD_KEYS)},
+                "UpdateExpression": "ADD item_count :delta",
+                "ConditionExpression": "attribute_exists(passenger_id)",
+                "ExpressionAttributeValues": {":delta": delta},
+            }
+        }
+
+    @staticmethod
+    def _cancellation_code(error: Exception, index: int) -> Optional[str]:
+        """Código do motivo de cancelamento da ação `index` da transação."""
+        reasons = getattr(error, "response", {}).get("CancellationReasons") or []
+        return reasons[index].get("Code") if index < len(reasons) else None
+
+    @classmethod
+    def _condition_failed(cls, error: Exception) -> bool:
+        """Indica se a transação foi cancelada pela condição do item do passageiro."""
+        return cls._cancellation_code(error, 0) == "ConditionalCheckFailed"
+
+    @staticmethod
+    def _backoff(attempt: int, base_delay: float) -> None:
+        """Espera exponencial com jitter antes da tentativa `attempt` + 1."""
+        delay = base_delay * (2 ** (attempt - 1))
+        time.sleep(delay + random.uniform(0, delay))
+
+    def _write_with_counter(
+        self,
+        operation: Dict[str, Any],
+        delta: int,
+        max_attempts: int = 5,
+        base_delay: float = 0.05,
+    ) -> None:
+        """
+        Executa `operation` (Put ou Delete condicional) e a atualização do
+        contador em uma única transação.
+
+        Conflitos de transação e throttling são repetidos com backoff; se o
+        contador ainda não existir, ele é inicializado e a escrita repetida.
+        Cancelamentos pela condição do próprio item são propagados.
+        """
+        client = self.dynamodb.meta.client
+        attempt = 0
+        while True:
+            try:
+                client.transact_write_items(
+                    TransactItems=[operation, self._counter_update(delta)]
+                )
+                self._adjust_cached_count(delta)
+                return
+            except client.exceptions.TransactionCanceledException as e:
+                item_code = self._cancellation_code(e, 0)
+                counter_code = self._cancellation_code(e, 1)
+                if item_code == "ConditionalCheckFailed":
+                    raise
 
+                attempt += 1
+                if attempt >= max_attempts:
+                    raise
+                if counter_code == "ConditionalCheckFailed":
+                    self.rebuild_count()
+                elif item_code in RETRYABLE_CODES or counter_code in RETRYABLE_CODES:
+                    self.logger.warning(
+                        f"Conflito na transação ({item_code}/{counter_code}); "
+                        f"tentativa {attempt + 1} de {max_attempts}"
+                    )
+                    self._backoff(attempt, base_delay)
+                else:
+                    raise
+
+    def _adjust_cached_count(self, delta: int) -> None:
+        """Mantém o total em cache coerente com as escritas deste container."""
+        cached = self._count_cache.get("count", count=False)
+        if cached is not None:
+            self._count_cache.set("count", max(cached + delta, 0))
+
+    @timed("dynamodb_save")
     def save(self, passenger_data: Dict[str, Any]) -> None:
         """Salva os dados de um passageiro no DynamoDB apenas se não existir."""
+        client = self.dynamodb.meta.client
+        passenger_id = passenger_data.get("passenger_id")
+        if _is_counter_key(passenger_id):
+            # O item ficaria oculto nas leituras, mas contaria no total
+            self.logger.error(f"ID reservado para uso interno: {passenger_id}")
+            raise ValueError(f"ID de passageiro reservado: {passenger_id}")
         try:
-            self.table.put_item(
-                Item=passenger_data,
-                ConditionExpression="attribute_not_exists(passenger_id)",
+            self._write_with_counter(
+                {
+                    "Put": {
+                        "TableName": self.table_name,
+                        "Item": passenger_data,
+                        "ConditionExpression": "attribute_not_exists(passenger_id)",
+                    }
+                },
+                1,
             )
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            self._invalidate_item(passenger_data.get("passenger_id"))
+        except client.exceptions.TransactionCanceledException as e:
+            if not self._condition_failed(e):
+                self.logger.error(f"Transação cancelada ao salvar no DynamoDB: {e}")
+                raise
             self.logger.warning(
                 f"Passageiro {passenger_data.get('passenger_id')} já existe"
             )
@@ -41,11 +286,187 @@ class PassengerRepository:
             self.logger.error(f"Erro geral ao salvar no DynamoDB: {e}")
             raise
 
+    @timed("dynamodb_save")
+    def save_many(
+        self,
+        passengers_data: List[Dict[str, Any]],
+        chunk_size: int = MAX_TRANSACTION_PUTS,
+        max_attempts: int = 5,
+        base_delay: float = 0.05,
+    ) -> List[Dict[str, Any]]:
+        """
+        Salva vários passageiros em lotes transacionais, mantendo a regra
+        attribute_not_exists(passenger_id) de save() e o contador de passageiros.
+
+        Cada lote é um TransactWriteItems com até `chunk_size` inclusões. Se a
+        transação for cancelada, os itens já existentes são retirados do lote e o
+        restante é reenviado; cancelamentos transitórios (conflito, throttling)
+        são repetidos com backoff exponencial.
+
+        Args:
+            passengers_data: Itens a salvar.
+            chunk_size: Inclusões por transação (máximo 99).
+            max_attempts: Tentativas por lote antes de desistir dos itens restantes.
+            base_delay: Atraso inicial do backoff, em segundos.
+
+        Returns:
+            Lista, na ordem de entrada, de dicts com 'passenger_id', 'status'
+            ('created', 'exists' ou 'error') e, em caso de erro, 'error'.
+        """
+        chunk_size = max(1, min(chunk_size, MAX_TRANSACTION_PUTS))
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(passengers_data)
+
+        pending: List[int] = []
+        seen = set()
+        for index, item in enumerate(passengers_data):
+            passenger_id = item.get("passenger_id")
+            if _is_counter_key(passenger_id):
+                outcomes[index] = {
+                    "passenger_id": passenger_id,
+                    "status": STATUS_ERROR,
+                    "error": "ID de passageiro reservado",
+                }
+            elif passenger_id in seen:
+                outcomes[index] = {"passenger_id": passenger_id, "status": STATUS_EXISTS}
+            else:
+                seen.add(passenger_id)
+                pending.append(index)
+
+        for start in range(0, len(pending), chunk_size):
+            self._save_chunk(
+                passengers_data,
+                pending[start : start + chunk_size],
+                outcomes,
+                max_attempts,
+                base_delay,
+            )
+
+        created = sum(1 for o in outcomes if o["status"] == STATUS_CREATED)
+        self.logger.info(
+            f"Inclusão em lote concluída: {created}/{len(passengers_data)} criados"
+        )
+        return outcomes
+
+    def _save_chunk(
+        self,
+        passengers_data: List[Dict[str, Any]],
+        chunk: List[int],
+        outcomes: List[Optional[Dict[str, Any]]],
+        max_attempts: int,
+        base_delay: float,
+    ) -> None:
+        """Grava um lote de itens com uma transação, com novas tentativas."""
+        client = self.dynamodb.meta.client
+        attempt = 0
+
+        while chunk:
+            transact_items = [
+                {
+                    "Put": {
+                        "TableName": self.table_name,
+                        "Item": passengers_data[index],
+                        "ConditionExpression": "attribute_not_exists(passenger_id)",
+                    }
+                }
+                for index in chunk
+            ]
+            transact_items.append(self._counter_update(len(chunk)))
+
+            try:
+                client.transact_write_items(TransactItems=transact_items)
+                for index in chunk:
+                    passenger_id = passengers_data[index].get("passenger_id")
+                    outcomes[index] = {
+                        "passenger_id": passenger_id,
+                        "status": STATUS_CREATED,
+                    }
+                    self._invalidate_item(passenger_id)
+                self._adjust_cached_count(len(chunk))
+                return
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                reasons = e.response.get("CancellationReasons") or []
+                retryable = code in RETRYABLE_CODES
+
+                remaining = []
+                for index, reason in zip(chunk, reasons):
+                    reason_code = reason.get("Code")
+                    passenger_id = passengers_data[index].get("passenger_id")
+                    if reason_code == "ConditionalCheckFailed":
+                        self.logger.warning(f"Passageiro {passenger_id} já existe")
+                        outcomes[index] = {
+                            "passenger_id": passenger_id,
+                            "status": STATUS_EXISTS,
+                        }
+                    elif reason_code in (None, "None") or reason_code in RETRYABLE_CODES:
+                        retryable = retryable or reason_code in RETRYABLE_CODES
+                        remaining.append(index)
+                    else:
+                        outcomes[index] = {
+                            "passenger_id": passenger_id,
+                            "status": STATUS_ERROR,
+                            "error": reason.get("Message") or reason_code,
+                        }
+                if not reasons:
+                    remaining = list(chunk)
+
+                # O motivo da atualização do contador vem depois dos itens; um
+                # conflito nele (todos os escritores tocam os shards) é transitório
+                counter_code = self._cancellation_code(e, len(chunk))
+                retryable = retryable or counter_code in RETRYABLE_CODES
+                progressed = len(remaining) < len(chunk)
+                chunk = remaining
+
+                if counter_code == "ConditionalCheckFailed":
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        break
+                    self.rebuild_count()
+                elif retryable:
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        break
+                    self._backoff(attempt, base_delay)
+                elif not progressed:
+                    self.logger.error(f"Erro do DynamoDB ao salvar lote: {e}")
+                    break
+
+        for index in chunk:
+            outcomes[index] = {
+                "passenger_id": passengers_data[index].get("passenger_id"),
+                "status": STATUS_ERROR,
+                "error": "Não foi possível salvar o passageiro após novas tentativas",
+            }
+
+    @timed("dynamodb_get")
     def get_by_id(self, passenger_id: str) -> Optional[Dict[str, Any]]:
-        """Busca um passageiro pelo seu ID."""
+        """
+        Busca um passageiro pelo seu ID, passando antes pelo cache de leitura.
+        Buscas sem resultado também ficam em cache, por `negative_cache_ttl`.
+        """
+        if _is_counter_key(passenger_id):
+            return None
+
+        if self._item_cache is not None:
+            cached = self._item_cache.get(passenger_id)
+            if cached is not None:
+                self.logger.info(f"Cache de passageiros: {self._item_cache.stats()}")
+                return None if cached is _NOT_FOUND else cached
+
         try:
             response = self.table.get_item(Key={"passenger_id": passenger_id})
-            return response.get("Item")
+            item = response.get("Item")
+
+            if self._item_cache is not None:
+                if item is None:
+                    self._item_cache.set(
+                        passenger_id, _NOT_FOUND, ttl=self.negative_cache_ttl
+                    )
+                else:
+                    self._item_cache.set(passenger_id, item)
+                self.logger.info(f"Cache de passageiros: {self._item_cache.stats()}")
+
+            return item
         except boto3.exceptions.Boto3Error as e:
             self.logger.error(f"Erro do boto3 ao buscar passageiro {passenger_id}: {e}")
             raise
@@ -53,42 +474,218 @@ class PassengerRepository:
             self.logger.error(f"Erro geral ao buscar passageiro {passenger_id}: {e}")
             raise
 
-    def get_all(self, page: int = 1, limit: int = 10) -> Dict[str, Any]:
+    def _read_counter_shards(self) -> Dict[str, int]:
+        """Lê os shards do contador (um BatchGetItem, leitura consistente)."""
+        request: Optional[Dict[str, Any]] = {
+            self.table_name: {
+                "Keys": [{"passenger_id": key} for key in COUNTER_SHARD_KEYS],
+                "ConsistentRead": True,
+            }
+        }
+        shards: Dict[str, int] = {}
+        while request:
+            response = self.dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get("Responses", {}).get(self.table_name, []):
+                shards[item["passenger_id"]] = int(item.get("item_count", 0))
+            request = response.get("UnprocessedKeys") or None
+        return shards
+
+    @timed("dynamodb_count")
+    def count(self) -> int:
+        """
+        Retorna o total de passageiros somando os shards do contador (um
+        BatchGetItem), com cache de curta duração. Se o contador ainda não
+        existir (tabela anterior a ele), é inicializado uma única vez.
+        """
+        cached = self._count_cache.get("count")
+        if cached is not None:
+            return cached
+
+        try:
+            shards = self._read_counter_shards()
+            if len(shards) < COUNTER_SHARDS:
+                total = self.rebuild_count()
+            else:
+                total = max(sum(shards.values()), 0)
+            self._count_cache.set("count", total)
+            return total
+        except boto3.exceptions.Boto3Error as e:
+            self.logger.error(f"Erro do boto3 ao contar passageiros: {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Erro geral ao contar passageiros: {e}")
+            raise
+
+    @timed("dynamodb_ping")
+    def ping(self) -> None:
+        """
+        Verificação barata da tabela: GetItem de uma chave sentinela (o primeiro
+        shard do contador) projetando só a chave. Custa meia unidade de leitura
+        e não depende do tamanho da tabela.
+        """
+        try:
+            self.table.get_item(
+                Key={"passenger_id": COUNTER_SHARD_KEYS[0]},
+                ProjectionExpression="passenger_id",
+            )
+        except Exception as e:
+            self.logger.error(f"Erro ao verificar a tabela {self.table_name}: {e}")
+            raise
+
+    def describe_table(self) -> Dict[str, Any]:
+        """
+        Descreve a tabela (DescribeTable).
+
+        Returns:
+            Dict[str, Any]: Status da tabela e contagem aproximada de itens
+            (atualizada pelo DynamoDB a cada ~6 horas).
+        """
+        try:
+            table = self.dynamodb.meta.client.describe_table(
+                TableName=self.table_name
+            )["Table"]
+            return {
+                "table_status": table.get("TableStatus"),
+                "item_count": table.get("ItemCount"),
+            }
+        except Exception as e:
+            self.logger.error(f"Erro ao descrever a tabela {self.table_name}: {e}")
+            raise
+
+    def rebuild_count(self) -> int:
+        """
+        Inicializa o contador com um scan Select=COUNT de leitura consistente.
+
+        Os shards são criados com escrita condicional (attribute_not_exists), e
+        toda inclusão/exclusão exige o shard na mesma transação: enquanto o
+        contador não existe nenhuma escrita é aceita, então nada se perde entre
+        o scan e a gravação. Se outro container inicializar primeiro, prevalece
+        o contador dele. Shards ausentes em um contador já existente são
+        recriados com zero.
+
+        Returns:
+            int: Total de passageiros após a inicialização.
+        """
+        shards = self._read_counter_shards()
+        missing = [key for key in COUNTER_SHARD_KEYS if key not in shards]
+        if not missing:
+            return max(sum(shards.values()), 0)
+
+        total = 0
+        if not shards:
+            self.logger.warning(
+                "Contador de passageiros ausente; inicializando com scan."
+            )
+            scan_kwargs = {
+                "Select": "COUNT",
+                "FilterExpression": _exclude_counter(),
+                "ConsistentRead": True,
+            }
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                total += response.get("Count", 0)
+                if "LastEvaluatedKey" not in response:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        client = self.dynamodb.meta.client
+        try:
+            client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Put": {
+                            "TableName": self.table_name,
+                            "Item": {
+                                "passenger_id": key,
+                                "item_count": total if i == 0 else 0,
+                            },
+                            "ConditionExpression": "attribute_not_exists(passenger_id)",
+                        }
+                    }
+                    for i, key in enumerate(missing)
+                ]
+            )
+        except client.exceptions.TransactionCanceledException:
+            self.logger.info("Contador de passageiros inicializado por outra instância")
+
+        return max(sum(self._read_counter_shards().values()), 0)
+
+    def _scan_page(
+        self, limit: int, exclusive_start_key: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Lê até `limit` passageiros a partir de `exclusive_start_key`, ignorando o
+        item contador. Só repete o scan quando o contador ocupou uma das posições.
+        """
+        items: List[Dict[str, Any]] = []
+        last_key = exclusive_start_key
+        while True:
+            scan_kwargs = {
+                "Limit": limit - len(items),
+                "FilterExpression": _exclude_counter(),
+            }
+            if last_key:
+                scan_kwargs["ExclusiveStartKey"] = last_key
+
+            response = self.table.scan(**scan_kwargs)
+            items.extend(response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+
+            if len(items) >= limit or not last_key:
+                return {"Items": items, "Count": len(items), "LastEvaluatedKey": last_key}
+
+    @timed("dynamodb_scan")
+    def get_all(
+        self, page: int = 1, limit: int = 10, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Retorna todos os passageiros da tabela com suporte a paginação.
 
+        Com `cursor`, a página é lida diretamente a partir do token de continuação
+        (um único scan, custo constante por página). Sem ele, mantém o modo por
+        número de página, que precisa percorrer as páginas anteriores.
+
         Args:
-            page: Número da página (começando em 1)
+            page: Número da página (começando em 1), ignorado se `cursor` for informado
             limit: Número de itens por página (padrão: 10)
+            cursor: Token de continuação retornado em 'next_cursor'
 
         Returns:
-            Dict contendo 'items', 'page', 'limit', 'total_pages' e 'count'
+            Dict contendo 'items', 'page', 'limit', 'total_pages', 'count' e 'next_cursor'
         """
         try:
-            # Calcula quantos itens pular baseado na página
-            items_to_skip = (page - 1) * limit
-
             scan_kwargs = {"Limit": limit}
 
-            # Se não é a primeira página, precisa pular itens
-            if items_to_skip > 0:
-                # Fazer scan para pular os itens das páginas anteriores
-                temp_response = self.table.scan(Limit=items_to_skip)
-                if "LastEvaluatedKey" in temp_response:
-                    scan_kwargs["ExclusiveStartKey"] = temp_response["LastEvaluatedKey"]
-                else:
-                    # Se não há mais itens, retorna lista vazia
-                    return {
-                        "items": [],
-                        "page": page,
-                        "limit": limit,
-                        "total_pages": 0,
-                        "count": 0,
-                    }
+            if cursor:
+                scan_kwargs["ExclusiveStartKey"] = decode_cursor(cursor)
+            else:
+                # Calcula quantos itens pular baseado na página
+                items_to_skip = (page - 1) * limit
 
-            response = self.table.scan(**scan_kwargs)
+                # Se não é a primeira página, precisa pular itens
+                if items_to_skip > 0:
+                    # Fazer scan para pular os itens das páginas anteriores
+                    temp_response = self._scan_page(items_to_skip)
+                    if temp_response["LastEvaluatedKey"]:
+                        scan_kwargs["ExclusiveStartKey"] = temp_response[
+                            "LastEvaluatedKey"
+                        ]
+                    else:
+                        # Se não há mais itens, retorna lista vazia
+                        return {
+                            "items": [],
+                            "page": page,
+                            "limit": limit,
+                            "total_pages": 0,
+                            "count": 0,
+                            "next_cursor": None,
+                        }
 
-            total_count = self.table.item_count
+            response = self._scan_page(
+                scan_kwargs["Limit"], scan_kwargs.get("ExclusiveStartKey")
+            )
+
+            total_count = self.count()
             total_pages = (total_count + limit - 1) // limit  # Arredonda para cima
 
             return {
@@ -96,8 +693,12 @@ class PassengerRepository:
                 "page": page,
                 "limit": limit,
                 "total_pages": total_pages,
+                "total_count": total_count,
                 "count": response.get("Count", 0),
+                "next_cursor": encode_cursor(response.get("LastEvaluatedKey")),
             }
+        except ValueError:
+            raise
         except boto3.exceptions.Boto3Error as e:
             self.logger.error(f"Erro do boto3 ao buscar todos os passageiros: {e}")
             raise
@@ -105,21 +706,127 @@ class PassengerRepository:
             self.logger.error(f"Erro geral ao buscar todos os passageiros: {e}")
             raise
 
+    def scan_all(
+        self,
+        total_segments: int = 4,
+        max_workers: Optional[int] = None,
+        projection: Optional[Sequence[str]] = None,
+        page_size: Optional[int] = None,
+        max_buffered_pages: int = 8,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre a tabela inteira com um scan paralelo (Segment/TotalSegments),
+        entregando os passageiros um a um à medida que as páginas chegam.
+
+        Cada segmento é lido por uma thread de um pool limitado; as páginas passam
+        por uma fila com no máximo `max_buffered_pages` páginas, então a memória
+        não cresce com o tamanho da tabela. A ordem dos itens não é garantida.
+        Encerrar o gerador antes do fim interrompe as threads.
+
+        Args:
+            total_segments: Número de segmentos do scan.
+            max_workers: Threads simultâneas (padrão: total_segments, até 16).
+            projection: Atributos a retornar (ProjectionExpression).
+            page_size: Limit de cada chamada de scan.
+            max_buffered_pages: Páginas lidas e ainda não consumidas.
+
+        Yields:
+            Dict com os atributos de cada passageiro.
+        """
+        if not 1 <= total_segments <= MAX_SCAN_SEGMENTS:
+            raise ValueError(
+                f"total_segments deve estar entre 1 e {MAX_SCAN_SEGMENTS}"
+            )
+        max_workers = max_workers or min(total_segments, 16)
+        max_workers = max(1, min(max_workers, total_segments))
+
+        scan_kwargs: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "FilterExpression": _exclude_counter(),
+        }
+        if projection:
+            # Nomes substituídos por placeholders evitam conflito com palavras
+            # reservadas do DynamoDB (ex.: 'name', 'status')
+            names = {f"#p{i}": attr for i, attr in enumerate(projection)}
+            scan_kwargs["ProjectionExpression"] = ", ".join(names)
+            scan_kwargs["ExpressionAttributeNames"] = names
+        if page_size:
+            scan_kwargs["Limit"] = page_size
+
+        pages: "queue.Queue" = queue.Queue(maxsize=max(1, max_buffered_pages))
+        stop = threading.Event()
+        # O cliente do boto3 é thread-safe, ao contrário do resource/Table
+        client = self.dynamodb.meta.client
+
+        def put(message) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(message, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan_segment(segment: int) -> None:
+            kwargs = dict(scan_kwargs, Segment=segment, TotalSegments=total_segments)
+            try:
+                while not stop.is_set():
+                    response = client.scan(**kwargs)
+                    if response.get("Items") and not put(("items", response["Items"])):
+                        return
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                put(("done", segment))
+            except Exception as e:
+                put(("error", e))
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scan-segment"
+        )
+        try:
+            for segment in range(total_segments):
+                executor.submit(scan_segment, segment)
+
+            pending = total_segments
+            while pending:
+                kind, payload = pages.get()
+                if kind == "items":
+                    yield from payload
+                elif kind == "done":
+                    pending -= 1
+                else:
+                    self.logger.error(f"Erro no scan paralelo de passageiros: {payload}")
+                    raise payload
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @timed("dynamodb_delete")
     def delete(self, passenger_id: str) -> bool:
         """Deleta um passageiro pelo ID."""
+        if _is_counter_key(passenger_id):
+            return False
+        self._invalidate_item(passenger_id)
+        client = self.dynamodb.meta.client
         try:
-            result = self.table.delete_item(
-                Key={"passenger_id": passenger_id},
-                ConditionExpression="attribute_exists(passenger_id)",
-                ReturnValues="ALL_OLD",
+            self._write_with_counter(
+                {
+                    "Delete": {
+                        "TableName": self.table_name,
+                        "Key": {"passenger_id": passenger_id},
+                        "ConditionExpression": "attribute_exists(passenger_id)",
+                    }
+                },
+                -1,
             )
-            if "Attributes" not in result:
-                self.logger.warning(
-                    f"Passageiro {passenger_id} não encontrado para exclusão."
-                )
-                return False
             return True
-        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+        except client.exceptions.TransactionCanceledException as e:
+            if not self._condition_failed(e):
+                self.logger.error(
+                    f"Transação cancelada ao deletar passageiro {passenger_id}: {e}"
+                )
+                raise
             self.logger.warning(
                 f"Passageiro {passenger_id} não encontrado para exclusão."
             )
@@ -0,0 +1,176 @@
+import threading
+from concurrent.futures import Future
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.logging.custom_logging import get_logger
+from src.services.predict_service import PredictionService
+
+
+class _Request(NamedTuple):
+    """Pedido de predição enfileirado por uma thread da requisição."""
+
+    service: PredictionService
+    batch: Sequence[Any]
+    future: Future
+
+
+class InferenceScheduler:
+    """
+    Micro-batching de predições para hosts com várias threads (ex.: o Flask
+    do api_mock.py).
+
+    Cada requisição enfileira o seu lote e espera por um Future. Uma thread
+    dedicada junta os pedidos que chegam em até `window_ms` após o primeiro
+    (ou até `max_batch_size` passageiros), faz uma única chamada a
+    predict_batch por modelo e devolve a cada Future a sua fatia do resultado.
+    Pedidos que chegam enquanto o modelo está ocupado formam o próximo lote.
+    """
+
+    def __init__(self, window_ms: float = 2.0, max_batch_size: int = 64):
+        """
+        Args:
+            window_ms (float): Espera máxima, a partir do primeiro pedido, por
+                outros pedidos para o mesmo lote.
+            max_batch_size (int): Passageiros por lote; ao atingir, o lote é
+                enviado sem esperar o fim da janela.
+        """
+        self.window = max(0.0, window_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.logger = get_logger()
+
+        # Lotes executados e passageiros pontuados (para testes e benchmarks)
+        self.batches = 0
+        self.rows = 0
+
+        self._queue: "SimpleQueue[Optional[_Request]]" = SimpleQueue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def predict_batch(
+        self, service: PredictionService, batch: Sequence[Any]
+    ) -> List[float]:
+        """
+        Equivalente a service.predict_batch(batch), agrupado com os pedidos
+        concorrentes.
+
+        Args:
+            service (PredictionService): Serviço do modelo solicitado.
+            batch (Sequence[Any]): Passageiros da requisição.
+
+        Returns:
+            List[float]: Probabilidades de sobrevivência, na ordem do lote.
+        """
+        return self.submit(service, batch).result()
+
+    def submit(self, service: PredictionService, batch: Sequence[Any]) -> Future:
+        """Enfileira um lote e retorna o Future com as suas probabilidades."""
+        future: Future = Future()
+        if not batch:
+            future.set_result([])
+            return future
+
+        self._ensure_worker()
+        self._queue.put(_Request(service, batch, future))
+        return future
+
+    def close(self) -> None:
+        """Encerra a thread após os pedidos já enfileirados."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _ensure_worker(self) -> None:
+        """Sobe a thread no primeiro uso (e de novo em um processo filho após fork)."""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="inference-scheduler", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Laço da thread: monta um lote por vez e o executa."""
+        stop = False
+        while not stop:
+            requests, stop = self._collect()
+            if requests:
+                self._execute(requests)
+
+    def _collect(self) -> Tuple[List[_Request], bool]:
+        """
+        Espera o primeiro pedido e junta os seguintes até o fim da janela ou
+        até max_batch_size passageiros.
+
+        Returns:
+            Tuple com os pedidos do lote e se o sinal de encerramento chegou.
+        """
+        first = self._queue.get()
+        if first is None:
+            return [], True
+
+        requests = [first]
+        rows = len(first.batch)
+        deadline = monotonic() + self.window
+        while rows < self.max_batch_size:
+            timeout = deadline - monotonic()
+            try:
+                request = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except Empty:
+                break
+            if request is None:
+                return requests, True
+            requests.append(request)
+            rows += len(request.batch)
+        return requests, False
+
+    def _execute(self, requests: List[_Request]) -> None:
+        """Uma chamada a predict_batch por modelo, repartindo o resultado."""
+        groups: Dict[int, List[_Request]] = {}
+        for request in requests:
+            groups.setdefault(id(request.service), []).append(request)
+
+        for group in groups.values():
+            service = group[0].service
+            merged = [item for request in group for item in request.batch]
+            try:
+                probabilities = service.predict_batch(merged)
+            except Exception as e:
+                if len(group) == 1:
+                    group[0].future.set_exception(e)
+                    continue
+                # Um pedido inválido não derruba os demais: cada um roda sozinho
+                self.logger.warning(
+                    f"Lote agrupado falhou ({e}); repetindo {len(group)} pedidos "
+                    "individualmente"
+                )
+                self._execute_each(group)
+                continue
+
+            self.batches += 1
+            self.rows += len(merged)
+            start = 0
+            for request in group:
+                end = start + len(request.batch)
+                request.future.set_result(probabilities[start:end])
+                start = end
+
+    def _execute_each(self, group: List[_Request]) -> None:
+        """Executa cada pedido do grupo separadamente."""
+        for request in group:
+            try:
+                request.future.set_result(request.service.predict_batch(request.batch))
+                self.batches += 1
+                self.rows += len(request.batch)
+            except Exception as e:
+                request.future.set_exception(e)
@@ -0,0 +1,189 @@
+import csv
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from src.logging.custom_logging import get_logger
+from src.services.predict_service import PredictionService
+
+
+# Colunas usadas pelo modelo, no formato dos CSVs do Kaggle (train.csv/test.csv);
+# demais colunas (Name, Ticket, Cabin, Survived...) são ignoradas
+INPUT_COLUMNS = ["PassengerId", "Pclass", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]
+OUTPUT_COLUMNS = ["PassengerId", "Survived", "survival_probability"]
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Serviço usado por _score_chunk. No modo com workers, é definido antes de
+# criar o pool e herdado pelos processos filhos via fork, sem recarregar o modelo
+_service: Optional[PredictionService] = None
+
+
+def _optional_float(value: str) -> Optional[float]:
+    """Converte um campo numérico; vazio vira None (valor padrão do modelo)."""
+    return float(value) if value.strip() else None
+
+
+def _to_record(row: List[str], index: Dict[str, int], line: int) -> Dict[str, Any]:
+    """Converte uma linha do CSV no dicionário esperado pelo pré-processamento."""
+    try:
+        return {
+            "PassengerId": row[index["PassengerId"]],
+            "Pclass": int(row[index["Pclass"]]),
+            "Sex": row[index["Sex"]],
+            "Age": _optional_float(row[index["Age"]]),
+            "SibSp": int(row[index["SibSp"]]),
+            "Parch": int(row[index["Parch"]]),
+            "Fare": _optional_float(row[index["Fare"]]),
+            "Embarked": row[index["Embarked"]] or None,
+        }
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Linha {line} inválida: {e}")
+
+
+def _float_column(values: Sequence[str]) -> np.ndarray:
+    """Coluna numérica opcional: campos vazios viram NaN (valor padrão do modelo)."""
+    column = np.asarray(values)
+    return np.where(column == "", "nan", column).astype(np.float64)
+
+
+def _chunk_columns(
+    rows: List[List[str]], index: Dict[str, int], first_line: int
+) -> Dict[str, Any]:
+    """
+    Converte um bloco do CSV nas colunas da requisição com conversões NumPy,
+    sem um dicionário por linha.
+    """
+    if min(map(len, rows)) > max(index.values()):
+        fields = list(zip(*rows))
+        try:
+            embarked = np.asarray(fields[index["Embarked"]], dtype=object)
+            embarked[embarked == ""] = None
+            return {
+                "PassengerId": fields[index["PassengerId"]],
+                "Pclass": np.asarray(fields[index["Pclass"]]).astype(np.int64),
+                "Sex": np.asarray(fields[index["Sex"]], dtype=object),
+                "Age": _float_column(fields[index["Age"]]),
+                "SibSp": np.asarray(fields[index["SibSp"]]).astype(np.int64),
+                "Parch": np.asarray(fields[index["Parch"]]).astype(np.int64),
+                "Fare": _float_column(fields[index["Fare"]]),
+                "Embarked": embarked,
+            }
+        except ValueError:
+            pass
+
+    # Fora do caminho rápido (linhas curtas, espaços em volta dos números...):
+    # converte linha a linha, o que também aponta a linha inválida no erro
+    records = [
+        _to_record(row, index, first_line + offset) for offset, row in enumerate(rows)
+    ]
+    return {column: [r[column] for r in records] for column in INPUT_COLUMNS}
+
+
+def _score_chunk(
+    rows: List[List[str]], index: Dict[str, int], first_line: int
+) -> List[List[Any]]:
+    """
+    Pontua um bloco de linhas: pré-processamento colunar do bloco inteiro e
+    uma única chamada a predict_proba (via PredictionService.predict_columns).
+    """
+    columns = _chunk_columns(rows, index, first_line)
+    probabilities = _service.predict_columns(columns)
+    return [
+        [passenger_id, int(probability >= 0.5), f"{probability:.4f}"]
+        for passenger_id, probability in zip(columns["PassengerId"], probabilities)
+    ]
+
+
+def _ordered_results(
+    pool, chunks: Iterable[tuple], max_pending: int
+) -> Iterator[List[List[Any]]]:
+    """
+    Distribui os blocos entre os workers e devolve os resultados na ordem de
+    entrada. No máximo `max_pending` blocos ficam em voo, então a leitura do
+    CSV acompanha a escrita e a memória não cresce com o tamanho do arquivo.
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(_score_chunk, chunk))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def score_csv(
+    input_file: TextIO,
+    output_file: TextIO,
+    service: PredictionService,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> int:
+    """
+    Pontua um CSV de passageiros em blocos e grava os resultados à medida que
+    cada bloco fica pronto.
+
+    Args:
+        input_file (TextIO): CSV com cabeçalho contendo INPUT_COLUMNS.
+        output_file (TextIO): Destino do CSV PassengerId,Survived,survival_probability.
+        service (PredictionService): Serviço com o modelo já carregado.
+        chunk_size (int): Linhas por bloco (uma chamada a predict_proba por bloco).
+        workers (int): Processos de pontuação. Acima de 1, usa um pool com fork
+            que compartilha o modelo já carregado com os filhos.
+
+    Returns:
+        int: Número de linhas pontuadas.
+    """
+    global _service
+    logger = get_logger()
+
+    reader = csv.reader(input_file)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("Arquivo de entrada vazio.")
+    missing = [column for column in INPUT_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(missing)}")
+    index = {column: header.index(column) for column in INPUT_COLUMNS}
+
+    writer = csv.writer(output_file, lineterminator="\n")
+    writer.writerow(OUTPUT_COLUMNS)
+
+    chunk_size = max(1, chunk_size)
+
+    def chunks() -> Iterator[tuple]:
+        first_line = 2  # linha 1 é o cabeçalho
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            yield rows, index, first_line
+            first_line += len(rows)
+
+    _service = service
+    pool = None
+    try:
+        if workers > 1:
+            pool = multiprocessing.get_context("fork").Pool(workers)
+            results = _ordered_results(pool, chunks(), max_pending=2 * workers)
+        else:
+            results = (_score_chunk(*chunk) for chunk in chunks())
+
+        total = 0
+        for scored in results:
+            writer.writerows(scored)
+            output_file.flush()
+            total += len(scored)
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if pool is not None:
+            pool.terminate()
+        _service = None
+
+    logger.info(f"Batch scoring concluído: {total} linhas com {workers} worker(s)")
+    return total
@@ -0,0 +1,205 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+
+FOREST_KIND = "forest"
+LINEAR_KIND = "linear"
+
+# Nó folha no formato do sklearn (children_left == children_right == -1)
+_LEAF = -1
+
+
+def export_model(estimator: Any, file_path: str) -> str:
+    """
+    Exporta um estimador já treinado para arrays NumPy puros (.npz).
+
+    Suporta árvores/florestas (DecisionTree, RandomForest, ExtraTrees) e modelos
+    lineares binários com coef_/intercept_ (ex.: LogisticRegression). O arquivo
+    gerado é lido por CompiledModel sem precisar importar o scikit-learn.
+
+    Args:
+        estimator: Estimador do scikit-learn já treinado.
+        file_path (str): Caminho do arquivo .npz de saída.
+
+    Returns:
+        str: O caminho do arquivo gerado.
+    """
+    arrays: Dict[str, np.ndarray] = {
+        "classes": np.asarray(estimator.classes_),
+    }
+
+    feature_names = getattr(estimator, "feature_names_in_", None)
+    if feature_names is not None:
+        arrays["feature_names"] = np.asarray(feature_names, dtype=str)
+
+    if hasattr(estimator, "estimators_") or hasattr(estimator, "tree_"):
+        trees = (
+            [e.tree_ for e in estimator.estimators_]
+            if hasattr(estimator, "estimators_")
+            else [estimator.tree_]
+        )
+        arrays.update(_flatten_trees(trees))
+        arrays["kind"] = np.array(FOREST_KIND)
+    elif hasattr(estimator, "coef_") and hasattr(estimator, "intercept_"):
+        coef = np.asarray(estimator.coef_, dtype=np.float64)
+        if coef.shape[0] != 1:
+            raise ValueError("Apenas modelos lineares binários são suportados.")
+        arrays["coef"] = coef[0]
+        arrays["intercept"] = np.asarray(estimator.intercept_, dtype=np.float64)[:1]
+        arrays["kind"] = np.array(LINEAR_KIND)
+    else:
+        raise ValueError(
+            f"Estimador '{type(estimator).__name__}' não suportado para exportação."
+        )
+
+    with open(file_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    return file_path
+
+
+def _flatten_trees(trees: List[Any]) -> Dict[str, np.ndarray]:
+    """
+    Concatena os nós de todas as árvores em arrays únicos, com os índices dos
+    filhos já deslocados para o array global.
+    """
+    children_left, children_right, feature, threshold = [], [], [], []
+    value, missing_left, roots = [], [], []
+    offset = 0
+    for tree in trees:
+        left = tree.children_left.astype(np.int64)
+        right = tree.children_right.astype(np.int64)
+        is_leaf = left == _LEAF
+
+        roots.append(offset)
+        # Folhas apontam para si mesmas: o laço de avaliação fica sem desvios
+        own_index = np.arange(tree.node_count, dtype=np.int64) + offset
+        children_left.append(np.where(is_leaf, own_index, left + offset))
+        children_right.append(np.where(is_leaf, own_index, right + offset))
+        feature.append(np.where(is_leaf, 0, tree.feature).astype(np.int64))
+        threshold.append(tree.threshold.astype(np.float64))
+
+        # value pode estar em contagens ou frações dependendo da versão do sklearn
+        node_value = tree.value[:, 0, :].astype(np.float64)
+        totals = node_value.sum(axis=1, keepdims=True)
+        value.append(
+            np.divide(
+                node_value, totals, out=np.zeros_like(node_value), where=totals > 0
+            )
+        )
+
+        missing = getattr(tree, "missing_go_to_left", None)
+        missing_left.append(
+            np.asarray(missing, dtype=bool)
+            if missing is not None
+            else np.ones(tree.node_count, dtype=bool)
+        )
+        offset += tree.node_count
+
+    return {
+        "children_left": np.concatenate(children_left).astype(np.int32),
+        "children_right": np.concatenate(children_right).astype(np.int32),
+        "feature": np.concatenate(feature).astype(np.int32),
+        "threshold": np.concatenate(threshold),
+        "value": np.concatenate(value),
+        "missing_go_to_left": np.concatenate(missing_left),
+        "roots": np.asarray(roots, dtype=np.int32),
+        "max_depth": np.array(max(int(t.max_depth) for t in trees)),
+    }
+
+
+class CompiledModel:
+    """
+    Avaliador de modelos exportados por export_model, usando apenas NumPy.
+    Expõe predict_proba com a mesma semântica do estimador original.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.kind = str(arrays["kind"])
+        self.classes_ = arrays["classes"]
+        self.feature_names_in_: Optional[np.ndarray] = arrays.get("feature_names")
+
+        if self.kind == FOREST_KIND:
+            self._children_left = arrays["children_left"]
+            self._children_right = arrays["children_right"]
+            self._feature = arrays["feature"]
+            self._threshold = arrays["threshold"]
+            self._value = arrays["value"]
+            self._missing_go_to_left = arrays["missing_go_to_left"]
+            self._roots = arrays["roots"]
+            self._max_depth = int(arrays["max_depth"])
+        elif self.kind == LINEAR_KIND:
+            self._coef = arrays["coef"]
+            self._intercept = float(arrays["intercept"][0])
+        else:
+            raise ValueError(f"Tipo de modelo compilado desconhecido: '{self.kind}'")
+
+    @classmethod
+    def load(cls, file_path: str) -> "CompiledModel":
+        """Carrega um modelo compilado a partir de um arquivo .npz."""
+        with np.load(file_path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        return cls(arrays)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos arrays do modelo, em bytes."""
+        return sum(
+            value.nbytes
+            for value in vars(self).values()
+            if isinstance(value, np.ndarray)
+        )
+
+    @property
+    def n_features_in_(self) -> int:
+        """Número de features esperado pelo modelo."""
+        if self.kind == LINEAR_KIND:
+            return int(self._coef.shape[0])
+        if self.feature_names_in_ is not None:
+            return len(self.feature_names_in_)
+        return int(self._feature.max()) + 1
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """
+        Calcula as probabilidades de cada classe.
+
+        Args:
+            X: Matriz 2D (n_amostras, n_features).
+
+        Returns:
+            np.ndarray: Matriz (n_amostras, n_classes).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X deve ser uma matriz 2D.")
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X tem {X.shape[1]} features, mas o modelo espera "
+                f"{self.n_features_in_}."
+            )
+
+        if self.kind == LINEAR_KIND:
+            positive = 1.0 / (1.0 + np.exp(-(X @ self._coef + self._intercept)))
+            return np.column_stack([1.0 - positive, positive])
+
+        # As árvores do sklearn comparam as features em float32
+        X = X.astype(np.float32).astype(np.float64)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self._roots, (X.shape[0], self._roots.shape[0]))
+
+        # Todas as árvores descem um nível por iteração, de forma vetorizada
+        for _ in range(self._max_depth):
+            values = X[rows, self._feature[nodes]]
+            go_left = np.where(
+                np.isnan(values),
+                self._missing_go_to_left[nodes],
+                values <= self._threshold[nodes],
+            )
+            nodes = np.where(
+                go_left, self._children_left[nodes], self._children_right[nodes]
+            )
+
+        return self._value[nodes].mean(axis=1)
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Retorna a classe mais provável para cada amostra."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
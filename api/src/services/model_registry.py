@@ -0,0 +1,261 @@
+import os
+import re
+import sys
+from collections import OrderedDict
+from threading import Lock
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.services.predict_service import (
+    MODEL_EXTENSIONS,
+    PredictionService,
+    get_models_dir,
+)
+from src.logging.custom_logging import get_logger
+
+
+_MODEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# Objetos compartilhados pelo processo, que não pertencem a nenhum modelo
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Soma a memória ocupada pelo grafo de objetos a partir de obj.
+
+    Conta sys.getsizeof de cada objeto (que, para arrays NumPy donos dos dados,
+    já inclui o buffer). Tipos de extensão sem __dict__, como as árvores do
+    sklearn, guardam os nós em buffers C que nem getsizeof nem o tracemalloc
+    enxergam; esses são percorridos pelo estado que expõem ao pickle.
+
+    Args:
+        obj: Raiz do grafo (normalmente o modelo carregado).
+
+    Returns:
+        int: Tamanho estimado em bytes.
+    """
+    seen = set()
+    # Mantém vivos os estados temporários, para que seus ids não sejam reusados
+    keep_alive: List[Any] = []
+    pending = [obj]
+    total = 0
+
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, np.ndarray):
+            if isinstance(current.base, np.ndarray):
+                pending.append(current.base)
+            elif current.base is not None:
+                # View sobre um buffer de outro objeto (ex.: nós da árvore)
+                total += current.nbytes
+            if current.dtype == object:
+                pending.extend(current.ravel().tolist())
+        elif isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        elif isinstance(current, (str, bytes, int, float, complex, bool)):
+            continue
+        elif hasattr(current, "__dict__"):
+            pending.append(vars(current))
+        else:
+            try:
+                reduced = current.__reduce_ex__(4)
+            except Exception:
+                continue
+            if isinstance(reduced, tuple) and len(reduced) > 2:
+                keep_alive.append(reduced[2])
+                pending.append(reduced[2])
+
+    return total
+
+
+class ModelRegistry:
+    """
+    Registro de modelos nomeados da pasta 'modelos/'.
+
+    Os modelos são carregados sob demanda no primeiro uso e mantidos em memória
+    em ordem LRU. O carregamento acontece fora do lock do registro, com um lock
+    por nome: requisições para modelos já carregados não esperam por ele. Quando o consumo estimado ultrapassa o orçamento configurado,
+    os modelos menos usados são descarregados (o modelo padrão nunca é).
+    """
+
+    def __init__(
+        self,
+        default_model: str = "model",
+        method: str = "joblib",
+        memory_budget_mb: float = 48.0,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            default_model (str): Nome do modelo usado quando nenhum é solicitado.
+            method (str): Método de carregamento ('joblib', 'pickle', 'compiled' ou 'surface').
+            memory_budget_mb (float): Orçamento de memória para os modelos carregados.
+            cache_size (int): Tamanho do cache de predições de cada modelo.
+            cache_ttl (Optional[float]): TTL do cache de predições de cada modelo.
+        """
+        if method not in MODEL_EXTENSIONS:
+            raise ValueError(
+                "Método de carregamento inválido. "
+                "Use 'joblib', 'pickle', 'compiled' ou 'surface'."
+            )
+
+        self.default_model = default_model
+        self.method = method
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.logger = get_logger()
+
+        self._services: "OrderedDict[str, PredictionService]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._loading: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    @property
+    def models_dir(self) -> str:
+        """Pasta onde os modelos são procurados."""
+        return get_models_dir()
+
+    @property
+    def loaded_models(self) -> List[str]:
+        """Modelos atualmente em memória, do menos para o mais usado."""
+        return list(self._services)
+
+    @property
+    def memory_usage_bytes(self) -> int:
+        """Consumo estimado dos modelos carregados."""
+        return sum(self._sizes.values())
+
+    def available_models(self) -> List[str]:
+        """Lista os modelos disponíveis em disco para o método configurado."""
+        extension = MODEL_EXTENSIONS[self.method]
+        try:
+            files = os.listdir(self.models_dir)
+        except FileNotFoundError:
+            return []
+        return sorted(f[: -len(extension)] for f in files if f.endswith(extension))
+
+    def get(self, model_name: Optional[str] = None) -> PredictionService:
+        """
+        Retorna o serviço de predição do modelo solicitado, carregando-o se necessário.
+
+        Args:
+            model_name (Optional[str]): Nome do modelo (None = modelo padrão).
+
+        Returns:
+            PredictionService: Serviço com o modelo carregado.
+        """
+        model_name = model_name or self.default_model
+
+        service = self._lookup(model_name)
+        if service is not None:
+            return service
+
+        if model_name != self.default_model:
+            self._validate_model_name(model_name)
+
+        with self._lock:
+            guard = self._loading.setdefault(model_name, Lock())
+
+        # Só quem pede o mesmo modelo espera pelo carregamento
+        with guard:
+            try:
+                service = self._lookup(model_name)
+                if service is not None:
+                    return service
+
+                service, size = self._load(model_name)
+
+                with self._lock:
+                    self._services[model_name] = service
+                    self._sizes[model_name] = size
+                    self.logger.info(
+                        f"Modelo '{model_name}' registrado "
+                        f"({size / 1024:.1f} KB estimados)"
+                    )
+                    self._enforce_budget(keep=model_name)
+                return service
+            finally:
+                with self._lock:
+                    self._loading.pop(model_name, None)
+
+    def _lookup(self, model_name: str) -> Optional[PredictionService]:
+        """Retorna o serviço já carregado (marcando-o como o mais usado) ou None."""
+        with self._lock:
+            service = self._services.get(model_name)
+            if service is not None:
+                self._services.move_to_end(model_name)
+            return service
+
+    def _load(self, model_name: str) -> Tuple[PredictionService, int]:
+        """
+        Carrega o modelo (fora do lock do registro) e estima sua memória.
+
+        Returns:
+            Tuple[PredictionService, int]: O serviço e o tamanho estimado em bytes.
+        """
+        service = PredictionService(
+            model_name=model_name,
+            method=self.method,
+            cache_size=self.cache_size,
+            cache_ttl=self.cache_ttl,
+        )
+        return service, self._estimate_size(service)
+
+    def unload(self, model_name: str) -> bool:
+        """Descarrega um modelo da memória. Retorna False se não estava carregado."""
+        with self._lock:
+            return self._unload(model_name)
+
+    def _unload(self, model_name: str) -> bool:
+        if self._services.pop(model_name, None) is None:
+            return False
+        self._sizes.pop(model_name, None)
+        self.logger.info(f"Modelo '{model_name}' descarregado da memória")
+        return True
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Descarrega modelos LRU até o consumo caber no orçamento."""
+        for model_name in list(self._services):
+            if self.memory_usage_bytes <= self.memory_budget_bytes:
+                break
+            if model_name in (keep, self.default_model):
+                continue
+            self._unload(model_name)
+
+        if self.memory_usage_bytes > self.memory_budget_bytes:
+            self.logger.warning(
+                f"Modelos carregados ({self.memory_usage_bytes / 1024 / 1024:.1f} MB) "
+                "excedem o orçamento de memória configurado"
+            )
+
+    def _validate_model_name(self, model_name: str) -> None:
+        """Garante que o nome é seguro e que o arquivo do modelo existe."""
+        if not _MODEL_NAME_PATTERN.match(model_name):
+            raise ValueError(f"Nome de modelo inválido: '{model_name}'")
+
+        if model_name not in self.available_models():
+            raise ValueError(f"Modelo '{model_name}' não encontrado")
+
+    def _estimate_size(self, service: PredictionService) -> int:
+        """
+        Estima a memória ocupada pelo modelo em uso: o tamanho exato dos arrays
+        quando o modelo o expõe (modelo compilado) ou, senão, o tamanho do grafo
+        de objetos em memória (ver deep_sizeof).
+        """
+        nbytes = getattr(service.model, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+        return deep_sizeof(service.model)
@@ -1,39 +1,89 @@
 import pickle
-from typing import Any, Dict
-import joblib
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 from src.models.passenger_request import PassengerRequest
+from src.services.compiled_model import CompiledModel
+from src.services.surface_model import SURFACE_EXTENSION, SurfaceModel
+from src.cache.lru_cache import LRUCache
 from src.logging.custom_logging import get_logger
+from src.metrics.timing import stage, timed
 from sys import path
 import os
 
 
+# Extensão do arquivo de modelo para cada método de carregamento
+MODEL_EXTENSIONS = {
+    "joblib": ".joblib",
+    "pickle": ".pkl",
+    "compiled": ".npz",
+    "surface": SURFACE_EXTENSION,
+}
+
+# Nome de cada coluna gerada por _feature_vector, na ordem em que é montada
+FEATURE_NAMES = [
+    "Pclass",
+    "Age",
+    "SibSp",
+    "Parch",
+    "Fare",
+    "Sex_male",
+    "Embarked_Q",
+    "Embarked_S",
+]
+
+
+# Campos da requisição usados pelo pré-processamento
+INPUT_FIELDS = ["Pclass", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]
+
+# Valores padrão para campos ausentes, baseados em estatísticas do dataset
+DEFAULT_AGE = 29.7
+DEFAULT_FARE = 32.2
+DEFAULT_EMBARKED = "S"
+
+
+def get_models_dir() -> str:
+    """Retorna a pasta de modelos: a da Lambda Layer, se existir, ou a local."""
+    if os.path.exists("/opt/python/modelos"):
+        return "/opt/python/modelos"
+    # Ambiente local ou de desenvolvimento
+    return "modelos"
+
+
 class PredictionService:
     """
     Serviço encapsulado para carregar o modelo e realizar predições.
     O modelo é carregado imediatamente na inicialização.
     """
 
-    def __init__(self, model_name: str, method: str = "joblib"):
+    def __init__(
+        self,
+        model_name: str,
+        method: str = "joblib",
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+    ):
         """
         Inicializa o serviço e carrega o modelo imediatamente.
 
         Args:
             model_name (str): O nome do modelo (usado para formar o caminho do arquivo).
-            method (str): Método de carregamento ('joblib' ou 'pickle').
+            method (str): Método de carregamento ('joblib', 'pickle', 'compiled' ou 'surface').
+            cache_size (int): Máximo de predições memorizadas (0 desativa o cache).
+            cache_ttl (Optional[float]): Tempo de vida das predições em cache, em segundos.
         """
-        if os.path.exists("/opt/python/modelos"):
-            self.model_path = os.path.join("/opt/python/modelos", f"{model_name}")
-        else:
-            # Ambiente local ou de desenvolvimento
-            self.model_path = os.path.join("modelos", f"{model_name}")
+        self.model_name = model_name
+        self.model_path = os.path.join(get_models_dir(), f"{model_name}")
 
         self.method = method
         self.logger = get_logger()
 
+        # Cache opcional de predições, indexado pelo vetor de features
+        self._cache = LRUCache(cache_size, cache_ttl) if cache_size > 0 else None
+
         # Carregar o modelo imediatamente
         self.logger.info(f"Carregando modelo '{self.model_path}'.")
         self._model = self._load_model(method)
+        self._column_order = self._resolve_column_order(self._model)
 
     @property
     def model(self):
@@ -46,8 +96,34 @@ class PredictionService:
     def model(self, value):
         """
         Setter para a propriedade model (necessário para os testes).
+        Limpa o cache de predições, que pertence ao modelo anterior.
         """
+        self._column_order = self._resolve_column_order(value)
         self._model = value
+        if self._cache is not None:
+            self._cache.clear()
+
+    @property
+    def _feature_order(self) -> List[str]:
+        """Nomes das colunas da matriz de features, na ordem esperada pelo modelo."""
+        if self._column_order is None:
+            return FEATURE_NAMES
+        return [FEATURE_NAMES[i] for i in self._column_order]
+
+    @property
+    def cache(self) -> Optional[LRUCache]:
+        """Cache de predições, ou None se desativado."""
+        return self._cache
+
+    @staticmethod
+    def _cache_key(features: np.ndarray) -> Tuple[Any, ...]:
+        """Chave do cache: a tupla normalizada de features gerada pelo pré-processamento."""
+        return tuple(features.tolist())
+
+    def _log_cache_stats(self) -> None:
+        """Registra os contadores do cache de predições."""
+        if self._cache is not None:
+            self.logger.info(f"Cache de predições: {self._cache.stats()}")
 
     def _load_model(self, method: str = "joblib") -> Any:
         """
@@ -58,6 +134,10 @@ class PredictionService:
             if method == "joblib":
                 file_path = f"{self.model_path}.joblib"
                 if os.path.exists(file_path):
+                    # Importado só aqui: no modo 'compiled' o cold start não
+                    # paga o import do joblib
+                    import joblib
+
                     self.logger.info(f"Carregando modelo com joblib de '{file_path}'")
                     with open(file_path, "rb") as f:
                         model = joblib.load(f)
@@ -71,9 +151,27 @@ class PredictionService:
                         model = pickle.load(f)
                 else:
                     raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+            elif method == "compiled":
+                # Avaliador somente NumPy, sem importar o scikit-learn
+                file_path = f"{self.model_path}.npz"
+                if os.path.exists(file_path):
+                    self.logger.info(f"Carregando modelo compilado de '{file_path}'")
+                    model = CompiledModel.load(file_path)
+                else:
+                    raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+            elif method == "surface":
+                # Superfície pré-calculada (scripts/export_surface_model.py),
+                # aproximada e lida via mmap
+                file_path = f"{self.model_path}{SURFACE_EXTENSION}"
+                if os.path.exists(file_path):
+                    self.logger.info(f"Carregando superfície de predição de '{file_path}'")
+                    model = SurfaceModel.load(file_path)
+                else:
+                    raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
             else:
                 raise ValueError(
-                    "Método de carregamento inválido. Use 'joblib' ou 'pickle'."
+                    "Método de carregamento inválido. "
+                    "Use 'joblib', 'pickle', 'compiled' ou 'surface'."
                 )
 
             self.logger.info(f"Modelo carregado com sucesso usando {method}")
@@ -88,6 +186,39 @@ class PredictionService:
             self.logger.error(f"ERRO: Não foi possível carregar o modelo. Causa: {e}")
             raise
 
+    def _resolve_column_order(self, model: Any) -> Optional[List[int]]:
+        """
+        Confere a ordem de _feature_vector contra o feature_names_in_ do modelo.
+
+        Args:
+            model: Modelo carregado (estimador do sklearn ou CompiledModel).
+
+        Returns:
+            Optional[List[int]]: Índices que reordenam as colunas de FEATURE_NAMES
+            para a ordem de treino, ou None se já coincidirem (ou se o modelo
+            não registrar os nomes das features).
+        """
+        names = getattr(model, "feature_names_in_", None)
+        if not isinstance(names, np.ndarray):
+            return None
+
+        names = [str(name) for name in names]
+        if sorted(names) != sorted(FEATURE_NAMES):
+            self.logger.error(
+                f"ERRO: Features do modelo {names} não correspondem às do "
+                f"pré-processamento {FEATURE_NAMES}"
+            )
+            raise ValueError(
+                "As features do modelo não correspondem às do pré-processamento."
+            )
+
+        if names == FEATURE_NAMES:
+            return None
+
+        self.logger.info(f"Colunas reordenadas para a ordem do modelo: {names}")
+        return [FEATURE_NAMES.index(name) for name in names]
+
+    @timed("preprocess")
     def _preprocess(self, data: Dict[str, Any]) -> np.ndarray:
         """
         Método privado para pré-processar os dados da requisição.
@@ -101,26 +232,9 @@ class PredictionService:
         """
 
         try:
-            # Usar valores padrão baseados em estatísticas do dataset
-            age = data.get("Age") if data.get("Age") is not None else 29.7
-            fare = data.get("Fare") if data.get("Fare") is not None else 32.2
-            embarked = data.get("Embarked") if data.get("Embarked") is not None else "S"
-
-            sex_male = 1 if data.get("Sex") == "male" else 0
-
-            embarked_q = 1 if embarked == "Q" else 0
-            embarked_s = 1 if embarked == "S" else 0
-
-            feature_vector = [
-                data.get("Pclass"),
-                age,
-                data.get("SibSp"),
-                data.get("Parch"),
-                fare,
-                sex_male,
-                embarked_q,
-                embarked_s,
-            ]
+            feature_vector = self._feature_vector(data)
+            if self._column_order is not None:
+                feature_vector = [feature_vector[i] for i in self._column_order]
 
             self.logger.debug(f"Feature vector criado: {feature_vector}")
             return np.array([feature_vector])
@@ -128,6 +242,122 @@ class PredictionService:
             self.logger.error(f"ERRO: Falha no pré-processamento dos dados. Causa: {e}")
             raise
 
+    def _feature_vector(self, data: Dict[str, Any]) -> List[Any]:
+        """
+        Monta a lista de features de um único passageiro, na ordem de
+        FEATURE_NAMES, aplicando os valores padrão e o one-hot encoding.
+        """
+        # Usar valores padrão baseados em estatísticas do dataset
+        age = data.get("Age") if data.get("Age") is not None else DEFAULT_AGE
+        fare = data.get("Fare") if data.get("Fare") is not None else DEFAULT_FARE
+        embarked = (
+            data.get("Embarked")
+            if data.get("Embarked") is not None
+            else DEFAULT_EMBARKED
+        )
+
+        sex_male = 1 if data.get("Sex") == "male" else 0
+
+        embarked_q = 1 if embarked == "Q" else 0
+        embarked_s = 1 if embarked == "S" else 0
+
+        return [
+            data.get("Pclass"),
+            age,
+            data.get("SibSp"),
+            data.get("Parch"),
+            fare,
+            sex_male,
+            embarked_q,
+            embarked_s,
+        ]
+
+    def _preprocess_batch(
+        self, batch: Sequence[Union[PassengerRequest, Dict[str, Any]]]
+    ) -> np.ndarray:
+        """
+        Método privado para pré-processar um lote de passageiros.
+        Gera uma única matriz 2D (uma linha por passageiro) para que o modelo
+        seja chamado uma só vez.
+
+        Args:
+            batch: Lista de PassengerRequest ou dicionários no formato da requisição.
+
+        Returns:
+            np.ndarray: Matriz 2D NumPy de formato (n_passageiros, n_features).
+        """
+        return self._preprocess_columns(self._batch_columns(batch))
+
+    @staticmethod
+    def _batch_columns(
+        batch: Sequence[Union[PassengerRequest, Dict[str, Any]]]
+    ) -> Dict[str, List[Any]]:
+        """Transpõe um lote de passageiros em listas por campo da requisição."""
+        rows = [
+            item.to_dict() if isinstance(item, PassengerRequest) else item
+            for item in batch
+        ]
+        return {
+            field: [row.get(field) for row in rows] for field in INPUT_FIELDS
+        }
+
+    @timed("preprocess")
+    def _preprocess_columns(self, columns: Dict[str, Sequence[Any]]) -> np.ndarray:
+        """
+        Pré-processamento colunar: monta a matriz de features só com operações
+        NumPy, com os mesmos valores padrão e o mesmo one-hot de _feature_vector.
+
+        Args:
+            columns: Campos da requisição (Pclass, Sex, Age, SibSp, Parch, Fare,
+                Embarked) como listas ou arrays de mesmo tamanho. Age e Fare
+                ausentes são None ou NaN; Embarked ausente é None.
+
+        Returns:
+            np.ndarray: Matriz float64 (n_passageiros, n_features), na ordem de
+            feature_names_in_ do modelo quando disponível.
+        """
+        try:
+            age = np.asarray(columns["Age"], dtype=np.float64)
+            fare = np.asarray(columns["Fare"], dtype=np.float64)
+            sex = np.asarray(columns["Sex"], dtype=object)
+            embarked = np.asarray(columns["Embarked"], dtype=object)
+            embarked_missing = np.equal(embarked, None)
+
+            features = {
+                "Pclass": columns["Pclass"],
+                "Age": np.where(np.isnan(age), DEFAULT_AGE, age),
+                "SibSp": columns["SibSp"],
+                "Parch": columns["Parch"],
+                "Fare": np.where(np.isnan(fare), DEFAULT_FARE, fare),
+                "Sex_male": np.equal(sex, "male"),
+                "Embarked_Q": np.equal(embarked, "Q"),
+                "Embarked_S": embarked_missing | np.equal(embarked, DEFAULT_EMBARKED),
+            }
+
+            matrix = np.empty((len(age), len(FEATURE_NAMES)), dtype=np.float64)
+            for position, name in enumerate(self._feature_order):
+                matrix[:, position] = features[name]
+
+            self.logger.debug(f"Matriz de features criada com {len(matrix)} linhas")
+            return matrix
+        except Exception as e:
+            self.logger.error(f"ERRO: Falha no pré-processamento do lote. Causa: {e}")
+            raise
+
+    def _check_model(self) -> None:
+        """Verifica se o modelo está carregado e expõe predict_proba."""
+        # Verificar se o modelo foi carregado
+        if self.model is None:
+            raise RuntimeError(
+                "Modelo não foi carregado. Verifique se o arquivo do modelo existe."
+            )
+
+        # Verificar se o modelo tem o método predict_proba
+        if not hasattr(self.model, "predict_proba"):
+            raise RuntimeError(
+                "O modelo não possui o método predict_proba necessário."
+            )
+
     def predict(self, request_data: Dict[str, Any]) -> float:
         """
         Realiza a predição de sobrevivência com base nos dados da requisição.
@@ -139,24 +369,29 @@ class PredictionService:
             float: A probabilidade de sobrevivência (um valor entre 0.0 e 1.0).
         """
         try:
-            # Verificar se o modelo foi carregado
-            if self.model is None:
-                raise RuntimeError(
-                    "Modelo não foi carregado. Verifique se o arquivo do modelo existe."
-                )
-
-            # Verificar se o modelo tem o método predict_proba
-            if not hasattr(self.model, "predict_proba"):
-                raise RuntimeError(
-                    "O modelo não possui o método predict_proba necessário."
-                )
+            self._check_model()
 
             processed_features = self._preprocess(request_data)
 
-            probability_prediction = self.model.predict_proba(processed_features)
+            if self._cache is not None:
+                cache_key = self._cache_key(processed_features[0])
+                cached_probability = self._cache.get(cache_key)
+                if cached_probability is not None:
+                    self.logger.info(
+                        f"Predição obtida do cache: {cached_probability:.4f}"
+                    )
+                    self._log_cache_stats()
+                    return cached_probability
+
+            with stage("predict_proba"):
+                probability_prediction = self.model.predict_proba(processed_features)
 
             survival_probability = probability_prediction[0][1]
 
+            if self._cache is not None:
+                self._cache.set(cache_key, survival_probability)
+                self._log_cache_stats()
+
             # Validar se a probabilidade está no range esperado
             if not 0.0 <= survival_probability <= 1.0:
                 self.logger.warning(
@@ -171,3 +406,104 @@ class PredictionService:
         except Exception as e:
             self.logger.error(f"ERRO: Falha na predição. Causa: {e}")
             raise
+
+    def predict_batch(
+        self, batch: Sequence[Union[PassengerRequest, Dict[str, Any]]]
+    ) -> List[float]:
+        """
+        Realiza a predição de sobrevivência para um lote de passageiros com uma
+        única chamada a predict_proba.
+
+        Args:
+            batch: Lista de PassengerRequest ou dicionários no formato da requisição.
+
+        Returns:
+            List[float]: Probabilidades de sobrevivência, na mesma ordem da entrada.
+        """
+        try:
+            self._check_model()
+
+            if not batch:
+                return []
+
+            processed_features = self._preprocess_batch(batch)
+            survival_probabilities = self._predict_features(processed_features)
+
+            self.logger.info(
+                f"Predição em lote realizada com sucesso para {len(batch)} passageiros"
+            )
+
+            return survival_probabilities
+        except Exception as e:
+            self.logger.error(f"ERRO: Falha na predição em lote. Causa: {e}")
+            raise
+
+    def predict_columns(self, columns: Dict[str, Sequence[Any]]) -> List[float]:
+        """
+        Realiza a predição para um lote já em colunas (ex.: blocos de um CSV),
+        sem montar um dicionário por passageiro.
+
+        Args:
+            columns: Campos da requisição como listas ou arrays de mesmo
+                tamanho (ver _preprocess_columns).
+
+        Returns:
+            List[float]: Probabilidades de sobrevivência, na ordem das linhas.
+        """
+        try:
+            self._check_model()
+
+            processed_features = self._preprocess_columns(columns)
+            if not len(processed_features):
+                return []
+            survival_probabilities = self._predict_features(processed_features)
+
+            self.logger.info(
+                f"Predição em colunas realizada com sucesso para "
+                f"{len(processed_features)} passageiros"
+            )
+
+            return survival_probabilities
+        except Exception as e:
+            self.logger.error(f"ERRO: Falha na predição em colunas. Causa: {e}")
+            raise
+
+    def _predict_features(self, processed_features: np.ndarray) -> List[float]:
+        """Uma chamada a predict_proba (ou ao cache) para a matriz inteira."""
+        with stage("predict_proba"):
+            if self._cache is None:
+                probability_prediction = self.model.predict_proba(processed_features)
+                survival_probabilities = np.asarray(probability_prediction)[:, 1].tolist()
+            else:
+                survival_probabilities = self._predict_batch_cached(
+                    processed_features
+                )
+
+        out_of_range = [p for p in survival_probabilities if not 0.0 <= p <= 1.0]
+        if out_of_range:
+            self.logger.warning(
+                f"Probabilidades fora do range esperado: {out_of_range}"
+            )
+        return survival_probabilities
+
+    def _predict_batch_cached(self, processed_features: np.ndarray) -> List[float]:
+        """
+        Consulta o cache linha a linha e envia ao modelo, em uma única chamada,
+        apenas os vetores de features ainda não memorizados.
+        """
+        keys = [self._cache_key(row) for row in processed_features]
+        survival_probabilities: List[Optional[float]] = [
+            self._cache.get(key) for key in keys
+        ]
+
+        missing = [i for i, p in enumerate(survival_probabilities) if p is None]
+        if missing:
+            probability_prediction = self.model.predict_proba(
+                processed_features[missing]
+            )
+            for index, row in zip(missing, probability_prediction):
+                survival_probabilities[index] = float(row[1])
+                self._cache.set(keys[index], survival_probabilities[index])
+
+        self._log_cache_stats()
+        return survival_probabilities
@@ -0,0 +1,330 @@
+import json
+from itertools import product
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Domínios discretos da superfície (Embarked: C, Q e S; ausente vira S no
+# pré-processamento)
+PCLASS_VALUES = [1, 2, 3]
+SEX_MALE_VALUES = [0, 1]
+EMBARKED_VALUES = ["C", "Q", "S"]
+
+# Limites usados quando o modelo não expõe os limiares das árvores. Age segue
+# o validador do PassengerRequest; os demais, o máximo do dataset do Titanic
+DEFAULT_AGE_MAX = 120.0
+DEFAULT_FARE_MAX = 520.0
+DEFAULT_SIBSP_MAX = 8
+DEFAULT_PARCH_MAX = 6
+
+DEFAULT_AGE_NODES = 79
+DEFAULT_FARE_NODES = 64
+
+# Sufixos dos arquivos: a grade (lida via mmap) e os eixos/relatório do build
+SURFACE_EXTENSION = ".surface.npy"
+AXES_EXTENSION = ".surface.json"
+
+
+def _max_thresholds(estimator: Any, feature_names: List[str]) -> Dict[str, float]:
+    """
+    Maior limiar de divisão de cada feature nas árvores do estimador. Acima
+    dele, a predição de uma floresta não muda: a grade pode parar ali sem erro.
+    """
+    trees = (
+        [e.tree_ for e in estimator.estimators_]
+        if hasattr(estimator, "estimators_")
+        else [estimator.tree_] if hasattr(estimator, "tree_") else []
+    )
+    thresholds: Dict[str, float] = {}
+    for tree in trees:
+        split = tree.feature >= 0
+        for feature, threshold in zip(tree.feature[split], tree.threshold[split]):
+            name = feature_names[feature]
+            thresholds[name] = max(thresholds.get(name, -np.inf), float(threshold))
+    return thresholds
+
+
+def surface_axes(
+    estimator: Any,
+    feature_names: List[str],
+    age_nodes: int = DEFAULT_AGE_NODES,
+    fare_nodes: int = DEFAULT_FARE_NODES,
+) -> Dict[str, Any]:
+    """
+    Define os eixos da superfície: SibSp/Parch inteiros até o último limiar
+    usado pelo modelo, Age em passos uniformes e Fare em escala logarítmica
+    (as tarifas se concentram nos valores baixos).
+
+    Args:
+        estimator: Estimador treinado (florestas têm os limites lidos das árvores).
+        feature_names (List[str]): Ordem das colunas esperada pelo estimador.
+        age_nodes (int): Nós da grade em Age.
+        fare_nodes (int): Nós da grade em Fare.
+
+    Returns:
+        Dict[str, Any]: feature_names, sibsp_max, parch_max, age_nodes e fare_nodes.
+    """
+    if age_nodes < 2 or fare_nodes < 3:
+        raise ValueError("A superfície precisa de ao menos 2 nós em Age e 3 em Fare.")
+
+    thresholds = _max_thresholds(estimator, feature_names)
+
+    def integer_max(name: str, default: int) -> int:
+        if name not in thresholds:
+            return default
+        return int(np.floor(thresholds[name])) + 1
+
+    age_max = min(np.ceil(thresholds.get("Age", DEFAULT_AGE_MAX)) + 1, DEFAULT_AGE_MAX)
+    fare_max = np.ceil(thresholds.get("Fare", DEFAULT_FARE_MAX)) + 1
+
+    return {
+        "feature_names": list(feature_names),
+        "sibsp_max": integer_max("SibSp", DEFAULT_SIBSP_MAX),
+        "parch_max": integer_max("Parch", DEFAULT_PARCH_MAX),
+        "age_nodes": np.linspace(0.0, age_max, age_nodes).tolist(),
+        "fare_nodes": [0.0] + np.geomspace(1.0, fare_max, fare_nodes - 1).tolist(),
+    }
+
+
+def _feature_matrix(
+    feature_names: List[str], columns: Dict[str, np.ndarray]
+) -> np.ndarray:
+    """Monta a matriz de features na ordem do modelo a partir das colunas."""
+    embarked = columns["Embarked"]
+    features = {
+        "Pclass": columns["Pclass"],
+        "Age": columns["Age"],
+        "SibSp": columns["SibSp"],
+        "Parch": columns["Parch"],
+        "Fare": columns["Fare"],
+        "Sex_male": columns["Sex_male"],
+        "Embarked_Q": embarked == EMBARKED_VALUES.index("Q"),
+        "Embarked_S": embarked == EMBARKED_VALUES.index("S"),
+    }
+    return np.column_stack([features[name] for name in feature_names]).astype(
+        np.float64
+    )
+
+
+def build_surface(
+    estimator: Any, axes: Dict[str, Any], dtype: Any = np.float16
+) -> np.ndarray:
+    """
+    Avalia predict_proba do estimador em toda a grade.
+
+    Args:
+        estimator: Estimador treinado, com predict_proba.
+        axes (Dict[str, Any]): Eixos gerados por surface_axes.
+        dtype: Tipo dos valores armazenados (float16 mantém o arquivo compacto).
+
+    Returns:
+        np.ndarray: Probabilidades de sobrevivência no formato
+        (Pclass, Sex_male, Embarked, SibSp, Parch, Age, Fare).
+    """
+    age = np.asarray(axes["age_nodes"])
+    fare = np.asarray(axes["fare_nodes"])
+    age_grid, fare_grid = (g.ravel() for g in np.meshgrid(age, fare, indexing="ij"))
+    discrete = list(
+        product(
+            range(len(PCLASS_VALUES)),
+            SEX_MALE_VALUES,
+            range(len(EMBARKED_VALUES)),
+            range(axes["sibsp_max"] + 1),
+            range(axes["parch_max"] + 1),
+        )
+    )
+
+    surface = np.empty((len(discrete), age_grid.size), dtype=dtype)
+    # Uma chamada a predict_proba por combinação discreta (Age x Fare inteiros)
+    for row, (pclass, sex_male, embarked, sibsp, parch) in enumerate(discrete):
+        n = age_grid.size
+        X = _feature_matrix(
+            axes["feature_names"],
+            {
+                "Pclass": np.full(n, PCLASS_VALUES[pclass]),
+                "Sex_male": np.full(n, sex_male),
+                "Embarked": np.full(n, embarked),
+                "SibSp": np.full(n, sibsp),
+                "Parch": np.full(n, parch),
+                "Age": age_grid,
+                "Fare": fare_grid,
+            },
+        )
+        surface[row] = estimator.predict_proba(X)[:, 1]
+
+    return surface.reshape(
+        len(PCLASS_VALUES),
+        len(SEX_MALE_VALUES),
+        len(EMBARKED_VALUES),
+        axes["sibsp_max"] + 1,
+        axes["parch_max"] + 1,
+        age.size,
+        fare.size,
+    )
+
+
+def sample_features(
+    feature_names: List[str], n: int = 100_000, seed: int = 42
+) -> np.ndarray:
+    """
+    Amostra o espaço de entrada da API (limites do PassengerRequest e valores
+    além dos eixos da grade), na ordem de colunas do modelo.
+    """
+    rng = np.random.default_rng(seed)
+    return _feature_matrix(
+        feature_names,
+        {
+            "Pclass": rng.integers(1, 4, n),
+            "Sex_male": rng.integers(0, 2, n),
+            "Embarked": rng.integers(0, len(EMBARKED_VALUES), n),
+            "SibSp": rng.integers(0, DEFAULT_SIBSP_MAX + 1, n),
+            "Parch": rng.integers(0, DEFAULT_PARCH_MAX + 1, n),
+            "Age": rng.uniform(0, DEFAULT_AGE_MAX, n),
+            "Fare": rng.uniform(0, DEFAULT_FARE_MAX, n),
+        },
+    )
+
+
+def surface_error(model: "SurfaceModel", estimator: Any, X: np.ndarray) -> Dict[str, float]:
+    """
+    Compara a superfície com o modelo exato em uma amostra.
+
+    Returns:
+        Dict[str, float]: Erro absoluto máximo, médio e p99, e a fração de
+        predições em que a classe (limiar 0.5) muda.
+    """
+    approx = model.predict_proba(X)[:, 1]
+    exact = estimator.predict_proba(X)[:, 1]
+    error = np.abs(approx - exact)
+    return {
+        "max_error": float(error.max()),
+        "mean_error": float(error.mean()),
+        "p99_error": float(np.quantile(error, 0.99)),
+        "flip_rate": float(np.mean((approx >= 0.5) != (exact >= 0.5))),
+    }
+
+
+def save_surface(
+    surface: np.ndarray,
+    axes: Dict[str, Any],
+    path_prefix: str,
+    report: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, str]:
+    """
+    Grava a grade em '<prefixo>.surface.npy' (formato que permite mmap) e os
+    eixos, com o relatório do build, em '<prefixo>.surface.json'.
+
+    Returns:
+        Tuple[str, str]: Caminhos da grade e dos eixos.
+    """
+    surface_path = f"{path_prefix}{SURFACE_EXTENSION}"
+    axes_path = f"{path_prefix}{AXES_EXTENSION}"
+    np.save(surface_path, surface)
+    with open(axes_path, "w", encoding="utf-8") as f:
+        json.dump({**axes, "report": report or {}}, f, indent=2)
+    return surface_path, axes_path
+
+
+class SurfaceModel:
+    """
+    Aproximação de predict_proba por uma superfície pré-calculada.
+
+    As features discretas (Pclass, Sex, Embarked, SibSp, Parch) indexam a
+    grade diretamente; Age e Fare são interpoladas de forma bilinear entre os
+    nós vizinhos. SibSp, Parch, Age e Fare fora dos eixos usam a borda da grade.
+    """
+
+    def __init__(self, surface: np.ndarray, axes: Dict[str, Any]):
+        self._surface = surface
+        self.feature_names_in_ = np.asarray(axes["feature_names"], dtype=str)
+        self.classes_ = np.array([0, 1])
+        self.report: Dict[str, Any] = axes.get("report", {})
+        self._sibsp_max = int(axes["sibsp_max"])
+        self._parch_max = int(axes["parch_max"])
+        self._age_nodes = np.asarray(axes["age_nodes"], dtype=np.float64)
+        self._fare_nodes = np.asarray(axes["fare_nodes"], dtype=np.float64)
+        self._columns = {
+            str(name): i for i, name in enumerate(self.feature_names_in_)
+        }
+
+    @classmethod
+    def load(cls, surface_path: str) -> "SurfaceModel":
+        """
+        Carrega a superfície com mmap: só as páginas consultadas vão para a
+        memória, e processos no mesmo host compartilham o cache de páginas.
+        """
+        if not surface_path.endswith(SURFACE_EXTENSION):
+            raise ValueError(f"Arquivo de superfície inválido: '{surface_path}'")
+        axes_path = surface_path[: -len(SURFACE_EXTENSION)] + AXES_EXTENSION
+        with open(axes_path, encoding="utf-8") as f:
+            axes = json.load(f)
+        return cls(np.load(surface_path, mmap_mode="r"), axes)
+
+    @property
+    def nbytes(self) -> int:
+        """Tamanho da grade, em bytes (limite superior do que fica residente)."""
+        return int(self._surface.nbytes)
+
+    @property
+    def n_features_in_(self) -> int:
+        """Número de features esperado pelo modelo."""
+        return len(self.feature_names_in_)
+
+    @staticmethod
+    def _bracket(nodes: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Índice do nó à esquerda e o peso do nó à direita, para cada valor."""
+        values = np.clip(values, nodes[0], nodes[-1])
+        left = np.clip(np.searchsorted(nodes, values, side="right") - 1, 0, len(nodes) - 2)
+        weight = (values - nodes[left]) / (nodes[left + 1] - nodes[left])
+        return left, weight
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """
+        Calcula as probabilidades de cada classe por consulta à superfície.
+
+        Args:
+            X: Matriz 2D (n_amostras, n_features), na ordem de feature_names_in_.
+
+        Returns:
+            np.ndarray: Matriz (n_amostras, 2).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X deve ser uma matriz 2D.")
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X tem {X.shape[1]} features, mas o modelo espera "
+                f"{self.n_features_in_}."
+            )
+
+        def column(name: str) -> np.ndarray:
+            return X[:, self._columns[name]]
+
+        pclass = np.clip(column("Pclass").astype(np.int64), 1, 3) - 1
+        sex_male = (column("Sex_male") > 0.5).astype(np.int64)
+        # Embarked_Q e Embarked_S zerados = C (índices de EMBARKED_VALUES)
+        embarked = np.where(
+            column("Embarked_Q") > 0.5, 1, np.where(column("Embarked_S") > 0.5, 2, 0)
+        )
+        sibsp = np.clip(column("SibSp").astype(np.int64), 0, self._sibsp_max)
+        parch = np.clip(column("Parch").astype(np.int64), 0, self._parch_max)
+        age, age_weight = self._bracket(self._age_nodes, column("Age"))
+        fare, fare_weight = self._bracket(self._fare_nodes, column("Fare"))
+
+        def corner(age_index: np.ndarray, fare_index: np.ndarray) -> np.ndarray:
+            return self._surface[
+                pclass, sex_male, embarked, sibsp, parch, age_index, fare_index
+            ].astype(np.float64)
+
+        positive = (
+            (1 - age_weight) * (1 - fare_weight) * corner(age, fare)
+            + age_weight * (1 - fare_weight) * corner(age + 1, fare)
+            + (1 - age_weight) * fare_weight * corner(age, fare + 1)
+            + age_weight * fare_weight * corner(age + 1, fare + 1)
+        )
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Retorna a classe mais provável para cada amostra."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
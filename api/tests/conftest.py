@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import os
 
 from src.repository.passenger_repository import PassengerRepository
+from src.repository.dynamodb_client import reset_dynamodb_resource
 from src.services.predict_service import PredictionService
 from src.controllers.passenger_controller import PassengerController
 
@@ -25,6 +26,8 @@ def aws_credentials():
 def dynamodb_table():
     """Cria uma tabela DynamoDB mockada para os testes."""
     with mock_aws():
+        # O resource compartilhado precisa ser criado dentro do mock
+        reset_dynamodb_resource()
         dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
         table_name = os.environ.get("DYNAMODB_TABLE_NAME", "test-table")
         dynamodb.create_table(
@@ -36,6 +39,7 @@ def dynamodb_table():
             ProvisionedThroughput={"ReadCapacityUnits": 1, "WriteCapacityUnits": 1},
         )
         yield
+        reset_dynamodb_resource()
 
 
 @fixture
@@ -47,7 +51,7 @@ def passenger_repository(dynamodb_table):
 @fixture
 def passenger_controller(passenger_repository, mock_prediction_service):
     """Fixture para criar a instância do controller com dependências mockadas."""
-    return PassengerController(prediction_service=mock_prediction_service())
+    return PassengerController(prediction_service=mock_prediction_service)
 
 
 @fixture
@@ -56,6 +60,7 @@ def mock_prediction_service():
     with patch("src.services.predict_service.PredictionService") as mock_service:
         mock_instance = MagicMock()
         mock_instance.predict.return_value = 0.75
+        mock_instance.model_name = "model"
         mock_service.return_value = mock_instance
         yield mock_instance
 
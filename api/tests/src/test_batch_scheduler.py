@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.passenger_request import PassengerRequest
+from src.controllers.passenger_controller import PassengerController
+from src.services.batch_scheduler import InferenceScheduler
+
+
+def make_service(name: str = "model") -> MagicMock:
+    """Serviço falso: a probabilidade de cada item é o próprio item."""
+    service = MagicMock()
+    service.model_name = name
+    service.predict_batch.side_effect = lambda batch: [float(item) for item in batch]
+    return service
+
+
+@pytest.fixture
+def scheduler():
+    """Scheduler com janela longa: os lotes fecham pelo tamanho máximo."""
+    scheduler = InferenceScheduler(window_ms=5000, max_batch_size=4)
+    yield scheduler
+    scheduler.close()
+
+
+def test_concurrent_requests_share_one_predict_call(scheduler):
+    """
+    Testa se pedidos concorrentes viram uma única chamada a predict_batch e
+    se cada Future recebe a sua fatia, na ordem.
+    """
+    # Arrange
+    service = make_service()
+
+    # Act
+    futures = [
+        scheduler.submit(service, [0.1]),
+        scheduler.submit(service, [0.2, 0.3]),
+        scheduler.submit(service, [0.4]),
+    ]
+    results = [future.result(timeout=5) for future in futures]
+
+    # Assert
+    assert results == [[0.1], [0.2, 0.3], [0.4]]
+    service.predict_batch.assert_called_once_with([0.1, 0.2, 0.3, 0.4])
+    assert (scheduler.batches, scheduler.rows) == (1, 4)
+
+
+def test_batch_closes_at_window_end():
+    """Testa se um pedido sozinho é executado ao fim da janela."""
+    scheduler = InferenceScheduler(window_ms=1, max_batch_size=64)
+    service = make_service()
+
+    try:
+        assert scheduler.predict_batch(service, [0.7]) == [0.7]
+    finally:
+        scheduler.close()
+
+
+def test_requests_are_grouped_by_model(scheduler):
+    """Testa se pedidos de modelos diferentes não são misturados no mesmo lote."""
+    # Arrange
+    model_a, model_b = make_service("a"), make_service("b")
+
+    # Act
+    futures = [
+        scheduler.submit(model_a, [0.1]),
+        scheduler.submit(model_b, [0.2]),
+        scheduler.submit(model_a, [0.3, 0.4]),
+    ]
+    results = [future.result(timeout=5) for future in futures]
+
+    # Assert
+    assert results == [[0.1], [0.2], [0.3, 0.4]]
+    model_a.predict_batch.assert_called_once_with([0.1, 0.3, 0.4])
+    model_b.predict_batch.assert_called_once_with([0.2])
+
+
+def test_failed_request_does_not_fail_the_others(scheduler):
+    """
+    Testa se, quando o lote agrupado falha, cada pedido é repetido sozinho e
+    só o pedido inválido recebe a exceção.
+    """
+    # Arrange
+    service = make_service()
+
+    # Act
+    futures = [
+        scheduler.submit(service, [0.1, 0.2]),
+        scheduler.submit(service, ["inválido", 0.3]),
+    ]
+
+    # Assert
+    assert futures[0].result(timeout=5) == [0.1, 0.2]
+    with pytest.raises(ValueError):
+        futures[1].result(timeout=5)
+
+
+def test_empty_batch_resolves_immediately(scheduler):
+    """Testa que um lote vazio não passa pela thread nem pelo modelo."""
+    service = make_service()
+
+    assert scheduler.predict_batch(service, []) == []
+    service.predict_batch.assert_not_called()
+
+
+def test_controller_predicts_through_scheduler(passenger_repository, scheduler):
+    """Testa se o controller usa o scheduler configurado no POST."""
+    # Arrange
+    service = MagicMock()
+    service.model_name = "model"
+    service.predict_batch.return_value = [0.8]
+    controller = PassengerController(
+        prediction_service=service, inference_scheduler=scheduler
+    )
+    scheduler.max_batch_size = 1
+    request = PassengerRequest(
+        PassengerId="sched-1",
+        Pclass=1,
+        Sex="female",
+        Age=30.0,
+        SibSp=0,
+        Parch=0,
+        Fare=80.0,
+        Embarked="S",
+    )
+
+    # Act
+    result = controller.save_passenger([request])
+
+    # Assert
+    assert result[0].survival_probability == 0.8
+    service.predict_batch.assert_called_once_with([request])
+    assert scheduler.batches == 1
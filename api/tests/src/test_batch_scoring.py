@@ -0,0 +1,89 @@
+import io
+
+import pytest
+
+from src.services.batch_scoring import score_csv
+from src.services.predict_service import PredictionService
+
+# As colunas chegam na ordem do modelo, só sem os nomes (ver PredictionService)
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+KAGGLE_CSV = (
+    "PassengerId,Survived,Pclass,Name,Sex,Age,SibSp,Parch,Ticket,Fare,Cabin,Embarked\n"
+    '1,0,3,"Braund, Mr. Owen Harris",male,22,1,0,A/5 21171,7.25,,S\n'
+    '2,1,1,"Cumings, Mrs. John",female,38,1,0,PC 17599,71.2833,C85,C\n'
+    '3,1,3,"Heikkinen, Miss. Laina",female,,0,0,STON/O2,7.925,,\n'
+    '4,0,2,"Kelly, Mr. James",male,34.5,0,0,330911,,,Q\n'
+    '5,1,3,"Wilkes, Mrs. James",female,47,1,0,363272,7,,S\n'
+)
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Serviço com o modelo real, carregado uma vez para o módulo."""
+    return PredictionService(model_name="model", method="joblib")
+
+
+def _score(service, text: str, **kwargs) -> list:
+    output = io.StringIO()
+    score_csv(io.StringIO(text), output, service, **kwargs)
+    return output.getvalue().splitlines()
+
+
+def test_score_csv_matches_predict(service):
+    """
+    Testa se o CSV pontuado em blocos bate com predict() linha a linha,
+    inclusive com Age, Fare e Embarked ausentes.
+    """
+    # Act
+    lines = _score(service, KAGGLE_CSV, chunk_size=2)
+
+    # Assert
+    assert lines[0] == "PassengerId,Survived,survival_probability"
+    assert len(lines) == 6
+    missing = {
+        "PassengerId": "3",
+        "Pclass": 3,
+        "Sex": "female",
+        "Age": None,
+        "SibSp": 0,
+        "Parch": 0,
+        "Fare": 7.925,
+        "Embarked": None,
+    }
+    expected = service.predict(missing)
+    passenger_id, survived, probability = lines[3].split(",")
+    assert passenger_id == "3"
+    assert probability == f"{expected:.4f}"
+    assert survived == str(int(expected >= 0.5))
+
+
+def test_score_csv_with_workers_matches_single_process(service):
+    """Testa se o modo com workers (fork) gera a mesma saída, na mesma ordem."""
+    # Arrange
+    text = KAGGLE_CSV + "".join(
+        f'{i},0,{1 + i % 3},"Nome {i}",{"male" if i % 2 else "female"},{i % 70},0,0,T,{i % 90},,S\n'
+        for i in range(6, 60)
+    )
+
+    # Act
+    single = _score(service, text, chunk_size=7)
+    forked = _score(service, text, chunk_size=7, workers=2)
+
+    # Assert
+    assert forked == single
+    assert len(single) == 1 + 59
+
+
+def test_score_csv_rejects_missing_columns(service):
+    """Testa o erro quando faltam colunas usadas pelo modelo."""
+    with pytest.raises(ValueError, match="Colunas obrigatórias ausentes: Fare"):
+        _score(service, "PassengerId,Pclass,Sex,Age,SibSp,Parch,Embarked\n")
+
+
+def test_score_csv_reports_invalid_line(service):
+    """Testa se valores inválidos indicam a linha do arquivo."""
+    text = KAGGLE_CSV + '6,0,primeira,"X",male,1,0,0,T,1,,S\n'
+
+    with pytest.raises(ValueError, match="Linha 7 inválida"):
+        _score(service, text, chunk_size=2)
@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock, patch
+
+from src.metrics import cold_start
+
+
+def test_time_import_records_module():
+    """
+    Testa se o tempo de importação de um módulo é registrado.
+    """
+    module = cold_start.time_import("json")
+
+    assert module.__name__ == "json"
+    assert cold_start.report()["imports_ms"]["json"] >= 0
+
+
+def test_phase_records_duration():
+    """
+    Testa se as etapas do INIT aparecem no relatório.
+    """
+    with cold_start.phase("test_phase"):
+        pass
+
+    report = cold_start.report()
+    assert report["phases_ms"]["test_phase"] >= 0
+    assert report["init_total_ms"] > 0
+    assert report["modules_loaded"] >= 0
+
+
+def test_log_once_logs_structured_report_once():
+    """
+    Testa se o relatório é registrado uma única vez, como dicionário estruturado.
+    """
+    logger = MagicMock()
+
+    with patch.object(cold_start, "_logged", False):
+        assert cold_start.log_once(logger) is True
+        assert cold_start.log_once(logger) is False
+
+    logger.info.assert_called_once()
+    payload = logger.info.call_args[0][0]
+    assert payload["event"] == "cold_start_report"
+    assert "imports_ms" in payload
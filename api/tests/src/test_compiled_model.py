@@ -0,0 +1,212 @@
+import copy
+import os
+
+import joblib
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.services.compiled_model import CompiledModel, export_model
+from src.services.predict_service import FEATURE_NAMES, PredictionService
+
+
+def titanic_feature_grid(n: int = 5000, seed: int = 7, names=None) -> np.ndarray:
+    """Amostra o espaço de features do Titanic, com as colunas na ordem de names."""
+    rng = np.random.default_rng(seed)
+    columns = {
+        "Pclass": rng.integers(1, 4, n),
+        "Age": rng.uniform(0, 120, n),
+        "SibSp": rng.integers(0, 9, n),
+        "Parch": rng.integers(0, 7, n),
+        "Fare": rng.uniform(0, 520, n),
+        "Sex_male": rng.integers(0, 2, n),
+        "Embarked_Q": rng.integers(0, 2, n),
+        "Embarked_S": rng.integers(0, 2, n),
+    }
+    return np.column_stack([columns[name] for name in names or FEATURE_NAMES]).astype(
+        float
+    )
+
+
+@pytest.fixture(scope="module")
+def sklearn_model():
+    """Modelo de produção carregado via joblib."""
+    return joblib.load(os.path.join("modelos", "model.joblib"))
+
+
+@pytest.fixture(scope="module")
+def model_features(sklearn_model):
+    """Ordem das colunas usada no treino do modelo de produção."""
+    return list(sklearn_model.feature_names_in_)
+
+
+@pytest.fixture(scope="module")
+def positional_model(sklearn_model):
+    """
+    Cópia do modelo sem feature_names_in_, para comparações com matrizes NumPy
+    já montadas na ordem de treino (via model_features).
+    """
+    model = copy.deepcopy(sklearn_model)
+    del model.feature_names_in_
+    return model
+
+
+def test_compiled_forest_matches_predict_proba(
+    sklearn_model, positional_model, model_features, tmp_path
+):
+    """Testa se o modelo compilado reproduz o predict_proba da floresta."""
+    file_path = export_model(sklearn_model, str(tmp_path / "model.npz"))
+    compiled = CompiledModel.load(file_path)
+
+    X = titanic_feature_grid(names=model_features)
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), positional_model.predict_proba(X), atol=1e-9
+    )
+    np.testing.assert_array_equal(compiled.predict(X), positional_model.predict(X))
+    assert list(compiled.feature_names_in_) == model_features
+
+
+def test_compiled_model_rejects_wrong_feature_count(sklearn_model, tmp_path):
+    """Testa erro quando X não tem o número de features do modelo."""
+    compiled = CompiledModel.load(
+        export_model(sklearn_model, str(tmp_path / "model.npz"))
+    )
+
+    with pytest.raises(ValueError, match="features"):
+        compiled.predict_proba(np.zeros((2, 5)))
+
+
+def test_compiled_forest_handles_threshold_boundaries(
+    sklearn_model, positional_model, model_features, tmp_path
+):
+    """Testa valores exatamente sobre os limiares das árvores."""
+    compiled = CompiledModel.load(
+        export_model(sklearn_model, str(tmp_path / "model.npz"))
+    )
+    tree = sklearn_model.estimators_[0].tree_
+    split_nodes = tree.children_left != -1
+
+    X = titanic_feature_grid(n=int(split_nodes.sum()), names=model_features)
+    X[np.arange(X.shape[0]), tree.feature[split_nodes]] = tree.threshold[split_nodes]
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), positional_model.predict_proba(X), atol=1e-9
+    )
+
+
+def test_committed_compiled_model_is_in_sync(positional_model, model_features):
+    """Testa se modelos/model.npz corresponde ao modelos/model.joblib versionado."""
+    compiled = CompiledModel.load(os.path.join("modelos", "model.npz"))
+    X = titanic_feature_grid(n=1000, seed=11, names=model_features)
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), positional_model.predict_proba(X), atol=1e-9
+    )
+
+
+def test_compiled_linear_model_matches_predict_proba(tmp_path):
+    """Testa a exportação de um modelo linear (coeficientes)."""
+    from sklearn.linear_model import LogisticRegression
+
+    X = titanic_feature_grid(n=500)
+    y = (X[:, 5] == 0).astype(int)
+    estimator = LogisticRegression(max_iter=1000).fit(X, y)
+
+    compiled = CompiledModel.load(export_model(estimator, str(tmp_path / "lr.npz")))
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), estimator.predict_proba(X), atol=1e-9
+    )
+
+
+def test_export_unsupported_estimator(tmp_path):
+    """Testa erro ao exportar um estimador não suportado."""
+
+    class Unsupported:
+        classes_ = np.array([0, 1])
+
+    with pytest.raises(ValueError, match="não suportado"):
+        export_model(Unsupported(), str(tmp_path / "x.npz"))
+
+
+def test_prediction_service_compiled_method():
+    """Testa se o PredictionService carrega e usa o modelo compilado."""
+    service = PredictionService(model_name="model", method="compiled")
+
+    assert isinstance(service.model, CompiledModel)
+
+    probability = service.predict(
+        {
+            "Pclass": 1,
+            "Sex": "female",
+            "Age": 38.0,
+            "SibSp": 1,
+            "Parch": 0,
+            "Fare": 71.2833,
+            "Embarked": "C",
+        }
+    )
+    assert 0.0 <= probability <= 1.0
+
+
+@patch("os.path.exists")
+def test_prediction_service_compiled_file_not_found(mock_exists):
+    """Testa erro quando o arquivo .npz não existe."""
+    mock_exists.side_effect = [False, False]
+
+    with pytest.raises(FileNotFoundError, match="model.npz"):
+        PredictionService(model_name="model", method="compiled")
+
+
+@pytest.mark.parametrize("method", ["joblib", "compiled"])
+def test_prediction_service_follows_model_feature_order(
+    method, positional_model, model_features
+):
+    """Testa se o pré-processamento entrega as colunas na ordem de feature_names_in_."""
+    # Arrange
+    service = PredictionService(model_name="model", method=method)
+    passenger = {
+        "Pclass": 3,
+        "Sex": "male",
+        "Age": 22.0,
+        "SibSp": 1,
+        "Parch": 2,
+        "Fare": 7.25,
+        "Embarked": "Q",
+    }
+    by_name = {
+        "Pclass": 3,
+        "Age": 22.0,
+        "SibSp": 1,
+        "Parch": 2,
+        "Fare": 7.25,
+        "Sex_male": 1,
+        "Embarked_Q": 1,
+        "Embarked_S": 0,
+    }
+    expected_row = [by_name[name] for name in model_features]
+
+    # Act
+    row = service._preprocess(passenger)
+    matrix = service._preprocess_batch([passenger, passenger])
+
+    # Assert
+    assert row.tolist() == [expected_row]
+    assert matrix.tolist() == [expected_row, expected_row]
+    assert service.predict(passenger) == pytest.approx(
+        positional_model.predict_proba(np.array([expected_row]))[0][1]
+    )
+
+
+def test_prediction_service_rejects_unknown_model_features(sklearn_model):
+    """Testa erro ao carregar um modelo treinado com outras features."""
+    service = PredictionService(model_name="model", method="compiled")
+    model = copy.deepcopy(sklearn_model)
+    model.feature_names_in_ = np.array(
+        ["Pclass", "Age", "SibSp", "Parch", "Fare", "Sex_male", "Embarked_C", "Title"],
+        dtype=object,
+    )
+
+    with pytest.raises(ValueError, match="não correspondem"):
+        service.model = model
@@ -0,0 +1,75 @@
+import gzip
+
+import pytest
+
+from src.adapter import compression
+from src.adapter.compression import compress, negotiate_encoding
+
+
+class FakeBrotli:
+    """Substituto do módulo brotli para os testes."""
+
+    @staticmethod
+    def compress(data, quality):
+        return b"br:" + data
+
+
+@pytest.fixture
+def with_brotli(monkeypatch):
+    """Simula o pacote brotli instalado."""
+    monkeypatch.setattr(compression, "brotli", FakeBrotli)
+
+
+@pytest.fixture
+def without_brotli(monkeypatch):
+    """Simula o pacote brotli ausente."""
+    monkeypatch.setattr(compression, "brotli", None)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, GZIP", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("br", None),
+    ],
+)
+def test_negotiate_without_brotli(without_brotli, header, expected):
+    """Testa a negociação quando só gzip está disponível."""
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, br", "br"),
+        ("gzip, deflate, br;q=0.5", "gzip"),
+        ("br;q=0", None),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("gzip;q=abc, br;q=0.1", "br"),
+    ],
+)
+def test_negotiate_with_brotli(with_brotli, header, expected):
+    """Testa a preferência por brotli e os pesos q."""
+    assert negotiate_encoding(header) == expected
+
+
+def test_gzip_is_deterministic():
+    """Testa se o gzip gera sempre os mesmos bytes (mtime fixo)."""
+    data = b'{"passengers": []}' * 100
+
+    assert compress(data, "gzip") == compress(data, "gzip")
+    assert gzip.decompress(compress(data, "gzip")) == data
+
+
+def test_compress_unsupported_encoding(without_brotli):
+    """Testa erro com codificação não disponível."""
+    with pytest.raises(ValueError, match="não suportada"):
+        compress(b"data", "br")
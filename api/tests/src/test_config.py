@@ -56,3 +56,39 @@ class TestAppConfig:
         """Testa comportamento com ambiente que não é production nem development."""
         assert AppConfig.is_production() is False
         assert AppConfig.is_development() is False
+
+    @patch.dict(
+        "os.environ", {"PREDICTION_CACHE_SIZE": "512", "PREDICTION_CACHE_TTL": "60"}
+    )
+    def test_prediction_cache_settings(self):
+        """Testa a leitura das configurações do cache de predições."""
+        assert AppConfig.get_prediction_cache_size() == 512
+        assert AppConfig.get_prediction_cache_ttl() == 60.0
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_prediction_cache_disabled_by_default(self):
+        """Testa que o cache de predições é opcional (desativado por padrão)."""
+        assert AppConfig.get_prediction_cache_size() == 0
+        assert AppConfig.get_prediction_cache_ttl() is None
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_passenger_cache_defaults(self):
+        """Testa os padrões do cache de leitura de passageiros."""
+        assert AppConfig.get_passenger_cache_size() == 1024
+        assert AppConfig.get_passenger_cache_ttl() == 300.0
+        assert AppConfig.get_passenger_negative_cache_ttl() == 5.0
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_inference_batching_disabled_by_default(self):
+        """Testa que o micro-batching de predições é opcional (janela 0)."""
+        assert AppConfig.get_inference_batch_window_ms() == 0.0
+        assert AppConfig.get_inference_batch_max_size() == 64
+
+    @patch.dict(
+        "os.environ",
+        {"INFERENCE_BATCH_WINDOW_MS": "2.5", "INFERENCE_BATCH_MAX_SIZE": "32"},
+    )
+    def test_inference_batching_settings(self):
+        """Testa a leitura da janela e do tamanho máximo do micro-batching."""
+        assert AppConfig.get_inference_batch_window_ms() == 2.5
+        assert AppConfig.get_inference_batch_max_size() == 32
@@ -4,6 +4,7 @@ from src.models.api_response import PredictionResult, DeleteResponse
 from unittest.mock import MagicMock, patch
 import pytest
 from decimal import Decimal
+import json
 
 
 def test_create_prediction_success(passenger_controller):
@@ -13,7 +14,7 @@ def test_create_prediction_success(passenger_controller):
     """
     # Mock the prediction service to return expected value
     with patch.object(
-        passenger_controller.prediction_service, "predict", return_value=0.6631
+        passenger_controller.prediction_service, "predict_batch", return_value=[0.6631]
     ):
         requests_data = [
             PassengerRequest(
@@ -44,7 +45,9 @@ def test_create_prediction_multiple_passengers(passenger_controller):
     """
     # Mock the prediction service to return different values for each passenger
     with patch.object(
-        passenger_controller.prediction_service, "predict", side_effect=[0.6631, 0.8543]
+        passenger_controller.prediction_service,
+        "predict_batch",
+        return_value=[0.6631, 0.8543],
     ):
         requests_data = [
             PassengerRequest(
@@ -82,13 +85,178 @@ def test_create_prediction_multiple_passengers(passenger_controller):
         assert response[1].prediction == "survived"
 
 
+def test_create_prediction_uses_single_batch_call(passenger_controller):
+    """
+    Testa se o controller pontua todo o lote com uma única chamada ao serviço.
+    """
+    with patch.object(
+        passenger_controller.prediction_service,
+        "predict_batch",
+        return_value=[0.1, 0.9, 0.5],
+    ) as mock_predict_batch:
+        requests_data = [
+            PassengerRequest(
+                PassengerId=str(i),
+                Pclass=3,
+                Sex="male",
+                Age=22.0,
+                SibSp=1,
+                Parch=0,
+                Fare=7.25,
+                Embarked="S",
+            )
+            for i in range(3)
+        ]
+
+        response = passenger_controller.save_passenger(requests_data)
+
+        mock_predict_batch.assert_called_once_with(requests_data)
+        assert [r.passenger_id for r in response] == ["0", "1", "2"]
+        assert [r.survival_probability for r in response] == [0.1, 0.9, 0.5]
+
+
+def test_create_prediction_bulk_uses_save_many(passenger_controller):
+    """
+    Testa se lotes com mais de um passageiro usam a inclusão em lote.
+    """
+    requests_data = [
+        PassengerRequest(
+            PassengerId=f"bulk-{i}",
+            Pclass=3,
+            Sex="male",
+            Age=22.0,
+            SibSp=1,
+            Parch=0,
+            Fare=7.25,
+            Embarked="S",
+        )
+        for i in range(3)
+    ]
+
+    with patch.object(
+        passenger_controller.prediction_service,
+        "predict_batch",
+        return_value=[0.1, 0.9, 0.5],
+    ), patch.object(
+        passenger_controller.passenger_repository,
+        "save_many",
+        wraps=passenger_controller.passenger_repository.save_many,
+    ) as mock_save_many, patch.object(
+        passenger_controller.passenger_repository, "save"
+    ) as mock_save:
+        passenger_controller.save_passenger(requests_data)
+
+    mock_save_many.assert_called_once()
+    mock_save.assert_not_called()
+    assert passenger_controller.passenger_repository.count() == 3
+
+
+def test_create_prediction_bulk_reports_existing(passenger_controller):
+    """
+    Testa se a inclusão em lote retorna o resultado por item, informando os
+    passageiros já existentes sem descartar os que foram gravados.
+    """
+    passenger_controller.passenger_repository.save({"passenger_id": "dup-1"})
+    requests_data = [
+        PassengerRequest(
+            PassengerId=f"dup-{i}",
+            Pclass=3,
+            Sex="male",
+            Age=22.0,
+            SibSp=1,
+            Parch=0,
+            Fare=7.25,
+            Embarked="S",
+        )
+        for i in range(2)
+    ]
+
+    with patch.object(
+        passenger_controller.prediction_service,
+        "predict_batch",
+        return_value=[0.1, 0.9],
+    ):
+        results = passenger_controller.save_passenger(requests_data)
+
+    # O item novo é gravado; o existente é informado, sem erro para o lote
+    assert [(r.passenger_id, r.status) for r in results] == [
+        ("dup-0", "created"),
+        ("dup-1", "exists"),
+    ]
+    assert results[0].survival_probability == 0.1
+    assert passenger_controller.passenger_repository.count() == 2
+
+    # Reenviar o mesmo lote é seguro: todos os itens voltam como 'exists'
+    with patch.object(
+        passenger_controller.prediction_service,
+        "predict_batch",
+        return_value=[0.1, 0.9],
+    ):
+        retry = passenger_controller.save_passenger(requests_data)
+    assert [r.status for r in retry] == ["exists", "exists"]
+
+
+def test_create_prediction_reports_model_version(passenger_controller):
+    """
+    Testa se o modelo solicitado é obtido do registro e reportado na resposta.
+    """
+    selected_service = MagicMock()
+    selected_service.model_name = "v2"
+    selected_service.predict_batch.return_value = [0.42]
+    passenger_controller.model_registry = MagicMock()
+    passenger_controller.model_registry.get.return_value = selected_service
+
+    requests_data = [
+        PassengerRequest(
+            PassengerId="1",
+            Pclass=3,
+            Sex="male",
+            Age=22.0,
+            SibSp=1,
+            Parch=0,
+            Fare=7.25,
+            Embarked="S",
+        )
+    ]
+
+    with patch.object(passenger_controller.passenger_repository, "save") as mock_save:
+        response = passenger_controller.save_passenger(requests_data, model_name="v2")
+
+    passenger_controller.model_registry.get.assert_called_once_with("v2")
+    assert response[0].model_version == "v2"
+    assert mock_save.call_args[0][0]["model_version"] == "v2"
+
+
+def test_create_prediction_unknown_model_without_registry(passenger_controller):
+    """
+    Testa erro ao solicitar outro modelo quando não há registro configurado.
+    """
+    requests_data = [
+        PassengerRequest(
+            PassengerId="1",
+            Pclass=3,
+            Sex="male",
+            Age=22.0,
+            SibSp=1,
+            Parch=0,
+            Fare=7.25,
+            Embarked="S",
+        )
+    ]
+
+    with pytest.raises(ValueError, match="Modelo 'v2' não encontrado"):
+        passenger_controller.save_passenger(requests_data, model_name="v2")
+
+
 def test_create_prediction_validation_error(passenger_controller):
     """
     Testa o tratamento de erro de validação na criação de predições.
     """
     # Mock do serviço de predição para lançar ValueError
     with patch.object(
-        passenger_controller.prediction_service, "predict", side_effect=ValueError("Invalid data")
+        passenger_controller.prediction_service,
+        "predict_batch",
+        side_effect=ValueError("Invalid data"),
     ):
         requests_data = [
             PassengerRequest(
@@ -113,7 +281,7 @@ def test_create_prediction_unexpected_error(passenger_controller):
     """
     # Mock do serviço de predição para retornar um valor válido
     with patch.object(
-        passenger_controller.prediction_service, "predict", return_value=0.75
+        passenger_controller.prediction_service, "predict_batch", return_value=[0.75]
     ):
         # Mock do repositório para lançar Exception
         passenger_controller.passenger_repository.save = MagicMock(
@@ -137,6 +305,47 @@ def test_create_prediction_unexpected_error(passenger_controller):
             passenger_controller.save_passenger(requests_data)
 
 
+def test_stream_passengers_in_chunks(passenger_controller):
+    """
+    Testa o NDJSON em blocos: uma predição por bloco, um resultado por linha,
+    linhas inválidas e repetidas sem interromper o processamento.
+    """
+    passenger_controller.prediction_service.predict_batch.side_effect = (
+        lambda batch: [0.9] * len(batch)
+    )
+    base = {
+        "Pclass": 1,
+        "Sex": "female",
+        "Age": 30.0,
+        "SibSp": 0,
+        "Parch": 0,
+        "Fare": 80.0,
+        "Embarked": "C",
+    }
+    lines = [
+        (1, json.dumps({**base, "PassengerId": "s1"})),
+        (2, json.dumps({**base, "PassengerId": "s2", "Age": -1})),
+        (3, "{invalid"),
+        (4, json.dumps({**base, "PassengerId": "s1"})),
+        (5, json.dumps({**base, "PassengerId": "s3"})),
+    ]
+
+    stream = passenger_controller.stream_passengers(iter(lines), chunk_size=2)
+    results = list(stream)
+
+    assert [r.status for r in results] == [
+        "created",
+        "invalid",
+        "invalid",
+        "exists",
+        "created",
+    ]
+    assert results[1].line == 2 and "Age" in results[1].error
+    assert results[2].line == 3
+    assert passenger_controller.prediction_service.predict_batch.call_count == 3
+    assert passenger_controller.passenger_repository.get_by_id("s3")["etag"]
+
+
 def test_get_all_passengers_success(passenger_controller):
     """
     Testa a recuperação bem-sucedida de todos os passageiros.
@@ -180,6 +389,61 @@ def test_get_all_passengers_success(passenger_controller):
     passenger_controller.passenger_repository.get_all.assert_called_once()
 
 
+def test_get_all_passengers_with_cursor(passenger_controller):
+    """
+    Testa a paginação por cursor repassando o token ao repositório.
+    """
+    passenger_controller.passenger_repository.get_all = MagicMock(
+        return_value={
+            "items": [{"passenger_id": "1", "survival_probability": 0.3}],
+            "count": 1,
+            "next_cursor": "proximo",
+        }
+    )
+
+    response = passenger_controller.get_all_passengers(limit=1, cursor="atual")
+
+    passenger_controller.passenger_repository.get_all.assert_called_once_with(
+        page=1, limit=1, cursor="atual"
+    )
+    assert response["pagination"]["next_cursor"] == "proximo"
+    assert response["pagination"]["has_next"] is True
+    # Por cursor o número da página é desconhecido e não há volta
+    assert response["pagination"]["page"] is None
+    assert response["pagination"]["has_previous"] is False
+
+
+def test_get_all_passengers_invalid_cursor(passenger_controller):
+    """
+    Testa se cursor inválido é tratado como erro de validação.
+    """
+    passenger_controller.passenger_repository.get_all = MagicMock(
+        side_effect=ValueError("Cursor de paginação inválido")
+    )
+
+    with pytest.raises(ValueError, match="Cursor de paginação inválido"):
+        passenger_controller.get_all_passengers(cursor="x")
+
+
+def test_get_all_passengers_uses_total_count(passenger_controller):
+    """
+    Testa se a paginação usa o total do repositório e não o tamanho da página.
+    """
+    passenger_controller.passenger_repository.get_all = MagicMock(
+        return_value={
+            "items": [{"passenger_id": str(i)} for i in range(10)],
+            "count": 10,
+            "total_count": 25,
+        }
+    )
+
+    response = passenger_controller.get_all_passengers(page=1, limit=10)
+
+    assert response["pagination"]["total_items"] == 25
+    assert response["pagination"]["total_pages"] == 3
+    assert response["pagination"]["has_next"] is True
+
+
 def test_get_all_passengers_error(passenger_controller):
     """
     Testa o tratamento de erro na recuperação de todos os passageiros.
@@ -227,6 +491,79 @@ def test_get_passenger_by_id_error(passenger_controller):
         passenger_controller.get_passenger_by_id("1")
 
 
+def test_save_passenger_persists_etag(passenger_controller):
+    """
+    Testa se o ETag é calculado na gravação e persistido com o item.
+    """
+    passenger_controller.prediction_service.predict_batch.return_value = [0.6631]
+    requests_data = [
+        PassengerRequest(
+            PassengerId="etag-1",
+            Pclass=3,
+            Sex="male",
+            Age=22.0,
+            SibSp=1,
+            Parch=0,
+            Fare=7.25,
+            Embarked="S",
+        )
+    ]
+
+    passenger_controller.save_passenger(requests_data)
+
+    stored = passenger_controller.passenger_repository.get_by_id("etag-1")
+    assert stored["etag"].startswith('"') and stored["etag"].endswith('"')
+    result = passenger_controller.get_passenger_if_modified("etag-1")
+    assert result["etag"] == stored["etag"]
+
+
+def test_get_passenger_if_modified(passenger_controller):
+    """
+    Testa o 'not modified' quando o If-None-Match traz o ETag do item.
+    """
+    passenger_controller.passenger_repository.get_by_id = MagicMock(
+        return_value={"passenger_id": "1", "survival_probability": 0.3, "etag": '"v1"'}
+    )
+
+    current = passenger_controller.get_passenger_if_modified("1", if_none_match='"v1"')
+    stale = passenger_controller.get_passenger_if_modified("1", if_none_match='"v0"')
+
+    assert current == {"etag": '"v1"', "not_modified": True, "passenger": None}
+    assert stale["not_modified"] is False
+    assert stale["passenger"]["passenger_id"] == "1"
+
+
+def test_get_all_passengers_not_modified(passenger_controller):
+    """
+    Testa o ETag da página: igual enquanto nada muda, diferente se o total mudar.
+    """
+    items = [
+        {"passenger_id": str(i), "survival_probability": 0.5, "etag": f'"{i}"'}
+        for i in range(3)
+    ]
+    passenger_controller.passenger_repository.get_all = MagicMock(
+        return_value={"items": items, "count": 3, "total_count": 3}
+    )
+
+    first = passenger_controller.get_all_passengers(page=1, limit=3)
+    again = passenger_controller.get_all_passengers(
+        page=1, limit=3, if_none_match=first["etag"]
+    )
+    passenger_controller.passenger_repository.get_all.return_value = {
+        "items": items,
+        "count": 3,
+        "total_count": 4,
+    }
+    changed = passenger_controller.get_all_passengers(
+        page=1, limit=3, if_none_match=first["etag"]
+    )
+
+    assert again["not_modified"] is True
+    assert again["items"] == []
+    assert changed["etag"] != first["etag"]
+    assert len(changed["items"]) == 3
+
+
 def test_delete_passenger_success(passenger_controller):
     """
     Testa a exclusão bem-sucedida de um passageiro.
@@ -264,7 +601,9 @@ class TestPassengerControllerAdvanced:
     def test_save_passenger_with_decimal_conversion(self, passenger_controller):
         """Testa se os valores float são convertidos para Decimal corretamente."""
         with patch.object(
-            passenger_controller.prediction_service, "predict", return_value=0.8542
+            passenger_controller.prediction_service,
+            "predict_batch",
+            return_value=[0.8542],
         ):
             requests_data = [
                 PassengerRequest(
@@ -300,7 +639,9 @@ class TestPassengerControllerAdvanced:
     ):
         """Testa se save_passenger retorna objetos PredictionResponse."""
         with patch.object(
-            passenger_controller.prediction_service, "predict", return_value=0.75
+            passenger_controller.prediction_service,
+            "predict_batch",
+            return_value=[0.75],
         ):
             requests_data = [
                 PassengerRequest(
@@ -325,7 +666,9 @@ class TestPassengerControllerAdvanced:
     def test_save_passenger_probability_rounding(self, passenger_controller):
         """Testa se a probabilidade é arredondada para 4 casas decimais."""
         with patch.object(
-            passenger_controller.prediction_service, "predict", return_value=0.123456789
+            passenger_controller.prediction_service,
+            "predict_batch",
+            return_value=[0.123456789],
         ):
             requests_data = [
                 PassengerRequest(
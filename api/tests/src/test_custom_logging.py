@@ -0,0 +1,159 @@
+import io
+import json
+import logging
+import os
+from logging import StreamHandler
+from unittest.mock import patch
+
+import pytest
+
+from src.logging import custom_logging
+from src.logging.custom_formatter import CustomFormatter
+from src.logging.custom_logging import flush_logs, get_logger
+
+
+@pytest.fixture
+def captured_logs():
+    """Redireciona a saída do listener de console para um buffer em memória."""
+    get_logger()
+    _, listener = custom_logging._listeners["console"]
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.setFormatter(CustomFormatter())
+    with patch.object(listener, "handlers", (handler,)):
+        yield stream
+        flush_logs()
+
+
+def _current_rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def test_get_logger_returns_cached_instance():
+    """
+    Testa se chamadas repetidas retornam o mesmo logger sem registrar novos.
+    """
+    # Arrange
+    first = get_logger()
+    registered = len(logging.Logger.manager.loggerDict)
+
+    # Act
+    for _ in range(100):
+        logger = get_logger()
+
+    # Assert
+    assert logger is first
+    assert len(logger.handlers) == 1
+    assert len(logging.Logger.manager.loggerDict) == registered
+
+
+def test_messages_are_written_as_json_by_listener(captured_logs):
+    """
+    Testa se as mensagens enfileiradas são formatadas em JSON pelo listener.
+    """
+    get_logger().info("Passageiro %s salvo", "42")
+
+    assert flush_logs() is True
+    record = json.loads(captured_logs.getvalue().splitlines()[-1])
+    assert record["level"] == "INFO"
+    assert record["message"] == "Passageiro 42 salvo"
+
+
+def test_exception_info_reaches_formatter(captured_logs):
+    """
+    Testa se o traceback é preservado até o formatter do listener.
+    """
+    try:
+        raise RuntimeError("falhou")
+    except RuntimeError:
+        get_logger().exception("Erro inesperado")
+
+    flush_logs()
+    record = json.loads(captured_logs.getvalue().splitlines()[-1])
+    assert record["exception"]["type"] == "RuntimeError"
+    assert record["exception"]["message"] == "falhou"
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/statm"), reason="Requer /proc (Linux)"
+)
+def test_memory_is_flat_over_100k_invocations():
+    """
+    Testa que 100 mil "invocações" (get_logger + log) não aumentam a memória.
+    Antes, cada chamada criava um Logger novo que nunca era liberado.
+    """
+    # Arrange: saída descartada para medir apenas o logging
+    get_logger()
+    _, listener = custom_logging._listeners["console"]
+    with open(os.devnull, "w") as sink:
+        handler = StreamHandler(sink)
+        handler.setFormatter(CustomFormatter())
+        with patch.object(listener, "handlers", (handler,)):
+            for i in range(1_000):
+                get_logger().info(f"Requisição recebida: GET /sobreviventes/{i}")
+            flush_logs(timeout=10)
+            rss_before = _current_rss_bytes()
+            loggers_before = len(logging.Logger.manager.loggerDict)
+
+            # Act
+            for i in range(100_000):
+                get_logger().info(f"Requisição recebida: GET /sobreviventes/{i}")
+                if i % 1_000 == 0:
+                    flush_logs(timeout=10)
+            flush_logs(timeout=10)
+
+    # Assert
+    growth_mb = (_current_rss_bytes() - rss_before) / 1024 / 1024
+    assert len(logging.Logger.manager.loggerDict) == loggers_before
+    assert growth_mb < 5, f"RSS cresceu {growth_mb:.1f} MB"
+
+
+def test_dict_messages_are_kept_structured(captured_logs):
+    """
+    Testa se mensagens em dicionário são escritas como objeto JSON.
+    """
+    get_logger().info({"event": "cold_start_report", "init_total_ms": 12.5})
+
+    flush_logs()
+    record = json.loads(captured_logs.getvalue().splitlines()[-1])
+    assert record["message"] == {"event": "cold_start_report", "init_total_ms": 12.5}
+
+
+def test_dict_messages_are_snapshotted_when_logged(captured_logs):
+    """
+    Testa se o log de um dicionário reflete o conteúdo no momento da chamada,
+    mesmo que o chamador o altere antes de o listener escrevê-lo.
+    """
+    # Arrange
+    message = {"event": "batch_scored", "rows": 10}
+
+    # Act
+    get_logger().info(message)
+    message["rows"] = 20
+    message["extra"] = True
+    flush_logs()
+
+    # Assert
+    record = json.loads(captured_logs.getvalue().splitlines()[-1])
+    assert record["message"] == {"event": "batch_scored", "rows": 10}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+def test_logger_keeps_working_in_forked_child():
+    """
+    Testa se um processo filho (fork) consegue registrar e escrever logs: a
+    thread do listener não sobrevive ao fork e precisa ser recriada.
+    """
+    # Arrange
+    logger = get_logger()
+
+    # Act
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - executado no processo filho
+        logger.info("Mensagem do processo filho")
+        os._exit(0 if flush_logs(timeout=2) else 1)
+    _, status = os.waitpid(pid, 0)
+
+    # Assert
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+from src.repository import dynamodb_client
+from src.repository.dynamodb_client import (
+    build_client_config,
+    get_connection_stats,
+    get_dynamodb_client,
+    get_dynamodb_resource,
+    reset_dynamodb_resource,
+)
+from src.repository.passenger_repository import PassengerRepository
+
+
+def test_resource_is_shared(dynamodb_table):
+    """
+    Testa se o resource é criado uma única vez e reaproveitado.
+    """
+    # Act
+    first = get_dynamodb_resource()
+    second = get_dynamodb_resource()
+
+    # Assert
+    assert first is second
+    assert get_dynamodb_client() is first.meta.client
+    stats = get_connection_stats()
+    assert stats["resources_created"] == 1
+    assert stats["resource_reuses"] == 2
+
+
+def test_repositories_share_resource(dynamodb_table):
+    """
+    Testa se instâncias diferentes do repositório usam o mesmo resource.
+    """
+    assert PassengerRepository().dynamodb is PassengerRepository().dynamodb
+
+
+def test_reset_creates_new_resource(dynamodb_table):
+    """
+    Testa se reset_dynamodb_resource descarta o resource compartilhado.
+    """
+    first = get_dynamodb_resource()
+
+    reset_dynamodb_resource()
+
+    assert get_dynamodb_resource() is not first
+    assert dynamodb_client.get_connection_stats()["resources_created"] == 1
+
+
+@patch.dict(
+    "os.environ",
+    {
+        "DYNAMODB_MAX_POOL_CONNECTIONS": "25",
+        "DYNAMODB_CONNECT_TIMEOUT": "1.5",
+        "DYNAMODB_READ_TIMEOUT": "3",
+        "DYNAMODB_MAX_ATTEMPTS": "4",
+        "DYNAMODB_RETRY_MODE": "standard",
+        "DYNAMODB_TCP_KEEPALIVE": "false",
+    },
+)
+def test_build_client_config_from_environment():
+    """
+    Testa se a configuração do botocore segue as variáveis de ambiente.
+    """
+    config = build_client_config()
+
+    assert config.max_pool_connections == 25
+    assert config.connect_timeout == 1.5
+    assert config.read_timeout == 3.0
+    assert config.retries == {"mode": "standard", "total_max_attempts": 4}
+    assert config.tcp_keepalive is False
+
+
+def test_build_client_config_defaults():
+    """
+    Testa os valores padrão: retries adaptativos e TCP keepalive ativo.
+    """
+    config = build_client_config()
+
+    assert config.max_pool_connections == 10
+    assert config.retries["mode"] == "adaptive"
+    assert config.tcp_keepalive is True
+
+
+@patch.dict("os.environ", {"AWS_REGION": "sa-east-1"})
+def test_resource_uses_configured_region():
+    """
+    Testa se o resource usa a região do AppConfig, sem depender de
+    AWS_DEFAULT_REGION (necessário para criar o cliente no INIT do handler).
+    """
+    reset_dynamodb_resource()
+    try:
+        resource = get_dynamodb_resource()
+        assert resource.meta.client.meta.region_name == "sa-east-1"
+    finally:
+        reset_dynamodb_resource()
@@ -146,3 +146,23 @@ class TestStandardErrorResponse:
         }
 
         assert serialized == expected
+
+
+def test_validation_error_reports_item_index():
+    """Testa se erros de lote levam o índice do item em `index`."""
+    error_response = StandardErrorResponse.validation_error(
+        [
+            {"loc": (2, "Age"), "msg": "Idade inválida", "type": "value_error"},
+            {"loc": ("Fare",), "msg": "Tarifa inválida", "type": "value_error"},
+        ]
+    )
+
+    batch_error, single_error = error_response.model_dump()["details"]
+    assert batch_error == {
+        "field": "Age",
+        "message": "Idade inválida",
+        "type": "value_error",
+        "index": 2,
+    }
+    assert "index" not in single_error
+    assert single_error["field"] == "Fare"
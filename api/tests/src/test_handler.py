@@ -1,3 +1,5 @@
+import base64
+import gzip
 from decimal import Decimal
 import json
 import pytest
@@ -105,6 +107,48 @@ class TestLambdaHandler:
         assert "passenger_id" in body["data"]
         assert "survival_probability" in body["data"]
 
+    def test_handler_emits_stage_metrics(self, passenger_repository, capsys):
+        """
+        Testa se a invocação emite uma linha EMF com as etapas do POST.
+        """
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.model_dump.return_value = {"passenger_id": "1"}
+        self.mock_passenger_controller.save_passenger.return_value = [mock_response]
+        test_event = {
+            "httpMethod": "POST",
+            "path": "/sobreviventes",
+            "resource": "/sobreviventes",
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps(
+                {
+                    "PassengerId": "1",
+                    "Pclass": 1,
+                    "Sex": "female",
+                    "Age": 38.0,
+                    "SibSp": 1,
+                    "Parch": 0,
+                    "Fare": 71.2833,
+                    "Embarked": "C",
+                }
+            ),
+        }
+
+        # Act
+        lambda_handler(test_event, None)
+
+        # Assert
+        lines = [
+            json.loads(line)
+            for line in capsys.readouterr().out.splitlines()
+            if '"_aws"' in line
+        ]
+        assert len(lines) == 1
+        assert lines[0]["route"] == "POST /sobreviventes"
+        assert lines[0]["status_code"] == 201
+        for name in ("parse_body_ms", "validate_ms", "serialize_ms", "total_ms"):
+            assert name in lines[0]
+
     def test_handler_validation_error(self, passenger_repository):
         """
         Testa se o handler retorna um erro 422 para uma requisição com dados inválidos.
@@ -126,11 +170,82 @@ class TestLambdaHandler:
         assert body["error"] is True
         assert "Erro de validação nos dados fornecidos" in body["message"]
 
+    def test_handler_bulk_validation_reports_all_items(self, passenger_repository):
+        """Testa se o 422 de um lote lista os erros de todos os itens, com índice."""
+        # Arrange
+        valid = {
+            "PassengerId": "ok",
+            "Pclass": 1,
+            "Sex": "female",
+            "Age": 30.0,
+            "SibSp": 0,
+            "Parch": 0,
+            "Fare": 50.0,
+            "Embarked": "C",
+        }
+        test_event = {
+            "httpMethod": "POST",
+            "path": "/sobreviventes",
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps([valid, {**valid, "Age": -1}, {**valid, "Pclass": 7}]),
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 422
+        details = json.loads(response["body"])["details"]
+        assert sorted((d["index"], d["field"]) for d in details) == [
+            (1, "Age"),
+            (2, "Pclass"),
+        ]
+        self.mock_passenger_controller.save_passenger.assert_not_called()
+
+    def test_handler_post_ndjson(self, passenger_repository):
+        """Testa POST application/x-ndjson: uma linha de resultado por passageiro."""
+        # Arrange
+        from src.models.api_response import BulkPredictionResult, InvalidLineResult
+
+        def stream(lines, model_name=None):
+            for line_number, line in lines:
+                if "PassengerId" not in line:
+                    yield InvalidLineResult(line=line_number, error="inválida")
+                else:
+                    passenger_id = json.loads(line)["PassengerId"]
+                    yield BulkPredictionResult(
+                        passenger_id=passenger_id,
+                        survival_probability=0.8,
+                        prediction="survived",
+                        confidence_level="high",
+                        status="created",
+                    )
+
+        self.mock_passenger_controller.stream_passengers.side_effect = stream
+        test_event = {
+            "httpMethod": "POST",
+            "path": "/sobreviventes",
+            "headers": {"Content-Type": "application/x-ndjson; charset=utf-8"},
+            "body": '{"PassengerId": "1"}\n{}\n{"PassengerId": "2"}\n',
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 200
+        assert response["headers"]["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response["body"].splitlines()]
+        assert [line["status"] for line in lines] == ["created", "invalid", "created"]
+        assert lines[1]["line"] == 2
+        self.mock_passenger_controller.save_passenger.assert_not_called()
+
     def test_handler_post_multiple_passengers(self, passenger_repository):
         """Testa POST com múltiplos passageiros."""
         # Arrange
         mock_responses = [
             MagicMock(
+                status="created",
                 model_dump=lambda: {
                     "passenger_id": "1",
                     "survival_probability": 0.8,
@@ -139,6 +254,7 @@ class TestLambdaHandler:
                 }
             ),
             MagicMock(
+                status="created",
                 model_dump=lambda: {
                     "passenger_id": "2",
                     "survival_probability": 0.3,
@@ -189,6 +305,96 @@ class TestLambdaHandler:
         assert isinstance(body["data"], list)
         assert len(body["data"]) == 2
 
+    def test_handler_post_partial_batch_returns_207(self, passenger_repository):
+        """Testa POST em lote com parte dos passageiros já existentes."""
+        # Arrange
+        from src.models.api_response import BulkPredictionResult
+
+        self.mock_passenger_controller.save_passenger.return_value = [
+            BulkPredictionResult(
+                passenger_id="1",
+                survival_probability=0.8,
+                prediction="survived",
+                confidence_level="high",
+                status="created",
+            ),
+            BulkPredictionResult(
+                passenger_id="2",
+                survival_probability=0.3,
+                prediction="not_survived",
+                confidence_level="medium",
+                status="exists",
+            ),
+        ]
+        passenger = {
+            "Pclass": 1,
+            "Sex": "female",
+            "Age": 25.0,
+            "SibSp": 0,
+            "Parch": 1,
+            "Fare": 100.0,
+            "Embarked": "S",
+        }
+        test_event = {
+            "httpMethod": "POST",
+            "path": "/sobreviventes",
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps(
+                [dict(passenger, PassengerId="1"), dict(passenger, PassengerId="2")]
+            ),
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 207
+        body = json.loads(response["body"])
+        assert [item["status"] for item in body["data"]] == ["created", "exists"]
+
+    def test_handler_post_selects_model(self, passenger_repository):
+        """Testa a seleção do modelo via query string e via cabeçalho."""
+        mock_response = MagicMock()
+        mock_response.model_dump.return_value = {"passenger_id": "1"}
+        self.mock_passenger_controller.save_passenger.return_value = [mock_response]
+
+        body = json.dumps(
+            {
+                "PassengerId": "1",
+                "Pclass": 1,
+                "Sex": "female",
+                "Age": 38.0,
+                "SibSp": 1,
+                "Parch": 0,
+                "Fare": 71.2833,
+                "Embarked": "C",
+            }
+        )
+
+        lambda_handler(
+            {
+                "httpMethod": "POST",
+                "path": "/sobreviventes",
+                "headers": {},
+                "queryStringParameters": {"model": "v2"},
+                "body": body,
+            },
+            None,
+        )
+        lambda_handler(
+            {
+                "httpMethod": "POST",
+                "path": "/sobreviventes",
+                "headers": {"x-model-version": "v3"},
+                "body": body,
+            },
+            None,
+        )
+
+        calls = self.mock_passenger_controller.save_passenger.call_args_list
+        assert calls[0].kwargs["model_name"] == "v2"
+        assert calls[1].kwargs["model_name"] == "v3"
+
     def test_handler_get_all_passengers(self, passenger_repository):
         """Testa GET para todos os passageiros."""
         # Arrange
@@ -235,6 +441,39 @@ class TestLambdaHandler:
         assert "pagination" in body["data"]
         assert len(body["data"]["passengers"]) == 2
 
+    def test_handler_get_all_passengers_gzip(self, passenger_repository):
+        """Testa a compressão da listagem quando o cliente aceita gzip."""
+        # Arrange
+        items = [
+            {
+                "passenger_id": str(i),
+                "survival_probability": 0.8,
+                "prediction": "survived",
+                "confidence_level": "high",
+            }
+            for i in range(50)
+        ]
+        self.mock_passenger_controller.get_all_passengers.return_value = {
+            "items": items,
+            "pagination": {"page": 1, "limit": 50, "total_items": 50},
+        }
+        test_event = {
+            "httpMethod": "GET",
+            "path": "/sobreviventes",
+            "headers": {"Accept-Encoding": "gzip, deflate"},
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 200
+        assert response["isBase64Encoded"] is True
+        assert response["headers"]["Content-Encoding"] == "gzip"
+        assert response["headers"]["Vary"] == "Accept-Encoding"
+        body = json.loads(gzip.decompress(base64.b64decode(response["body"])))
+        assert body["data"]["passengers"] == items
+
     def test_handler_get_passenger_by_id(self, passenger_repository):
         """Testa GET para um passageiro específico."""
         # Arrange
@@ -246,7 +485,11 @@ class TestLambdaHandler:
             "created_at": "2025-07-17T10:00:00Z",
             "updated_at": "2025-07-17T10:00:00Z",
         }
-        self.mock_passenger_controller.get_passenger_by_id.return_value = mock_passenger
+        self.mock_passenger_controller.get_passenger_if_modified.return_value = {
+            "etag": '"abc"',
+            "not_modified": False,
+            "passenger": mock_passenger,
+        }
 
         test_event = {
             "httpMethod": "GET",
@@ -259,12 +502,69 @@ class TestLambdaHandler:
         response = lambda_handler(test_event, None)
 
         assert response["statusCode"] == 200
+        assert response["headers"]["ETag"] == '"abc"'
         body = json.loads(response["body"])
         assert body["success"] is True
         assert body["message"] == "Dados do passageiro recuperados com sucesso"
         assert "data" in body
         assert body["data"]["passenger_id"] == "123"
 
+    def test_handler_get_passenger_by_id_not_modified(self, passenger_repository):
+        """Testa o 304 sem corpo quando o If-None-Match traz o ETag atual."""
+        # Arrange
+        self.mock_passenger_controller.get_passenger_if_modified.return_value = {
+            "etag": '"abc"',
+            "not_modified": True,
+            "passenger": None,
+        }
+        test_event = {
+            "httpMethod": "GET",
+            "path": "/sobreviventes/123",
+            "resource": "/sobreviventes/{id}",
+            "pathParameters": {"id": "123"},
+            "headers": {"If-None-Match": '"abc"'},
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 304
+        assert response["body"] == ""
+        assert response["headers"]["ETag"] == '"abc"'
+        self.mock_passenger_controller.get_passenger_if_modified.assert_called_once_with(
+            "123", if_none_match='"abc"'
+        )
+
+    def test_handler_get_all_passengers_not_modified(self, passenger_repository):
+        """Testa o 304 na listagem quando a página não mudou."""
+        # Arrange
+        self.mock_passenger_controller.get_all_passengers.return_value = {
+            "items": [],
+            "pagination": None,
+            "etag": '"pagina"',
+            "not_modified": True,
+        }
+        test_event = {
+            "httpMethod": "GET",
+            "path": "/sobreviventes",
+            "headers": {"If-None-Match": '"pagina"'},
+        }
+
+        # Act
+        response = lambda_handler(test_event, None)
+
+        # Assert
+        assert response["statusCode"] == 304
+        assert response["body"] == ""
+        assert response["headers"]["ETag"] == '"pagina"'
+        assert (
+            self.mock_passenger_controller.get_all_passengers.call_args.kwargs[
+                "if_none_match"
+            ]
+            == '"pagina"'
+        )
+
     def test_handler_get_passenger_by_id_missing_parameter(self, passenger_repository):
         """Testa GET com ID ausente."""
         test_event = {
@@ -343,11 +643,9 @@ class TestLambdaHandler:
             },
         }
 
-        with patch("prediction_handler.HealthCheck") as mock_health:
+        with patch("prediction_handler.health_check") as mock_health:
             # Arrange
-            mock_instance = MagicMock()
-            mock_instance.get_overall_health.return_value = mock_health_status
-            mock_health.return_value = mock_instance
+            mock_health.get_overall_health.return_value = mock_health_status
 
             # Act
             response = lambda_handler(test_event, None)
@@ -360,6 +658,36 @@ class TestLambdaHandler:
             assert "metadata" in body
             assert body["components"]["model"]["status"] == "healthy"
             assert body["components"]["database"]["status"] == "healthy"
+            assert body["cold_start"]["init_total_ms"] > 0
+            assert "model_load" in body["cold_start"]["phases_ms"]
+            assert "numpy" in body["cold_start"]["imports_ms"]
+            mock_health.get_overall_health.assert_called_once_with(deep=False)
+
+    def test_handler_health_check_deep(self, passenger_repository):
+        """Testa se ?deep=true solicita a verificação completa."""
+        # Arrange
+        test_event = {
+            "httpMethod": "GET",
+            "path": "/health",
+            "queryStringParameters": {"deep": "true"},
+            "headers": {"Content-Type": "application/json"},
+        }
+
+        with patch("prediction_handler.health_check") as mock_health:
+            mock_health.get_overall_health.return_value = {
+                "overall_status": "healthy",
+                "components": {
+                    "model": {"status": "healthy", "message": "Model is working"},
+                    "database": {"status": "healthy", "message": "Database is working"},
+                },
+            }
+
+            # Act
+            response = lambda_handler(test_event, None)
+
+            # Assert
+            assert response["statusCode"] == 200
+            mock_health.get_overall_health.assert_called_once_with(deep=True)
 
     def test_handler_health_check_unhealthy(self, passenger_repository):
         """Testa endpoint de health check com sistema não saudável."""
@@ -369,16 +697,14 @@ class TestLambdaHandler:
             "headers": {"Content-Type": "application/json"},
         }
 
-        with patch("prediction_handler.HealthCheck") as mock_health:
-            mock_instance = MagicMock()
-            mock_instance.get_overall_health.return_value = {
+        with patch("prediction_handler.health_check") as mock_health:
+            mock_health.get_overall_health.return_value = {
                 "overall_status": "unhealthy",
                 "components": {
                     "model": {"status": "unhealthy", "message": "Model not working"},
                     "database": {"status": "healthy", "message": "Database is working"},
                 },
             }
-            mock_health.return_value = mock_instance
 
             response = lambda_handler(test_event, None)
 
@@ -1,6 +1,7 @@
-import pytest
+import threading
+
 from unittest.mock import patch, MagicMock
-from src.middleware.health_check import HealthCheck
+from src.middleware.health_check import HealthCheck, HEALTH_TEST_DATA
 from src.config.app_config import AppConfig
 
 
@@ -9,54 +10,91 @@ class TestHealthCheck:
 
     def setup_method(self):
         """Setup executado antes de cada teste."""
-        self.health_check = HealthCheck()
-
-    @patch("src.middleware.health_check.PredictionService")
-    def test_check_model_health_success(self, mock_prediction_service):
-        """Testa verificação de saúde do modelo com sucesso."""
-        # Arrange
-        mock_service_instance = MagicMock()
-        mock_service_instance.predict.return_value = 0.75
-        mock_prediction_service.return_value = mock_service_instance
+        self.prediction_service = MagicMock()
+        self.prediction_service.model_name = "model"
+        self.prediction_service.method = "joblib"
+        self.prediction_service.predict.return_value = 0.75
+        self.repository = MagicMock()
+        self.repository.describe_table.return_value = {
+            "table_status": "ACTIVE",
+            "item_count": 10,
+        }
+        self.health_check = HealthCheck(
+            prediction_service=self.prediction_service,
+            repository=self.repository,
+            cache_ttl=0,
+            timeout=2,
+        )
 
+    def test_check_model_health_success(self):
+        """Testa verificação do modelo em uso, sem recarregá-lo nem predizer."""
         # Act
         result = self.health_check.check_model_health()
 
+        # Assert
+        assert result["status"] == "healthy"
+        assert result["model_name"] == "model"
+        self.prediction_service.predict.assert_not_called()
+
+    def test_check_model_health_deep_runs_prediction(self):
+        """Testa se a verificação completa executa uma predição de teste."""
+        # Act
+        result = self.health_check.check_model_health(deep=True)
+
         # Assert
         assert result["status"] == "healthy"
         assert result["message"] == "Modelo funcionando corretamente"
-        mock_prediction_service.assert_called_once_with(
-            model_name="model", method=AppConfig.get_model_method()
-        )
+        assert result["probability"] == 0.75
+        self.prediction_service.predict.assert_called_once_with(HEALTH_TEST_DATA)
 
-    @patch("src.middleware.health_check.PredictionService")
-    def test_check_model_health_failure(self, mock_prediction_service):
+    def test_check_model_health_failure(self):
         """Testa verificação de saúde do modelo com falha."""
         # Arrange
-        mock_prediction_service.side_effect = Exception("Modelo não encontrado")
+        self.prediction_service.predict.side_effect = Exception("Modelo corrompido")
 
         # Act
-        result = self.health_check.check_model_health()
+        result = self.health_check.check_model_health(deep=True)
 
         # Assert
         assert result["status"] == "unhealthy"
-        assert "Modelo não encontrado" in result["message"]
+        assert "Modelo corrompido" in result["message"]
 
-    @patch.object(AppConfig, "is_development", return_value=False)
-    @patch("src.middleware.health_check.PassengerRepository")
-    def test_check_database_health_success(self, mock_repository, mock_is_dev):
-        """Testa verificação de saúde do banco com sucesso."""
-        # Arrange
-        mock_repo_instance = MagicMock()
-        mock_repo_instance.get_all.return_value = []
-        mock_repository.return_value = mock_repo_instance
+    def test_check_model_health_without_service(self):
+        """Testa verificação sem serviço de predição carregado."""
+        health_check = HealthCheck(repository=self.repository, cache_ttl=0)
+
+        result = health_check.check_model_health()
+
+        assert result["status"] == "unhealthy"
+        assert "não carregado" in result["message"]
 
+    def test_check_database_health_success(self):
+        """Testa verificação barata do banco (GetItem em chave sentinela)."""
         # Act
         result = self.health_check.check_database_health()
 
         # Assert
         assert result["status"] == "healthy"
         assert "DynamoDB funcionando" in result["message"]
+        assert "connections" in result
+        self.repository.ping.assert_called_once_with()
+        self.repository.describe_table.assert_not_called()
+        self.repository.get_all.assert_not_called()
+
+    def test_check_database_health_deep_describes_table(self):
+        """Testa se a verificação completa descreve a tabela."""
+        # Arrange
+        self.repository.describe_table.return_value = {
+            "table_status": "UPDATING",
+            "item_count": 10,
+        }
+
+        # Act
+        result = self.health_check.check_database_health(deep=True)
+
+        # Assert
+        assert result["status"] == "unhealthy"
+        assert "UPDATING" in result["message"]
 
     @patch.object(AppConfig, "is_development", return_value=False)
     @patch("src.middleware.health_check.PassengerRepository")
@@ -64,9 +102,10 @@ class TestHealthCheck:
         """Testa verificação de saúde do banco com falha."""
         # Arrange
         mock_repository.side_effect = Exception("Conexão falhou")
+        health_check = HealthCheck(prediction_service=self.prediction_service)
 
         # Act
-        result = self.health_check.check_database_health()
+        result = health_check.check_database_health()
 
         # Assert
         assert result["status"] == "unhealthy"
@@ -88,6 +127,8 @@ class TestHealthCheck:
         assert "model" in result["components"]
         assert "database" in result["components"]
         assert "environment" in result
+        mock_model_health.assert_called_once_with(False)
+        mock_db_health.assert_called_once_with(False)
 
     @patch.object(HealthCheck, "check_model_health")
     @patch.object(HealthCheck, "check_database_health")
@@ -120,3 +161,64 @@ class TestHealthCheck:
 
         # Assert
         assert result["overall_status"] == "healthy"
+
+    def test_get_overall_health_runs_checks_concurrently(self):
+        """Testa se os componentes são verificados em paralelo."""
+        # Arrange: cada verificação só termina quando a outra já começou
+        barrier = threading.Barrier(2, timeout=1)
+
+        def predict(_):
+            barrier.wait()
+            return 0.5
+
+        self.prediction_service.predict.side_effect = predict
+        self.repository.ping.side_effect = lambda: barrier.wait()
+
+        # Act
+        result = self.health_check.get_overall_health(deep=True)
+
+        # Assert
+        assert result["overall_status"] == "healthy"
+
+    def test_get_overall_health_timeout(self):
+        """Testa se uma verificação lenta vira 'unhealthy' ao estourar o timeout."""
+        # Arrange
+        release = threading.Event()
+        self.repository.ping.side_effect = lambda: release.wait(timeout=5)
+        health_check = HealthCheck(
+            prediction_service=self.prediction_service,
+            repository=self.repository,
+            cache_ttl=0,
+            timeout=0.05,
+        )
+
+        # Act
+        try:
+            result = health_check.get_overall_health()
+        finally:
+            release.set()
+
+        # Assert
+        assert result["overall_status"] == "unhealthy"
+        assert result["components"]["model"]["status"] == "healthy"
+        assert "Tempo limite" in result["components"]["database"]["message"]
+
+    def test_get_overall_health_is_cached(self):
+        """Testa se o resultado é reaproveitado dentro do TTL, por modo."""
+        # Arrange
+        health_check = HealthCheck(
+            prediction_service=self.prediction_service,
+            repository=self.repository,
+            cache_ttl=60,
+        )
+
+        # Act
+        first = health_check.get_overall_health()
+        second = health_check.get_overall_health()
+        deep = health_check.get_overall_health(deep=True)
+
+        # Assert
+        assert second is first
+        assert deep is not first
+        assert self.repository.ping.call_count == 2
+
@@ -1,9 +1,79 @@
+import base64
+import gzip
 import pytest
 import json
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+from pydantic import BaseModel
 from src.adapter.http_adapter import HTTPAdapter
+from src.models.api_response import (
+    APIMetadata,
+    DeleteResponse,
+    PaginationInfo,
+    PassengerDetail,
+    PredictionResult,
+    StandardSuccessResponse,
+)
 from src.models.prediction_response import PredictionResponse
 
 
+def legacy_standard_body(body_data, request_id, message):
+    """Corpo de sucesso como era gerado antes: dois model_dump + json.dumps."""
+    data = body_data.model_dump() if isinstance(body_data, BaseModel) else body_data
+    response = StandardSuccessResponse(
+        message=message, data=data, metadata=APIMetadata(request_id=request_id)
+    )
+    return json.dumps(response.model_dump(), ensure_ascii=False, default=str)
+
+
+def passenger_detail(i: int) -> PassengerDetail:
+    """Passageiro de exemplo, como retornado pelo controller."""
+    return PassengerDetail(
+        passenger_id=f"passageiro-{i}",
+        survival_probability=0.7312,
+        prediction="survived",
+        confidence_level="medium",
+        passenger_class=1,
+        sex="female",
+        age=38.0,
+        siblings_spouses=1,
+        parents_children=0,
+        fare=71.2833,
+        embarked="C",
+        created_at="2025-01-14T10:30:00",
+        model_version="model",
+    )
+
+
+STANDARD_BODY_FIXTURES = {
+    "prediction": PredictionResult.from_probability("1", 0.7312).model_dump(),
+    "prediction_model": PredictionResult.from_probability("1", 0.7312),
+    "bulk": [
+        PredictionResult.from_probability(str(i), i / 10).model_dump()
+        for i in range(10)
+    ],
+    "page": {
+        "passengers": [passenger_detail(i).model_dump() for i in range(100)],
+        "pagination": PaginationInfo(
+            page=1,
+            limit=100,
+            total_items=250,
+            total_pages=3,
+            has_next=True,
+            has_previous=False,
+            next_cursor="eyJwYXNzZW5nZXJfaWQiOiAiOTkifQ",
+        ).model_dump(),
+    },
+    "detail": passenger_detail(1),
+    "delete": DeleteResponse(
+        deleted=True, passenger_id="1", message="Passageiro excluído"
+    ),
+    "dynamodb_item": {"passenger_id": "ç", "Fare": Decimal("7.25"), "Age": None},
+    "empty": None,
+}
+
+
 class TestHTTPAdapter:
     """Testes para a classe HTTPAdapter."""
 
@@ -69,6 +139,14 @@ class TestHTTPAdapter:
         adapter = HTTPAdapter(event)
         assert adapter.resource is None
 
+    def test_get_header_case_insensitive(self):
+        """Testa leitura de cabeçalho ignorando maiúsculas/minúsculas."""
+        event = {"headers": {"x-model-version": "v2"}}
+        adapter = HTTPAdapter(event)
+
+        assert adapter.get_header("X-Model-Version") == "v2"
+        assert adapter.get_header("X-Missing", "default") == "default"
+
     def test_body_property_valid_json(self):
         """Testa propriedade body com JSON válido."""
         test_data = {"name": "test", "value": 123}
@@ -119,6 +197,19 @@ class TestHTTPAdapter:
         assert first_call == second_call
         assert first_call is second_call  # Mesmo objeto
 
+    def test_raw_body(self):
+        """Testa o corpo bruto, sem decodificar o JSON."""
+        event = {"body": '[{"a": 1}]'}
+        encoded = {
+            "body": base64.b64encode(b'{"a": 1}').decode("ascii"),
+            "isBase64Encoded": True,
+        }
+
+        assert HTTPAdapter(event).raw_body == '[{"a": 1}]'
+        assert HTTPAdapter(encoded).raw_body == b'{"a": 1}'
+        assert HTTPAdapter({"body": ""}).raw_body is None
+        assert HTTPAdapter({"body": "abc", "isBase64Encoded": True}).raw_body is None
+
     def test_build_response_with_dict(self):
         """Testa build_response com dicionário."""
         data = {"message": "success", "count": 10}
@@ -234,3 +325,101 @@ class TestHTTPAdapter:
         assert adapter.resource is None
         assert adapter.path_parameters == {}
         assert adapter.body == {}
+
+
+@pytest.mark.parametrize("fixture", sorted(STANDARD_BODY_FIXTURES))
+def test_standard_body_is_byte_identical_to_legacy(fixture):
+    """Testa se o envelope serializado em uma passada gera os mesmos bytes."""
+    # Arrange
+    body_data = STANDARD_BODY_FIXTURES[fixture]
+    fixed_now = datetime(2025, 1, 14, 10, 30)
+
+    # Act
+    with patch("src.models.api_response.datetime") as mock_datetime:
+        mock_datetime.now.return_value = fixed_now
+        expected = legacy_standard_body(body_data, "req-1", "Mensagem com acentuação")
+        response = HTTPAdapter.build_standard_response(
+            200, body_data, request_id="req-1", message="Mensagem com acentuação"
+        )
+
+    # Assert
+    assert response["body"] == expected
+
+
+def test_standard_body_accepts_list_of_models():
+    """Testa se uma lista de modelos é serializada como lista de objetos."""
+    predictions = [PredictionResult.from_probability(str(i), 0.9) for i in range(3)]
+
+    response = HTTPAdapter.build_standard_response(201, predictions, request_id="r")
+
+    body = json.loads(response["body"])
+    assert body["data"] == [p.model_dump() for p in predictions]
+
+
+class TestResponseCompression:
+    """Testes da compressão negociada por Accept-Encoding."""
+
+    page = {"passengers": [passenger_detail(i).model_dump() for i in range(20)]}
+
+    def test_gzip_above_threshold(self, monkeypatch):
+        """Testa se corpos grandes são comprimidos e devolvidos em base64."""
+        monkeypatch.setenv("COMPRESSION_MIN_BYTES", "1024")
+        plain = HTTPAdapter.build_standard_response(200, self.page, request_id="r")
+
+        response = HTTPAdapter.build_standard_response(
+            200, self.page, request_id="r", accept_encoding="gzip, deflate"
+        )
+
+        assert response["isBase64Encoded"] is True
+        assert response["headers"]["Content-Encoding"] == "gzip"
+        assert response["headers"]["Vary"] == "Accept-Encoding"
+        decoded = json.loads(gzip.decompress(base64.b64decode(response["body"])))
+        assert decoded["data"] == json.loads(plain["body"])["data"]
+        assert len(base64.b64decode(response["body"])) < len(plain["body"])
+
+    def test_compressed_variant_has_its_own_etag(self, monkeypatch):
+        """
+        Testa se a variante comprimida recebe um ETag forte próprio, diferente
+        do ETag da representação sem codificação.
+        """
+        monkeypatch.setenv("COMPRESSION_MIN_BYTES", "1024")
+
+        plain = HTTPAdapter.build_standard_response(
+            200, self.page, request_id="r", accept_encoding="", etag='"abc"'
+        )
+        encoded = HTTPAdapter.build_standard_response(
+            200, self.page, request_id="r", accept_encoding="gzip", etag='"abc"'
+        )
+
+        assert plain["headers"]["ETag"] == '"abc"'
+        assert encoded["headers"]["Content-Encoding"] == "gzip"
+        assert encoded["headers"]["ETag"] == '"abc-gzip"'
+
+    def test_below_threshold_is_not_compressed(self, monkeypatch):
+        """Testa se corpos pequenos seguem sem compressão, mas com Vary."""
+        monkeypatch.setenv("COMPRESSION_MIN_BYTES", "1000000")
+
+        response = HTTPAdapter.build_standard_response(
+            200, self.page, request_id="r", accept_encoding="gzip"
+        )
+
+        assert "isBase64Encoded" not in response
+        assert "Content-Encoding" not in response["headers"]
+        assert response["headers"]["Vary"] == "Accept-Encoding"
+        assert json.loads(response["body"])["success"] is True
+
+    @pytest.mark.parametrize("accept_encoding", ["", "identity", "gzip;q=0"])
+    def test_not_accepted(self, accept_encoding):
+        """Testa respostas sem compressão quando o cliente não aceita gzip."""
+        response = HTTPAdapter.build_standard_response(
+            200, self.page, request_id="r", accept_encoding=accept_encoding
+        )
+
+        assert "Content-Encoding" not in response["headers"]
+        assert json.loads(response["body"])["success"] is True
+
+    def test_without_negotiation_headers_are_unchanged(self):
+        """Testa se, sem accept_encoding, a resposta não ganha Vary."""
+        response = HTTPAdapter.build_standard_response(200, self.page, request_id="r")
+
+        assert "Vary" not in response["headers"]
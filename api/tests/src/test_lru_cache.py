@@ -0,0 +1,97 @@
+import pytest
+from src.cache.lru_cache import LRUCache
+
+
+class FakeClock:
+    """Relógio controlável para testar expiração."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Testes para a classe LRUCache."""
+
+    def test_get_and_set(self):
+        """Testa armazenamento e leitura com contadores de hit/miss."""
+        cache = LRUCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction(self):
+        """Testa se a entrada menos usada recentemente é descartada."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" passa a ser a menos usada
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert "a" in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiration(self):
+        """Testa a expiração das entradas pelo TTL."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_per_entry_ttl(self):
+        """Testa o TTL específico por entrada."""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl=60, clock=clock)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2)
+
+        clock.now = 2
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_pop_and_clear(self):
+        """Testa remoção individual e limpeza total."""
+        cache = LRUCache(max_size=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_stats(self):
+        """Testa os contadores expostos para logs."""
+        cache = LRUCache(max_size=1)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.set("b", 2)
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_invalid_size(self):
+        """Testa que o tamanho máximo precisa ser positivo."""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
@@ -1,5 +1,12 @@
 import pytest
 from src.mapper.mapper import map_request_to_dynamodb_item
+from src.mapper.etag import (
+    compute_etag,
+    encoded_etag,
+    etag_matches,
+    item_etag,
+    matched_etag,
+)
 from src.models.passenger_request import PassengerRequest
 from decimal import Decimal
 
@@ -178,3 +185,46 @@ class TestMapper:
             assert field in result
 
         assert len(result) == len(expected_fields)
+
+
+class TestEtag:
+    """Testes para o cálculo e a comparação de ETags."""
+
+    def test_compute_etag_is_stable_and_ignores_stored_etag(self):
+        """Testa se o hash independe da ordem das chaves e do próprio atributo etag."""
+        item = {"passenger_id": "1", "age": Decimal("22.00"), "sex": "male"}
+        reordered = {"sex": "male", "age": Decimal("22.00"), "passenger_id": "1"}
+
+        etag = compute_etag(item)
+
+        assert etag == compute_etag(reordered)
+        assert etag == compute_etag({**item, "etag": etag})
+        assert etag != compute_etag({**item, "age": Decimal("23.00")})
+
+    def test_item_etag_prefers_persisted_value(self):
+        """Testa se o ETag gravado é usado e o hash só é calculado na falta dele."""
+        item = {"passenger_id": "1"}
+
+        assert item_etag({**item, "etag": '"gravado"'}) == '"gravado"'
+        assert item_etag(item) == compute_etag(item)
+
+    def test_etag_matches(self):
+        """Testa a comparação com If-None-Match (listas, W/ e curinga)."""
+        assert etag_matches('"a"', '"a"')
+        assert etag_matches('"x", W/"a"', '"a"')
+        assert etag_matches("*", '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert not etag_matches(None, '"a"')
+
+    def test_encoded_variants_match_their_resource(self):
+        """
+        Testa se os ETags das variantes comprimidas correspondem ao recurso e
+        se o validador do cliente é o repetido no 304.
+        """
+        assert encoded_etag('"a"', "gzip") == '"a-gzip"'
+        assert etag_matches('"a-gzip"', '"a"')
+        assert etag_matches('W/"a-br"', '"a"')
+        assert not etag_matches('"a-gzip"', '"b"')
+        assert matched_etag('"x", "a-gzip"', '"a"') == '"a-gzip"'
+        assert matched_etag("*", '"a"') == '"a"'
+        assert matched_etag('"b"', '"a"') is None
@@ -0,0 +1,167 @@
+import os
+import shutil
+import threading
+
+import numpy as np
+import pytest
+
+from src.services import model_registry
+from src.services.model_registry import ModelRegistry, deep_sizeof
+
+
+@pytest.fixture
+def models_dir(tmp_path, monkeypatch):
+    """Cria uma pasta 'modelos' temporária com três versões do modelo compilado."""
+    source = os.path.abspath(os.path.join("modelos", "model.npz"))
+    target = tmp_path / "modelos"
+    target.mkdir()
+    for name in ("model", "v2", "v3"):
+        shutil.copy(source, target / f"{name}.npz")
+
+    monkeypatch.chdir(tmp_path)
+    return target
+
+
+class TestModelRegistry:
+    """Testes para a classe ModelRegistry."""
+
+    def test_lazy_loading(self, models_dir):
+        """Testa se os modelos só são carregados no primeiro uso."""
+        registry = ModelRegistry(method="compiled")
+
+        assert registry.loaded_models == []
+
+        service = registry.get("v2")
+
+        assert service.model_name == "v2"
+        assert registry.loaded_models == ["v2"]
+        assert registry.get("v2") is service
+
+    def test_default_model(self, models_dir):
+        """Testa se o modelo padrão é usado quando nenhum nome é informado."""
+        registry = ModelRegistry(default_model="model", method="compiled")
+
+        assert registry.get().model_name == "model"
+        assert registry.get(None) is registry.get("model")
+
+    def test_available_models(self, models_dir):
+        """Testa a listagem dos modelos em disco."""
+        registry = ModelRegistry(method="compiled")
+
+        assert registry.available_models() == ["model", "v2", "v3"]
+
+    def test_unknown_model(self, models_dir):
+        """Testa erro ao solicitar um modelo inexistente."""
+        registry = ModelRegistry(method="compiled")
+
+        with pytest.raises(ValueError, match="não encontrado"):
+            registry.get("v9")
+
+    def test_invalid_model_name(self, models_dir):
+        """Testa se nomes com separadores de caminho são rejeitados."""
+        registry = ModelRegistry(method="compiled")
+
+        with pytest.raises(ValueError, match="inválido"):
+            registry.get("../modelos/model")
+
+    def test_lru_unloading_under_memory_budget(self, models_dir):
+        """Testa o descarregamento LRU quando o orçamento é excedido."""
+        registry = ModelRegistry(method="compiled")
+        model_size = registry.get("model").model.nbytes
+        registry.memory_budget_bytes = int(model_size * 2.5)
+
+        registry.get("v2")
+        registry.get("v3")
+
+        # O padrão nunca é descarregado; v2 era o menos usado
+        assert registry.loaded_models == ["model", "v3"]
+        assert registry.memory_usage_bytes <= registry.memory_budget_bytes
+
+    def test_sklearn_model_size_counts_tree_buffers(self):
+        """Testa se o tamanho estimado inclui os nós das árvores (buffers C)."""
+        registry = ModelRegistry(method="joblib")
+
+        model = registry.get().model
+        tree_bytes = sum(
+            state["nodes"].nbytes + state["values"].nbytes
+            for state in (e.tree_.__getstate__() for e in model.estimators_)
+        )
+
+        assert registry.memory_usage_bytes >= tree_bytes
+
+    def test_deep_sizeof(self):
+        """Testa a soma do grafo: containers, arrays e objetos compartilhados."""
+        array = np.zeros(1000)
+        shared = {"a": array, "b": [array, array[:10]]}
+
+        # O buffer do array é contado uma única vez
+        assert array.nbytes <= deep_sizeof(shared) < 2 * array.nbytes
+        assert deep_sizeof([np.zeros(2000), shared]) >= deep_sizeof(shared) + 16000
+
+    def test_loading_does_not_block_loaded_models(self, models_dir, monkeypatch):
+        """Testa se a carga de um modelo não bloqueia quem usa outro já carregado."""
+        registry = ModelRegistry(method="compiled")
+        default_service = registry.get()
+
+        loading = threading.Event()
+        release = threading.Event()
+        original = model_registry.PredictionService
+
+        def slow_service(**kwargs):
+            loading.set()
+            release.wait(timeout=5)
+            return original(**kwargs)
+
+        monkeypatch.setattr(model_registry, "PredictionService", slow_service)
+        loader = threading.Thread(target=registry.get, args=("v2",))
+        loader.start()
+        assert loading.wait(timeout=5)
+
+        try:
+            # A carga de v2 está em andamento e não segura o lock do registro
+            assert registry.get() is default_service
+            assert registry.loaded_models == ["model"]
+        finally:
+            release.set()
+            loader.join(timeout=5)
+
+        assert registry.loaded_models == ["model", "v2"]
+
+    def test_concurrent_gets_load_once(self, models_dir, monkeypatch):
+        """Testa se pedidos simultâneos do mesmo modelo o carregam uma só vez."""
+        registry = ModelRegistry(method="compiled")
+        original = model_registry.PredictionService
+        loads = []
+
+        def counted_service(**kwargs):
+            loads.append(kwargs["model_name"])
+            return original(**kwargs)
+
+        monkeypatch.setattr(model_registry, "PredictionService", counted_service)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("v3")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert loads == ["v3"]
+        assert len(results) == 8
+        assert all(service is results[0] for service in results)
+
+    def test_unload(self, models_dir):
+        """Testa o descarregamento manual de um modelo."""
+        registry = ModelRegistry(method="compiled")
+        registry.get("v2")
+
+        assert registry.unload("v2") is True
+        assert registry.unload("v2") is False
+        assert registry.loaded_models == []
+
+    def test_invalid_method(self):
+        """Testa erro com método de carregamento inválido."""
+        with pytest.raises(ValueError, match="Método de carregamento inválido"):
+            ModelRegistry(method="invalid")
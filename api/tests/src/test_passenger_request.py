@@ -1,6 +1,12 @@
+import json
+
 import pytest
 from pydantic import ValidationError
-from src.models.passenger_request import PassengerRequest
+from src.models.passenger_request import (
+    PassengerRequest,
+    iter_ndjson_lines,
+    parse_passengers,
+)
 
 
 class TestPassengerRequest:
@@ -175,6 +181,25 @@ class TestPassengerRequest:
         # Verifica se há erro relacionado à tarifa
         assert any(error.get("loc") == ("Fare",) for error in errors)
 
+    def test_reserved_passenger_id_prefix(self):
+        """Testa se IDs no prefixo reservado do contador são rejeitados."""
+        passenger_data = {
+            "PassengerId": "__passenger_count__x",
+            "Pclass": 3,
+            "Sex": "male",
+            "Age": 22.0,
+            "SibSp": 1,
+            "Parch": 0,
+            "Fare": 7.25,
+            "Embarked": "S",
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            PassengerRequest(**passenger_data)
+
+        errors = exc_info.value.errors()
+        assert any(error.get("loc") == ("PassengerId",) for error in errors)
+
     def test_invalid_embarked_value(self):
         """Testa validação de Embarked com valor inválido."""
         passenger_data = {
@@ -237,3 +262,92 @@ class TestPassengerRequest:
 
         passenger_max = PassengerRequest(**passenger_data_max)
         assert passenger_max.Age == 120.0
+
+
+def passenger_json(passenger_id: str, **overrides) -> dict:
+    """Passageiro válido no formato da requisição."""
+    data = {
+        "PassengerId": passenger_id,
+        "Pclass": 3,
+        "Sex": "male",
+        "Age": 22.0,
+        "SibSp": 1,
+        "Parch": 0,
+        "Fare": 7.25,
+        "Embarked": "S",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestParsePassengers:
+    """Testes para a validação do corpo de POST (parse_passengers)."""
+
+    @pytest.mark.parametrize("encode", [lambda s: s, lambda s: s.encode("utf-8")])
+    def test_list_from_raw_json(self, encode):
+        """Testa a validação de uma lista direto do JSON (str ou bytes)."""
+        body = json.dumps([passenger_json("1"), passenger_json("2", Sex="female")])
+
+        passengers = parse_passengers(encode("  \n" + body))
+
+        assert [p.PassengerId for p in passengers] == ["1", "2"]
+        assert passengers[1].Sex == "female"
+
+    def test_single_object_from_raw_json(self):
+        """Testa a validação de um único passageiro."""
+        passengers = parse_passengers(json.dumps(passenger_json("7")))
+
+        assert len(passengers) == 1
+        assert passengers[0] == PassengerRequest(**passenger_json("7"))
+
+    def test_decoded_body(self):
+        """Testa corpos já decodificados (dict ou list)."""
+        assert parse_passengers(passenger_json("1"))[0].PassengerId == "1"
+        assert len(parse_passengers([passenger_json("1"), passenger_json("2")])) == 2
+
+    def test_reports_every_invalid_item_with_index(self):
+        """Testa se todos os itens inválidos são reportados, com o índice."""
+        body = json.dumps(
+            [
+                passenger_json("0"),
+                passenger_json("1", Age=-1),
+                passenger_json("2"),
+                passenger_json("3", Pclass=9, Sex="alien"),
+            ]
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            parse_passengers(body)
+
+        locations = sorted(error["loc"] for error in exc_info.value.errors())
+        assert locations == [(1, "Age"), (3, "Pclass"), (3, "Sex")]
+
+    @pytest.mark.parametrize("body", [None, "", "{invalid json"])
+    def test_empty_or_invalid_body(self, body):
+        """Testa se corpos vazios ou JSON inválido geram ValidationError."""
+        with pytest.raises(ValidationError):
+            parse_passengers(body)
+
+
+class TestIterNdjsonLines:
+    """Testes para a leitura de corpos NDJSON (iter_ndjson_lines)."""
+
+    @pytest.mark.parametrize("encode", [lambda s: s, lambda s: s.encode("utf-8")])
+    def test_numbers_lines_and_skips_blank_ones(self, encode):
+        """Testa a numeração das linhas, ignorando linhas em branco e o "\\r" final."""
+        body = encode('{"a": 1}\r\n\n  \n{"b": 2}')
+
+        lines = list(iter_ndjson_lines(body))
+
+        assert lines == [(1, encode('{"a": 1}')), (4, encode('{"b": 2}'))]
+
+    def test_is_lazy(self):
+        """Testa se as linhas são produzidas sob demanda."""
+        lines = iter_ndjson_lines('{"a": 1}\n{"b": 2}\n')
+
+        assert next(lines) == (1, '{"a": 1}')
+
+    @pytest.mark.parametrize("body", [None, "", b""])
+    def test_empty_body(self, body):
+        """Testa corpos vazios."""
+        assert list(iter_ndjson_lines(body)) == []
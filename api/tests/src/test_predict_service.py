@@ -3,12 +3,13 @@ from unittest.mock import patch, MagicMock, mock_open
 import numpy as np
 import os
 from src.services.predict_service import PredictionService
+from src.models.passenger_request import PassengerRequest
 
 
 class TestPredictionService:
     """Testes para a classe PredictionService."""
 
-    @patch("src.services.predict_service.joblib.load")
+    @patch("joblib.load")
     @patch("builtins.open", new_callable=mock_open)
     @patch("os.path.exists")
     def test_load_model_with_joblib_success(
@@ -63,7 +64,7 @@ class TestPredictionService:
 
         # Mock open e joblib.load para evitar erro de arquivo real
         with patch("builtins.open", mock_open()) as mock_file, patch(
-            "src.services.predict_service.joblib.load"
+            "joblib.load"
         ) as mock_joblib_load:
             mock_model = MagicMock()
             mock_joblib_load.return_value = mock_model
@@ -106,7 +107,7 @@ class TestPredictionService:
         assert f"Arquivo não encontrado: {expected_path}" in str(exc_info.value)
 
     @patch(
-        "src.services.predict_service.joblib.load", side_effect=Exception("Load error")
+        "joblib.load", side_effect=Exception("Load error")
     )
     @patch("builtins.open", new_callable=mock_open)
     @patch("os.path.exists")
@@ -284,6 +285,162 @@ class TestPredictionService:
         # A exceção original é re-lançada, não uma nova mensagem
         assert "Prediction error" in str(exc_info.value)
 
+    def test_preprocess_batch_matches_preprocess(self):
+        """Testa se a matriz do lote tem as mesmas linhas do pré-processamento unitário."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib")
+        service.model = MagicMock()
+
+        batch = [
+            PassengerRequest(
+                PassengerId="1",
+                Pclass=3,
+                Sex="male",
+                Age=22.0,
+                SibSp=1,
+                Parch=0,
+                Fare=7.25,
+                Embarked="S",
+            ),
+            {"Pclass": 1, "Sex": "female", "SibSp": 0, "Parch": 0},
+        ]
+
+        # Act
+        matrix = service._preprocess_batch(batch)
+
+        # Assert
+        assert matrix.shape == (2, 8)
+        np.testing.assert_array_equal(
+            matrix[0], service._preprocess(batch[0].to_dict())[0]
+        )
+        np.testing.assert_array_equal(matrix[1], service._preprocess(batch[1])[0])
+
+    def test_predict_batch_single_model_call(self):
+        """Testa se predict_batch chama predict_proba uma única vez para o lote."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib")
+        mock_model = MagicMock()
+        mock_model.predict_proba.return_value = np.array(
+            [[0.2, 0.8], [0.9, 0.1], [0.5, 0.5]]
+        )
+        service.model = mock_model
+
+        batch = [
+            {"Pclass": 1, "Sex": "female", "Age": 38.0, "SibSp": 1, "Parch": 0},
+            {"Pclass": 3, "Sex": "male", "Age": 22.0, "SibSp": 1, "Parch": 0},
+            {"Pclass": 2, "Sex": "male", "Age": 30.0, "SibSp": 0, "Parch": 0},
+        ]
+
+        # Act
+        probabilities = service.predict_batch(batch)
+
+        # Assert
+        assert probabilities == [0.8, 0.1, 0.5]
+        mock_model.predict_proba.assert_called_once()
+        assert mock_model.predict_proba.call_args[0][0].shape == (3, 8)
+
+    def test_predict_batch_empty(self):
+        """Testa predict_batch com lote vazio."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib")
+        service.model = MagicMock()
+
+        # Act
+        probabilities = service.predict_batch([])
+
+        # Assert
+        assert probabilities == []
+        service.model.predict_proba.assert_not_called()
+
+    def test_predict_batch_model_not_loaded(self):
+        """Testa predict_batch quando o modelo não está carregado."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib")
+        service.model = None
+
+        # Act & Assert
+        with pytest.raises(RuntimeError) as exc_info:
+            service.predict_batch([{"Pclass": 1, "Sex": "female"}])
+
+        assert "Modelo não foi carregado" in str(exc_info.value)
+
+    def test_predict_uses_cache_for_repeated_features(self):
+        """Testa se passageiros idênticos são servidos pelo cache."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib", cache_size=8)
+        mock_model = MagicMock()
+        mock_model.predict_proba.return_value = np.array([[0.2, 0.8]])
+        service.model = mock_model
+
+        request_data = {
+            "Pclass": 1,
+            "Sex": "female",
+            "Age": 38.0,
+            "SibSp": 1,
+            "Parch": 0,
+            "Fare": 71.2833,
+            "Embarked": "C",
+        }
+
+        # Act
+        first = service.predict(request_data)
+        second = service.predict(dict(request_data))
+
+        # Assert
+        assert first == second == 0.8
+        mock_model.predict_proba.assert_called_once()
+        assert service.cache.hits == 1
+        assert service.cache.misses == 1
+
+    def test_predict_batch_scores_only_cache_misses(self):
+        """Testa se o lote envia ao modelo apenas as linhas fora do cache."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib", cache_size=8)
+        mock_model = MagicMock()
+        mock_model.predict_proba.return_value = np.array([[0.4, 0.6]])
+        service.model = mock_model
+
+        cached = {"Pclass": 1, "Sex": "female", "Age": 38.0, "SibSp": 1, "Parch": 0}
+        new = {"Pclass": 3, "Sex": "male", "Age": 22.0, "SibSp": 0, "Parch": 0}
+        service.predict(cached)
+        mock_model.predict_proba.reset_mock()
+        mock_model.predict_proba.return_value = np.array([[0.9, 0.1]])
+
+        # Act
+        probabilities = service.predict_batch([cached, new])
+
+        # Assert
+        assert probabilities == [0.6, 0.1]
+        mock_model.predict_proba.assert_called_once()
+        assert mock_model.predict_proba.call_args[0][0].shape == (1, 8)
+
+    def test_model_setter_clears_cache(self):
+        """Testa se a troca do modelo invalida o cache de predições."""
+        # Arrange
+        service = PredictionService(model_name="model", method="joblib", cache_size=8)
+        first_model = MagicMock()
+        first_model.predict_proba.return_value = np.array([[0.2, 0.8]])
+        service.model = first_model
+
+        request_data = {"Pclass": 2, "Sex": "male", "Age": 30.0, "SibSp": 0, "Parch": 0}
+        service.predict(request_data)
+
+        second_model = MagicMock()
+        second_model.predict_proba.return_value = np.array([[0.7, 0.3]])
+
+        # Act
+        service.model = second_model
+        probability = service.predict(request_data)
+
+        # Assert
+        assert probability == 0.3
+        assert len(service.cache) == 1
+
+    def test_cache_disabled_by_default(self):
+        """Testa que o cache é opcional."""
+        service = PredictionService(model_name="model", method="joblib")
+        assert service.cache is None
+
     # Mock os.path.exists para todos os testes de predição e pré-processamento
     # para que o construtor não falhe ao tentar carregar o modelo.
     @pytest.fixture(autouse=True)
@@ -292,6 +449,71 @@ class TestPredictionService:
             # Simula que o arquivo do modelo existe para que o construtor não falhe
             mock_exists.return_value = True
             with patch("builtins.open", mock_open()), patch(
-                "src.services.predict_service.joblib.load"
+                "joblib.load"
             ), patch("src.services.predict_service.pickle.load"):
                 yield
+
+
+@pytest.fixture(scope="module")
+def real_service():
+    """Serviço com o modelo real (ordem de colunas diferente de FEATURE_NAMES)."""
+    return PredictionService(model_name="model", method="joblib")
+
+
+@pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+def test_preprocess_columns_matches_preprocess_exactly(real_service):
+    """
+    Testa se o pré-processamento colunar reproduz _preprocess linha a linha,
+    com valores ausentes e na ordem de colunas do modelo.
+    """
+    # Arrange
+    service = real_service
+    rng = np.random.default_rng(7)
+    batch = [
+        {
+            "Pclass": int(rng.integers(1, 4)),
+            "Sex": str(rng.choice(["male", "female"])),
+            "Age": None if rng.random() < 0.2 else float(rng.uniform(0, 120)),
+            "SibSp": int(rng.integers(0, 9)),
+            "Parch": int(rng.integers(0, 7)),
+            "Fare": None if rng.random() < 0.1 else float(rng.uniform(0, 520)),
+            "Embarked": [None, "S", "C", "Q"][int(rng.integers(0, 4))],
+        }
+        for _ in range(500)
+    ]
+    expected = np.vstack([service._preprocess(row) for row in batch])
+
+    # Act
+    matrix = service._preprocess_batch(batch)
+
+    # Assert
+    assert service._feature_order == list(service.model.feature_names_in_)
+    assert matrix.dtype == np.float64
+    np.testing.assert_array_equal(matrix, expected)
+
+@pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+def test_predict_columns_accepts_arrays_with_nan(real_service):
+    """Testa predict_columns com colunas NumPy, tratando NaN como ausente."""
+    # Arrange
+    service = real_service
+    batch = [
+        {"Pclass": 3, "Sex": "male", "Age": None, "SibSp": 1, "Parch": 0,
+         "Fare": 7.25, "Embarked": None},
+        {"Pclass": 1, "Sex": "female", "Age": 38.0, "SibSp": 1, "Parch": 0,
+         "Fare": None, "Embarked": "C"},
+    ]
+    columns = {
+        "Pclass": np.array([3, 1]),
+        "Sex": np.array(["male", "female"], dtype=object),
+        "Age": np.array([np.nan, 38.0]),
+        "SibSp": np.array([1, 1]),
+        "Parch": np.array([0, 0]),
+        "Fare": np.array([7.25, np.nan]),
+        "Embarked": np.array([None, "C"], dtype=object),
+    }
+
+    # Act
+    probabilities = service.predict_columns(columns)
+
+    # Assert
+    assert probabilities == service.predict_batch(batch)
@@ -1,3 +1,21 @@
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.repository.passenger_repository import (
+    COUNTER_KEY,
+    COUNTER_SHARD_KEYS,
+    MAX_ITEM_CACHE_SIZE,
+    STATUS_CREATED,
+    STATUS_ERROR,
+    STATUS_EXISTS,
+    PassengerRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+
 def test_save_and_get_passenger(passenger_repository):
     """
     Testa se o repositório salva e recupera um item corretamente.
@@ -50,3 +68,472 @@ def test_delete_passenger(passenger_repository):
     passenger_repository.delete(passenger_id)
 
     assert passenger_repository.get_by_id(passenger_id) is None
+
+
+def test_get_all_with_cursor_walks_every_item_once(passenger_repository):
+    """
+    Testa se a paginação por cursor percorre todos os itens sem repetições.
+    """
+    for i in range(25):
+        passenger_repository.save({"passenger_id": f"cursor-{i}"})
+
+    seen = []
+    cursor = None
+    while True:
+        page = passenger_repository.get_all(limit=10, cursor=cursor)
+        seen.extend(item["passenger_id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(f"cursor-{i}" for i in range(25))
+
+
+def test_get_all_page_mode_returns_next_cursor(passenger_repository):
+    """
+    Testa se o modo por página também devolve o cursor da página seguinte.
+    """
+    for i in range(12):
+        passenger_repository.save({"passenger_id": f"page-{i}"})
+
+    first_page = passenger_repository.get_all(page=1, limit=10)
+    second_page = passenger_repository.get_all(
+        limit=10, cursor=first_page["next_cursor"]
+    )
+
+    assert first_page["next_cursor"] is not None
+    assert len(second_page["items"]) == 2
+    assert second_page["items"] == passenger_repository.get_all(page=2, limit=10)[
+        "items"
+    ]
+
+
+def test_get_all_invalid_cursor(passenger_repository):
+    """
+    Testa se um cursor malformado gera ValueError.
+    """
+    with pytest.raises(ValueError, match="Cursor de paginação inválido"):
+        passenger_repository.get_all(cursor="não-é-um-cursor")
+
+
+def test_cursor_round_trip():
+    """
+    Testa a codificação e decodificação do token de continuação.
+    """
+    key = {"passenger_id": "abc-123"}
+
+    cursor = encode_cursor(key)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == key
+    assert encode_cursor(None) is None
+
+
+def test_count_tracks_saves_and_deletes(passenger_repository):
+    """
+    Testa se o contador acompanha inclusões e exclusões sem scan.
+    """
+    for i in range(5):
+        passenger_repository.save({"passenger_id": f"count-{i}"})
+    passenger_repository.delete("count-0")
+    passenger_repository.delete("inexistente")
+
+    assert passenger_repository.count() == 4
+
+    # Uma nova instância lê o contador persistido
+    assert PassengerRepository().count() == 4
+
+
+def test_count_not_incremented_on_duplicate(passenger_repository):
+    """
+    Testa se a inclusão duplicada não altera o contador.
+    """
+    passenger_repository.save({"passenger_id": "dup"})
+
+    with pytest.raises(ValueError, match="já existe"):
+        passenger_repository.save({"passenger_id": "dup"})
+
+    assert PassengerRepository().count() == 1
+
+
+def test_counter_item_is_hidden(passenger_repository):
+    """
+    Testa se o item contador não aparece nas listagens nem na busca por ID.
+    """
+    for i in range(10):
+        passenger_repository.save({"passenger_id": f"hidden-{i}"})
+
+    first_page = passenger_repository.get_all(page=1, limit=10)
+
+    assert len(first_page["items"]) == 10
+    assert COUNTER_KEY not in [item["passenger_id"] for item in first_page["items"]]
+    assert first_page["total_count"] == 10
+    assert first_page["total_pages"] == 1
+    assert passenger_repository.get_by_id(COUNTER_KEY) is None
+    assert passenger_repository.delete(COUNTER_KEY) is False
+
+
+def test_count_initialized_for_existing_table(passenger_repository):
+    """
+    Testa a inicialização do contador para tabelas criadas antes dele.
+    """
+    for i in range(3):
+        passenger_repository.table.put_item(Item={"passenger_id": f"legacy-{i}"})
+
+    assert passenger_repository.count() == 3
+    shards = [
+        passenger_repository.table.get_item(Key={"passenger_id": key})["Item"]
+        for key in COUNTER_SHARD_KEYS
+    ]
+    assert sum(shard["item_count"] for shard in shards) == 3
+
+
+def test_save_rejects_reserved_counter_ids(passenger_repository):
+    """
+    Testa se save() e save_many() recusam IDs no prefixo do contador, que
+    ficariam ocultos nas leituras mas inflariam o total.
+    """
+    # Act / Assert
+    with pytest.raises(ValueError, match="reservado"):
+        passenger_repository.save({"passenger_id": f"{COUNTER_KEY}x"})
+
+    outcomes = passenger_repository.save_many(
+        [{"passenger_id": f"{COUNTER_KEY}y"}, {"passenger_id": "regular-1"}]
+    )
+
+    assert [o["status"] for o in outcomes] == [STATUS_ERROR, STATUS_CREATED]
+    assert "reservado" in outcomes[0]["error"]
+    assert PassengerRepository().count() == 1
+
+
+def test_first_save_on_populated_table_initializes_counter(passenger_repository):
+    """
+    Testa se a primeira escrita em uma tabela com dados anteriores ao contador
+    o inicializa com a contagem completa, em vez de começar do zero.
+    """
+    # Arrange
+    for i in range(50):
+        passenger_repository.table.put_item(Item={"passenger_id": f"seed-{i}"})
+
+    # Act
+    passenger_repository.save({"passenger_id": "novo"})
+    passenger_repository.delete("seed-0")
+    page = PassengerRepository().get_all(page=1, limit=10)
+
+    # Assert
+    assert PassengerRepository().count() == 50
+    assert page["total_count"] == 50
+
+
+def test_save_retries_counter_conflict(passenger_repository):
+    """
+    Testa se um conflito de transação no contador é repetido em vez de virar erro.
+    """
+    # Arrange
+    client = passenger_repository.dynamodb.meta.client
+    original = client.transact_write_items
+    conflict = client.exceptions.TransactionCanceledException(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "conflict"},
+            "CancellationReasons": [{"Code": "None"}, {"Code": "TransactionConflict"}],
+        },
+        "TransactWriteItems",
+    )
+    passenger_repository.count()  # inicializa o contador
+    calls = []
+
+    def flaky(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= 2:
+            raise conflict
+        return original(**kwargs)
+
+    # Act
+    with patch.object(client, "transact_write_items", side_effect=flaky), patch(
+        "src.repository.passenger_repository.time.sleep"
+    ) as mock_sleep:
+        passenger_repository.save({"passenger_id": "concorrente"})
+
+    # Assert
+    assert len(calls) == 3
+    assert mock_sleep.call_count == 2
+    assert PassengerRepository().count() == 1
+
+
+def test_save_many_outcomes(passenger_repository):
+    """
+    Testa a inclusão em lote: resultados por item, duplicados e contador.
+    """
+    # Arrange
+    passenger_repository.save({"passenger_id": "bulk-0"})
+    items = [{"passenger_id": f"bulk-{i}"} for i in range(7)]
+    items.append({"passenger_id": "bulk-3"})
+
+    # Act
+    outcomes = passenger_repository.save_many(items, chunk_size=3)
+
+    # Assert
+    statuses = [o["status"] for o in outcomes]
+    assert statuses == [STATUS_EXISTS] + [STATUS_CREATED] * 6 + [STATUS_EXISTS]
+    assert [o["passenger_id"] for o in outcomes] == [i["passenger_id"] for i in items]
+    assert PassengerRepository().count() == 7
+    assert passenger_repository.get_by_id("bulk-6") is not None
+
+
+def test_save_many_retries_transient_cancellation(passenger_repository):
+    """
+    Testa se cancelamentos transitórios são repetidos com backoff.
+    """
+    # Arrange
+    client = passenger_repository.dynamodb.meta.client
+    original = client.transact_write_items
+    conflict = ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "conflict"},
+            "CancellationReasons": [
+                {"Code": "None"},
+                {"Code": "TransactionConflict"},
+                {"Code": "None"},
+            ],
+        },
+        "TransactWriteItems",
+    )
+    passenger_repository.count()  # inicializa o contador
+    calls = []
+
+    def flaky(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise conflict
+        return original(**kwargs)
+
+    # Act
+    with patch.object(client, "transact_write_items", side_effect=flaky), patch(
+        "src.repository.passenger_repository.time.sleep"
+    ) as mock_sleep:
+        outcomes = passenger_repository.save_many(
+            [{"passenger_id": "retry-0"}, {"passenger_id": "retry-1"}]
+        )
+
+    # Assert
+    assert [o["status"] for o in outcomes] == [STATUS_CREATED, STATUS_CREATED]
+    assert len(calls) == 2
+    mock_sleep.assert_called_once()
+    assert passenger_repository.count() == 2
+
+
+def test_save_many_retries_counter_conflict(passenger_repository):
+    """
+    Testa se um conflito na atualização do contador (último motivo de
+    cancelamento) é repetido, em vez de marcar o lote inteiro como erro.
+    """
+    # Arrange
+    client = passenger_repository.dynamodb.meta.client
+    original = client.transact_write_items
+    conflict = ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "conflict"},
+            "CancellationReasons": [
+                {"Code": "None"},
+                {"Code": "None"},
+                {"Code": "TransactionConflict"},
+            ],
+        },
+        "TransactWriteItems",
+    )
+    passenger_repository.count()  # inicializa o contador
+    calls = []
+
+    def flaky(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise conflict
+        return original(**kwargs)
+
+    # Act
+    with patch.object(client, "transact_write_items", side_effect=flaky), patch(
+        "src.repository.passenger_repository.time.sleep"
+    ):
+        outcomes = passenger_repository.save_many(
+            [{"passenger_id": "counter-0"}, {"passenger_id": "counter-1"}]
+        )
+
+    # Assert
+    assert [o["status"] for o in outcomes] == [STATUS_CREATED, STATUS_CREATED]
+    assert len(calls) == 2
+    assert PassengerRepository().count() == 2
+
+
+def test_save_many_gives_up_after_max_attempts(passenger_repository):
+    """
+    Testa se itens não gravados após as tentativas são marcados como erro.
+    """
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+        "TransactWriteItems",
+    )
+    client = passenger_repository.dynamodb.meta.client
+
+    with patch.object(
+        client, "transact_write_items", side_effect=throttled
+    ) as mock_write, patch("src.repository.passenger_repository.time.sleep"):
+        outcomes = passenger_repository.save_many(
+            [{"passenger_id": "throttled"}], max_attempts=3
+        )
+
+    assert outcomes[0]["status"] == STATUS_ERROR
+    assert mock_write.call_count == 3
+
+
+@pytest.mark.parametrize("total_segments", [1, 3, 8])
+def test_scan_all_returns_every_passenger(passenger_repository, total_segments):
+    """
+    Testa se o scan paralelo retorna todos os passageiros, sem o contador.
+    """
+    for i in range(25):
+        passenger_repository.save({"passenger_id": f"scan-{i}", "age": i})
+
+    items = list(
+        passenger_repository.scan_all(total_segments=total_segments, page_size=4)
+    )
+
+    ids = sorted(item["passenger_id"] for item in items)
+    assert ids == sorted(f"scan-{i}" for i in range(25))
+
+
+def test_scan_all_projection(passenger_repository):
+    """
+    Testa se apenas os atributos da projeção são retornados.
+    """
+    passenger_repository.save({"passenger_id": "proj-1", "age": 30, "name": "Ana"})
+
+    items = list(passenger_repository.scan_all(projection=["passenger_id", "name"]))
+
+    assert items == [{"passenger_id": "proj-1", "name": "Ana"}]
+
+
+def test_scan_all_can_stop_early(passenger_repository):
+    """
+    Testa se o gerador pode ser encerrado antes do fim da tabela.
+    """
+    for i in range(30):
+        passenger_repository.save({"passenger_id": f"early-{i}"})
+
+    scan = passenger_repository.scan_all(
+        total_segments=4, page_size=2, max_buffered_pages=1
+    )
+    first = [next(scan) for _ in range(3)]
+    scan.close()
+
+    assert len(first) == 3
+
+
+def test_scan_all_propagates_errors(passenger_repository):
+    """
+    Testa se um erro em um segmento é propagado ao consumidor.
+    """
+    client = passenger_repository.dynamodb.meta.client
+    with patch.object(client, "scan", side_effect=RuntimeError("falha")):
+        with pytest.raises(RuntimeError, match="falha"):
+            list(passenger_repository.scan_all(total_segments=2))
+
+
+def test_scan_all_invalid_segments(passenger_repository):
+    """
+    Testa a validação do número de segmentos.
+    """
+    with pytest.raises(ValueError, match="total_segments"):
+        list(passenger_repository.scan_all(total_segments=0))
+
+
+def test_get_by_id_uses_read_through_cache(passenger_repository):
+    """
+    Testa se leituras repetidas do mesmo ID são servidas pelo cache.
+    """
+    # Arrange
+    passenger_repository.save({"passenger_id": "cached-1", "age": 30})
+    table = passenger_repository.table
+
+    # Act
+    with patch.object(table, "get_item", wraps=table.get_item) as mock_get:
+        first = passenger_repository.get_by_id("cached-1")
+        second = passenger_repository.get_by_id("cached-1")
+
+    # Assert
+    assert first == second
+    assert mock_get.call_count == 1
+    stats = passenger_repository.item_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_get_by_id_caches_negative_lookups(passenger_repository):
+    """
+    Testa se buscas sem resultado ficam em cache e são invalidadas por save.
+    """
+    table = passenger_repository.table
+
+    with patch.object(table, "get_item", wraps=table.get_item) as mock_get:
+        assert passenger_repository.get_by_id("late") is None
+        assert passenger_repository.get_by_id("late") is None
+        assert mock_get.call_count == 1
+
+        passenger_repository.save({"passenger_id": "late"})
+        assert passenger_repository.get_by_id("late")["passenger_id"] == "late"
+        assert mock_get.call_count == 2
+
+
+def test_negative_cache_expires(dynamodb_table):
+    """
+    Testa se buscas sem resultado expiram após negative_cache_ttl.
+    """
+    repository = PassengerRepository(negative_cache_ttl=0)
+    repository.get_by_id("ghost")
+
+    repository.table.put_item(Item={"passenger_id": "ghost"})
+
+    assert repository.get_by_id("ghost") is not None
+
+
+def test_delete_invalidates_cache(passenger_repository):
+    """
+    Testa se a exclusão remove o passageiro do cache de leitura.
+    """
+    passenger_repository.save({"passenger_id": "to-delete"})
+    assert passenger_repository.get_by_id("to-delete") is not None
+
+    assert passenger_repository.delete("to-delete") is True
+
+    assert passenger_repository.get_by_id("to-delete") is None
+
+
+def test_item_cache_disabled_and_capped(dynamodb_table):
+    """
+    Testa a desativação do cache (tamanho 0) e o teto de segurança de memória.
+    """
+    assert PassengerRepository(item_cache_size=0).item_cache is None
+    capped = PassengerRepository(item_cache_size=MAX_ITEM_CACHE_SIZE * 10)
+    assert capped.item_cache.max_size == MAX_ITEM_CACHE_SIZE
+
+
+def test_ping_reads_sentinel_key(passenger_repository):
+    """Testa se o ping do health check faz só um GetItem na chave sentinela."""
+    with patch.object(
+        passenger_repository.table,
+        "get_item",
+        wraps=passenger_repository.table.get_item,
+    ) as get_item:
+        passenger_repository.ping()
+
+    get_item.assert_called_once_with(
+        Key={"passenger_id": COUNTER_SHARD_KEYS[0]},
+        ProjectionExpression="passenger_id",
+    )
+
+
+def test_describe_table(passenger_repository):
+    """Testa o status da tabela via DescribeTable."""
+    result = passenger_repository.describe_table()
+
+    assert result == {"table_status": "ACTIVE", "item_count": 0}
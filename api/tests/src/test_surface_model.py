@@ -0,0 +1,176 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.services.predict_service import PredictionService
+from src.services.surface_model import (
+    SurfaceModel,
+    build_surface,
+    sample_features,
+    save_surface,
+    surface_axes,
+    surface_error,
+)
+
+# A superfície é avaliada com matrizes sem nomes, na ordem de feature_names_in_
+pytestmark = pytest.mark.filterwarnings("ignore:X does not have valid feature names")
+
+
+@pytest.fixture(scope="module")
+def sklearn_model():
+    """Modelo de produção carregado via joblib."""
+    return joblib.load(os.path.join("modelos", "model.joblib"))
+
+
+@pytest.fixture(scope="module")
+def feature_names(sklearn_model):
+    """Ordem das colunas usada no treino do modelo de produção."""
+    return [str(name) for name in sklearn_model.feature_names_in_]
+
+
+@pytest.fixture(scope="module")
+def surface_dir(sklearn_model, feature_names, tmp_path_factory):
+    """Superfície reduzida (poucos nós) gravada em uma pasta de modelos temporária."""
+    directory = tmp_path_factory.mktemp("modelos")
+    axes = surface_axes(sklearn_model, feature_names, age_nodes=25, fare_nodes=25)
+    surface = build_surface(sklearn_model, axes)
+    save_surface(surface, axes, str(directory / "model"), {"max_error": 0.0})
+    return directory
+
+
+@pytest.fixture(scope="module")
+def surface_model(surface_dir):
+    return SurfaceModel.load(str(surface_dir / "model.surface.npy"))
+
+
+def test_surface_axes_stop_at_the_last_split(sklearn_model, feature_names):
+    """
+    Testa se os eixos param logo após o último limiar de cada feature nas
+    árvores (a partir dali a floresta é constante).
+    """
+    axes = surface_axes(sklearn_model, feature_names, age_nodes=10, fare_nodes=10)
+
+    thresholds = {name: [] for name in feature_names}
+    for tree in (e.tree_ for e in sklearn_model.estimators_):
+        for feature, threshold in zip(tree.feature, tree.threshold):
+            if feature >= 0:
+                thresholds[feature_names[feature]].append(threshold)
+
+    assert axes["sibsp_max"] > max(thresholds["SibSp"])
+    assert axes["parch_max"] > max(thresholds["Parch"])
+    assert axes["age_nodes"][-1] > max(thresholds["Age"])
+    assert axes["fare_nodes"][-1] > max(thresholds["Fare"])
+    assert len(axes["age_nodes"]) == 10 and len(axes["fare_nodes"]) == 10
+
+
+def test_surface_is_loaded_with_mmap(surface_model):
+    """Testa se a grade é lida via mmap, sem copiar o arquivo para a memória."""
+    assert isinstance(surface_model._surface, np.memmap)
+    assert surface_model.nbytes == surface_model._surface.nbytes
+
+
+def test_surface_matches_model_at_grid_nodes(surface_model, sklearn_model, feature_names):
+    """Testa se, nos nós da grade, a superfície reproduz o modelo (float16)."""
+    # Arrange
+    rng = np.random.default_rng(3)
+    n = 2000
+    columns = {
+        "Pclass": rng.integers(1, 4, n),
+        "Sex_male": rng.integers(0, 2, n),
+        "Embarked_Q": np.zeros(n),
+        "Embarked_S": np.ones(n),
+        "SibSp": rng.integers(0, 4, n),
+        "Parch": rng.integers(0, 3, n),
+        "Age": rng.choice(surface_model._age_nodes, n),
+        "Fare": rng.choice(surface_model._fare_nodes, n),
+    }
+    X = np.column_stack([columns[name] for name in feature_names]).astype(float)
+
+    # Act / Assert
+    np.testing.assert_allclose(
+        surface_model.predict_proba(X)[:, 1],
+        sklearn_model.predict_proba(X)[:, 1],
+        atol=1e-3,
+    )
+
+
+def test_surface_error_is_bounded(surface_model, sklearn_model, feature_names):
+    """Testa o erro da interpolação em uma amostra do espaço de entrada da API."""
+    X = sample_features(feature_names, n=20_000, seed=5)
+
+    report = surface_error(surface_model, sklearn_model, X)
+
+    assert report["max_error"] < 0.15
+    assert report["mean_error"] < 0.01
+    assert report["flip_rate"] < 0.01
+
+
+def test_surface_clamps_values_beyond_the_grid(surface_model, sklearn_model, feature_names):
+    """
+    Testa se SibSp, Parch, Age e Fare além dos eixos usam a borda da grade,
+    como a floresta (constante após o último limiar).
+    """
+    # Arrange
+    row = {
+        "Pclass": 2, "Sex_male": 1, "Embarked_Q": 1, "Embarked_S": 0,
+        "SibSp": 40, "Parch": 30, "Age": 120.0, "Fare": 5000.0,
+    }
+    X = np.array([[row[name] for name in feature_names]], dtype=float)
+
+    # Act
+    probability = surface_model.predict_proba(X)
+
+    # Assert
+    assert probability.shape == (1, 2)
+    np.testing.assert_allclose(probability.sum(axis=1), 1.0)
+    np.testing.assert_allclose(
+        probability[0, 1], sklearn_model.predict_proba(X)[0, 1], atol=1e-3
+    )
+
+
+def test_surface_rejects_wrong_feature_count(surface_model):
+    """Testa erro quando a matriz não tem o número de features esperado."""
+    with pytest.raises(ValueError, match="features"):
+        surface_model.predict_proba(np.zeros((2, 5)))
+
+
+def test_prediction_service_surface_method(surface_dir, sklearn_model):
+    """
+    Testa se o PredictionService carrega a superfície no modo 'surface' e
+    aproxima a predição do modelo exato.
+    """
+    # Arrange
+    passenger = {
+        "Pclass": 1,
+        "Sex": "female",
+        "Age": 38.0,
+        "SibSp": 1,
+        "Parch": 0,
+        "Fare": 71.2833,
+        "Embarked": "C",
+    }
+    exact = PredictionService(model_name="model", method="joblib")
+
+    # Act
+    with patch(
+        "src.services.predict_service.get_models_dir", return_value=str(surface_dir)
+    ):
+        service = PredictionService(model_name="model", method="surface")
+    probability = service.predict(passenger)
+
+    # Assert
+    assert isinstance(service.model, SurfaceModel)
+    assert service._feature_order == list(sklearn_model.feature_names_in_)
+    assert probability == pytest.approx(exact.predict(passenger), abs=0.15)
+
+
+def test_prediction_service_surface_file_not_found(tmp_path):
+    """Testa erro quando a superfície ainda não foi gerada."""
+    with patch(
+        "src.services.predict_service.get_models_dir", return_value=str(tmp_path)
+    ):
+        with pytest.raises(FileNotFoundError, match="model.surface.npy"):
+            PredictionService(model_name="model", method="surface")
@@ -0,0 +1,118 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.metrics import timing
+from src.metrics.timing import (
+    add_count,
+    current_metrics,
+    instrumented,
+    set_property,
+    stage,
+    timed,
+)
+
+
+def _emf_lines(output: str):
+    return [json.loads(line) for line in output.splitlines() if '"_aws"' in line]
+
+
+@pytest.fixture(autouse=True)
+def warm_container():
+    """Isola o estado de cold start entre os testes."""
+    with patch.object(timing, "_cold_start", False):
+        yield
+
+
+def test_stage_outside_invocation_is_noop():
+    """
+    Testa se stage/add_count não falham fora de uma invocação instrumentada.
+    """
+    with stage("anything"):
+        add_count("items", 3)
+
+    assert current_metrics() is None
+
+
+def test_instrumented_emits_single_emf_line(capsys):
+    """
+    Testa se cada invocação emite uma linha EMF com etapas, contagens e status.
+    """
+
+    # Arrange
+    @timed("work")
+    def work():
+        return 42
+
+    @instrumented
+    def handler(event, context):
+        with stage("parse_body"):
+            pass
+        work()
+        work()
+        add_count("items", 2)
+        set_property("request_id", "req-1")
+        return {"statusCode": 201}
+
+    # Act
+    response = handler({"httpMethod": "POST", "resource": "/sobreviventes"}, None)
+
+    # Assert
+    assert response == {"statusCode": 201}
+    lines = _emf_lines(capsys.readouterr().out)
+    assert len(lines) == 1
+    emf = lines[0]
+    assert emf["route"] == "POST /sobreviventes"
+    assert emf["cold_start"] == "false"
+    assert emf["status_code"] == 201
+    assert emf["request_id"] == "req-1"
+    assert emf["items"] == 2
+    for name in ("parse_body_ms", "work_ms", "total_ms"):
+        assert emf[name] >= 0
+    directive = emf["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Dimensions"] == [["route", "cold_start"]]
+    names = {m["Name"] for m in directive["Metrics"]}
+    assert {"parse_body_ms", "work_ms", "total_ms", "items"} <= names
+    assert current_metrics() is None
+
+
+def test_cold_start_flag_only_on_first_invocation(capsys):
+    """
+    Testa se apenas a primeira invocação do container é marcada como cold start.
+    """
+    handler = instrumented(lambda event, context: {"statusCode": 200})
+
+    with patch.object(timing, "_cold_start", True):
+        handler({"httpMethod": "GET", "path": "/health"}, None)
+        handler({"httpMethod": "GET", "path": "/health"}, None)
+
+    flags = [line["cold_start"] for line in _emf_lines(capsys.readouterr().out)]
+    assert flags == ["true", "false"]
+
+
+def test_metrics_emitted_when_handler_raises(capsys):
+    """
+    Testa se a linha EMF é emitida mesmo quando o handler levanta exceção.
+    """
+
+    @instrumented
+    def handler(event, context):
+        raise RuntimeError("falha")
+
+    with pytest.raises(RuntimeError):
+        handler({}, None)
+
+    assert len(_emf_lines(capsys.readouterr().out)) == 1
+
+
+@patch.dict("os.environ", {"METRICS_ENABLED": "false"})
+def test_metrics_can_be_disabled(capsys):
+    """
+    Testa se METRICS_ENABLED=false desativa a emissão.
+    """
+    handler = instrumented(lambda event, context: {"statusCode": 200})
+
+    handler({"httpMethod": "GET", "path": "/health"}, None)
+
+    assert _emf_lines(capsys.readouterr().out) == []
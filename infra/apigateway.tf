@@ -6,6 +6,10 @@ resource "aws_api_gateway_rest_api" "api" {
   name        = local.project_name
   description = "API para demonstrar autorização com API Key"
   tags        = local.tags
+
+  # Respostas comprimidas (gzip/br) chegam da Lambda em base64 (isBase64Encoded);
+  # o API Gateway as decodifica e repassa os bytes binários ao cliente
+  binary_media_types = ["*/*"]
 }
 
 # ===================================================================
@@ -15,6 +15,7 @@ resource "aws_lambda_function" "prediction" {
     variables = {
       DYNAMODB_TABLE_NAME = aws_dynamodb_table.passengers.name
       LOG_LEVEL          = "INFO"
+      MODEL_METHOD       = "compiled"
     }
   }
 
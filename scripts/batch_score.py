@@ -0,0 +1,71 @@
+"""
+Pontua um CSV de passageiros (formato Kaggle train.csv/test.csv) fora da API.
+
+Uso:
+    python scripts/batch_score.py entrada.csv saida.csv [--model model] \
+        [--method joblib|pickle|compiled|surface] [--chunk-size 10000] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import warnings
+from time import perf_counter
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+API_DIR = os.path.join(PROJECT_ROOT, "api")
+
+sys.path.insert(0, API_DIR)
+
+# Só avisos e erros: o log por bloco da API não interessa no modo offline
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from src.services.batch_scoring import DEFAULT_CHUNK_SIZE, score_csv  # noqa: E402
+from src.services.predict_service import PredictionService  # noqa: E402
+
+# As colunas já chegam na ordem de feature_names_in_ (ver PredictionService),
+# só sem os nomes; o aviso se repetiria a cada bloco e em cada worker
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", help="CSV de entrada")
+    parser.add_argument("output", help="CSV de saída (PassengerId,Survived,survival_probability)")
+    parser.add_argument("--model", default="model", help="Nome do modelo em api/modelos")
+    parser.add_argument("--method", default="joblib", choices=["joblib", "pickle", "compiled", "surface"])
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    input_path = os.path.abspath(args.input)
+    output_path = os.path.abspath(args.output)
+
+    # O PredictionService procura os modelos em 'modelos/' relativo à pasta da API
+    os.chdir(API_DIR)
+    print(f">>> Carregando modelo '{args.model}' ({args.method})...", flush=True)
+    service = PredictionService(args.model, method=args.method)
+
+    start = perf_counter()
+    with open(input_path, newline="", encoding="utf-8") as input_file, open(
+        output_path, "w", newline="", encoding="utf-8"
+    ) as output_file:
+        total = score_csv(
+            input_file,
+            output_file,
+            service,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+    elapsed = perf_counter() - start
+
+    print(
+        f"\n[SUCCESS] {total} linhas pontuadas em {elapsed:.2f} s "
+        f"({total / elapsed:,.0f} linhas/s) -> '{output_path}'",
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
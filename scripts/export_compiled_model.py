@@ -0,0 +1,59 @@
+import os
+import sys
+
+import joblib
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+API_DIR = os.path.join(PROJECT_ROOT, "api")
+MODEL_SOURCE_DIR = os.path.join(API_DIR, "modelos")
+
+sys.path.insert(0, API_DIR)
+
+from src.services.compiled_model import CompiledModel, export_model  # noqa: E402
+
+
+def export_compiled_model(model_name="model", tolerance=1e-9):
+    """
+    Exporta 'modelos/<model_name>.joblib' para 'modelos/<model_name>.npz'
+    e confere se as probabilidades batem com o predict_proba original.
+    """
+    import numpy as np
+
+    source = os.path.join(MODEL_SOURCE_DIR, f"{model_name}.joblib")
+    target = os.path.join(MODEL_SOURCE_DIR, f"{model_name}.npz")
+
+    print(f">>> Carregando '{source}'...", flush=True)
+    estimator = joblib.load(source)
+
+    print(f">>> Exportando para '{target}'...", flush=True)
+    export_model(estimator, target)
+
+    compiled = CompiledModel.load(target)
+
+    # Amostra do espaço de features do Titanic (ordem de PredictionService._preprocess)
+    rng = np.random.default_rng(42)
+    n = 10_000
+    X = np.column_stack([
+        rng.integers(1, 4, n),
+        rng.uniform(0, 120, n),
+        rng.integers(0, 9, n),
+        rng.integers(0, 7, n),
+        rng.uniform(0, 520, n),
+        rng.integers(0, 2, n),
+        rng.integers(0, 2, n),
+        rng.integers(0, 2, n),
+    ]).astype(float)
+
+    max_error = float(np.abs(compiled.predict_proba(X) - estimator.predict_proba(X)).max())
+    print(f">>> Erro máximo contra predict_proba: {max_error:.3e}", flush=True)
+    if max_error > tolerance:
+        print(f"--- ERRO: erro acima da tolerância ({tolerance}) ---", flush=True)
+        sys.exit(1)
+
+    size_kb = os.path.getsize(target) / 1024
+    print(f"\n[SUCCESS] Modelo compilado gerado ({size_kb:.1f} KB).", flush=True)
+
+
+if __name__ == "__main__":
+    export_compiled_model(*sys.argv[1:2])
@@ -0,0 +1,93 @@
+import argparse
+import os
+import sys
+from time import perf_counter
+
+import joblib
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+API_DIR = os.path.join(PROJECT_ROOT, "api")
+MODEL_SOURCE_DIR = os.path.join(API_DIR, "modelos")
+
+sys.path.insert(0, API_DIR)
+
+from src.services.surface_model import (  # noqa: E402
+    DEFAULT_AGE_NODES,
+    DEFAULT_FARE_NODES,
+    SurfaceModel,
+    build_surface,
+    sample_features,
+    save_surface,
+    surface_axes,
+    surface_error,
+)
+
+
+def export_surface_model(
+    model_name="model",
+    tolerance=0.08,
+    age_nodes=DEFAULT_AGE_NODES,
+    fare_nodes=DEFAULT_FARE_NODES,
+    samples=100_000,
+):
+    """
+    Pré-calcula a superfície de probabilidades de 'modelos/<model_name>.joblib'
+    em 'modelos/<model_name>.surface.npy' (+ '.surface.json') e mede o erro
+    contra o predict_proba exato. Falha se o erro máximo passar da tolerância.
+    """
+    source = os.path.join(MODEL_SOURCE_DIR, f"{model_name}.joblib")
+    prefix = os.path.join(MODEL_SOURCE_DIR, model_name)
+
+    print(f">>> Carregando '{source}'...", flush=True)
+    estimator = joblib.load(source)
+    feature_names = [str(name) for name in estimator.feature_names_in_]
+
+    axes = surface_axes(estimator, feature_names, age_nodes, fare_nodes)
+    print(
+        f">>> Calculando a superfície: SibSp 0-{axes['sibsp_max']}, "
+        f"Parch 0-{axes['parch_max']}, {age_nodes} nós em Age "
+        f"(0-{axes['age_nodes'][-1]:g}) e {fare_nodes} em Fare "
+        f"(0-{axes['fare_nodes'][-1]:g})...",
+        flush=True,
+    )
+    start = perf_counter()
+    surface = build_surface(estimator, axes)
+    print(f">>> Grade {surface.shape} calculada em {perf_counter() - start:.1f} s", flush=True)
+
+    # O erro é medido com a superfície já quantizada, como será servida
+    model = SurfaceModel(surface, axes)
+    report = surface_error(model, estimator, sample_features(feature_names, samples))
+    report.update({"tolerance": tolerance, "samples": samples})
+    print(
+        f">>> Erro contra predict_proba ({samples} amostras): "
+        f"máximo {report['max_error']:.4f}, p99 {report['p99_error']:.4f}, "
+        f"médio {report['mean_error']:.4f}; classe alterada em "
+        f"{report['flip_rate']:.2%}",
+        flush=True,
+    )
+    if report["max_error"] > tolerance:
+        print(f"--- ERRO: erro acima da tolerância ({tolerance}) ---", flush=True)
+        sys.exit(1)
+
+    surface_path, _ = save_surface(surface, axes, prefix, report)
+    size_mb = os.path.getsize(surface_path) / 1024 / 1024
+    print(f"\n[SUCCESS] Superfície gerada em '{surface_path}' ({size_mb:.1f} MB).", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=export_surface_model.__doc__)
+    parser.add_argument("model", nargs="?", default="model", help="Nome do modelo em api/modelos")
+    parser.add_argument("--tolerance", type=float, default=0.08, help="erro absoluto máximo")
+    parser.add_argument("--age-nodes", type=int, default=DEFAULT_AGE_NODES)
+    parser.add_argument("--fare-nodes", type=int, default=DEFAULT_FARE_NODES)
+    parser.add_argument("--samples", type=int, default=100_000)
+    args = parser.parse_args()
+
+    export_surface_model(
+        args.model, args.tolerance, args.age_nodes, args.fare_nodes, args.samples
+    )
+
+
+if __name__ == "__main__":
+    main()